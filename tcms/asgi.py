@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+"""
+ASGI config for Kiwi TCMS project.
+
+It exposes the ASGI callable as a module-level variable named ``application``
+which can be served by any ASGI server. When deployed this way the
+``/async/json-rpc/`` and ``/async/xml-rpc/`` end-points execute RPC methods,
+which are coroutines, without blocking the server while they wait on
+external issue trackers.
+
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tcms.settings.product")
+
+application = get_asgi_application()
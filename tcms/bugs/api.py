@@ -80,16 +80,26 @@ def remove(query):
     name="Bug.filter",
     auth=permissions_required("bugs.view_bug"),
 )
-def filter(query):  # pylint: disable=redefined-builtin
+def filter(query, limit=None, after_id=None):  # pylint: disable=redefined-builtin
     """
-    .. function:: RPC Bug.filter(query)
+    .. function:: RPC Bug.filter(query, limit, after_id)
 
         Get list of bugs.
 
         :param query: Field lookups for :class:`tcms.bugs.models.Bug`
         :type query: dict
-        :return: List of serialized :class:`tcms.bugs.models.Bug` objects.
-        :rtype: list
+        :param limit: If specified return at most this many objects and a cursor
+                      for the next page, see :func:`tcms.rpc.utils.paginate`
+        :type limit: int
+        :param after_id: Only return objects with PK greater than this value
+        :type after_id: int
+        :return: List of serialized :class:`tcms.bugs.models.Bug` objects
+                 or a dictionary with ``results`` and ``next_cursor`` when
+                 ``limit`` is specified
+        :rtype: list(dict) or dict
+
+    .. versionchanged:: 16.3
+        Added the ``limit`` and ``after_id`` parameters
     """
     result = (
         Bug.objects.filter(**query)
@@ -108,7 +118,7 @@ def filter(query):  # pylint: disable=redefined-builtin
         )
         .distinct()
     )
-    return list(result)
+    return utils.paginate(result, limit, after_id, key="pk")
 
 
 @rpc_method(
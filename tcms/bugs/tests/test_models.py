@@ -38,7 +38,7 @@ class TestSendMailOnNewComment(BaseCaseRun):
         cls.assignee = UserFactory()
         cls.url = reverse("bugs-comment")
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_email_sent_when_bug_closed(self, send_mail):
         bug = BugFactory(assignee=self.assignee, reporter=self.tester)
         self.client.post(
@@ -68,7 +68,7 @@ class TestSendMailOnNewComment(BaseCaseRun):
         self.assertIn(expected_recipients[0], send_mail.call_args.args[3])
         self.assertIn(expected_recipients[1], send_mail.call_args.args[3])
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_email_sent_when_bug_reopened(self, send_mail):
         bug = BugFactory(assignee=self.assignee, reporter=self.tester)
         bug.status = False
@@ -100,7 +100,7 @@ class TestSendMailOnNewComment(BaseCaseRun):
         self.assertIn(expected_recipients[0], send_mail.call_args.args[3])
         self.assertIn(expected_recipients[1], send_mail.call_args.args[3])
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_email_sent_to_all_commenters(self, send_mail):
         bug = BugFactory(assignee=self.assignee, reporter=self.tester)
         commenter = UserFactory()
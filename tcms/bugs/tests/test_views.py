@@ -112,7 +112,7 @@ class TestNewBug(LoggedInTestCase):
         self.assertEqual(form.fields["version"].queryset.count(), 0)
         self.assertEqual(form.fields["build"].queryset.count(), 0)
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_create_new_bug(self, send_mail):
         initial_bug_count = Bug.objects.count()
 
@@ -129,7 +129,7 @@ class TestNewBug(LoggedInTestCase):
         self.assertEqual(bug_created.summary, self.summary)
         self.assertTrue(send_mail.called)
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_new_bug_assignee_inferred_from_components(self, send_mail):
         comp = ComponentFactory(initial_owner=UserFactory(), product=self.product)
 
@@ -155,7 +155,6 @@ class TestNewBug(LoggedInTestCase):
             expected_body,
             settings.DEFAULT_FROM_EMAIL,
             expected_recipients,
-            fail_silently=False,
         )
 
 
@@ -0,0 +1,16 @@
+# pylint: disable=import-outside-toplevel
+from django.apps import AppConfig as DjangoAppConfig
+
+
+class AppConfig(DjangoAppConfig):
+    name = "tcms.core"
+
+    def ready(self):
+        from django.contrib.sites.models import Site
+        from django.db.models.signals import post_delete, post_migrate, post_save
+
+        from tcms import signals
+
+        post_migrate.connect(signals.handle_migrations_applied)
+        post_save.connect(signals.handle_sites_changed, sender=Site)
+        post_delete.connect(signals.handle_sites_changed, sender=Site)
@@ -0,0 +1,61 @@
+"""
+Health checks which are too expensive to perform on every request.
+Their results are cached in each process and refreshed periodically,
+see ``settings.HEALTH_CHECK_INTERVAL``.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.migrations.executor import MigrationExecutor
+
+from tcms.core.utils import db_schema
+
+# (checked_at, unapplied_migrations) keyed by the database schema of the current tenant
+_state = {}
+_lock = threading.Lock()
+
+
+def unapplied_migrations():
+    """
+    Returns the number of migrations which haven't been applied to the
+    default database or ``None`` if the database isn't available!
+
+    Building the migration plan loads all migration files from disk, which
+    is why the result is cached!
+    """
+    with _lock:
+        checked_at, result = _state.get(db_schema(), (None, None))
+        now = time.monotonic()
+        if checked_at is None or now - checked_at > settings.HEALTH_CHECK_INTERVAL:
+            result = _migration_plan_size()
+            _state[db_schema()] = (now, result)
+
+        return result
+
+
+def forget():
+    """
+    Perform the checks again on next access, e.g. after ``migrate``!
+    """
+    with _lock:
+        _state.clear()
+
+
+def database_is_available():
+    try:
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return True
+    except DatabaseError:
+        return False
+
+
+def _migration_plan_size():
+    try:
+        executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
+        return len(executor.migration_plan(executor.loader.graph.leaf_nodes()))
+    except DatabaseError:
+        return None
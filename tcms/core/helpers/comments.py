@@ -6,11 +6,12 @@ of objects.
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.contrib.sites.models import Site
 from django.db.models.signals import post_save
 from django.utils import timezone
 from django_comments.models import Comment
 
+from tcms.core.utils.sites import current_site
+
 
 def add_comment(objs, comment_text, user, submit_date=None):
     """
@@ -37,7 +38,7 @@ def add_comment(objs, comment_text, user, submit_date=None):
         comment_text = 'stupid comments by Homer'
         add_comment([testrun,], comment_text, testuser)
     """
-    site = Site.objects.get(pk=settings.SITE_ID)
+    site = current_site()
     created = []
     for obj in objs:
         content_type = ContentType.objects.get_for_model(model=obj.__class__)
@@ -1,12 +1,14 @@
 # pylint: disable=unused-argument, no-self-use, avoid-list-comprehension
 import difflib
 
+from django.apps import apps
 from django.db.models import signals
 from django.http import HttpResponseRedirect
 from django.template.defaultfilters import safe
 from django.utils.translation import gettext_lazy as _
 from simple_history.admin import SimpleHistoryAdmin
 from simple_history.models import HistoricalRecords
+from simple_history.signals import post_create_historical_record
 
 from tcms.core.templatetags.extra_filters import bleach_input
 
@@ -80,8 +82,22 @@ class KiwiHistoricalRecords(HistoricalRecords):
     This class will keep track of what fields were changed
     inside of the ``history_change_reason`` field. This gives us
     a crude changelog until upstream introduces their new interface.
+
+    When ``latest_model`` is specified, in the form ``app_label.ModelName``,
+    it is used to keep a pointer to the latest historical record for each
+    object. This model's primary key must be the same as the tracked object's
+    and it must have a ``history`` foreign key to the historical model!
+
+    When ``lock_previous`` is ``True`` the previous version is loaded with
+    ``SELECT ... FOR UPDATE`` so that concurrent saves can't see the same
+    previous version. The tracked model must be saved inside a transaction!
     """
 
+    def __init__(self, *args, latest_model=None, lock_previous=False, **kwargs):
+        self.latest_model = latest_model
+        self.lock_previous = lock_previous
+        super().__init__(*args, **kwargs)
+
     def pre_save(self, instance, **kwargs):
         """
         Signal handlers don't have access to the previous version of
@@ -91,9 +107,10 @@ class KiwiHistoricalRecords(HistoricalRecords):
             return
 
         if instance.pk and hasattr(instance, "history"):
-            instance.previous = instance.__class__.objects.filter(
-                pk=instance.pk
-            ).first()
+            previous = instance.__class__.objects.filter(pk=instance.pk)
+            if self.lock_previous:
+                previous = previous.select_for_update()
+            instance.previous = previous.first()
 
     def post_save(self, instance, created, using=None, **kwargs):
         """
@@ -113,12 +130,36 @@ class KiwiHistoricalRecords(HistoricalRecords):
             )
         super().post_save(instance, created, using, **kwargs)
 
+    def update_latest(self, instance, history_instance, using=None, **kwargs):
+        """
+        Point ``latest_model`` to the historical record which was just created.
+        """
+        # the pointer is deleted together with the object
+        if history_instance.history_type == "-":
+            return
+
+        apps.get_model(self.latest_model).objects.using(using).update_or_create(
+            pk=instance.pk, defaults={"history_id": history_instance.pk}
+        )
+
     def finalize(self, sender, **kwargs):
         """
         Connect the pre_save signal handler after calling the inherited method.
         """
         super().finalize(sender, **kwargs)
-        signals.pre_save.connect(self.pre_save, sender=sender, weak=False)
+
+        # class_prepared is sent for every model, not only the one being tracked,
+        # connect only once otherwise every save() re-fetches the previous object
+        # from the DB as many times as there are historical models
+        if sender is self.cls:
+            signals.pre_save.connect(self.pre_save, sender=sender, weak=False)
+
+            if self.latest_model:
+                post_create_historical_record.connect(
+                    self.update_latest,
+                    sender=getattr(sender, self.manager_name).model,
+                    weak=False,
+                )
 
 
 class ReadOnlyHistoryAdmin(SimpleHistoryAdmin):
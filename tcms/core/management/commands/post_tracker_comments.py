@@ -0,0 +1,57 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from tcms.core.utils import each_schema
+from tcms.testruns.models import PendingTrackerComment
+
+
+class Command(BaseCommand):
+    help = (
+        "Post comments which link test executions to issues in external "
+        "bug trackers for all tenants. Runs until interrupted unless --once "
+        "is specified."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit after all comments which are currently due have been processed",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait before checking for new comments. Default: 5",
+        )
+
+    def handle(self, *args, **kwargs):
+        # rate limits are tracked for each BugSystem in each tenant
+        last_posted = {}
+
+        while True:
+            close_old_connections()
+            delivered = failed = postponed = 0
+            for schema_name in each_schema():
+                results = PendingTrackerComment.deliver(
+                    last_posted.setdefault(schema_name, {})
+                )
+                delivered += results[0]
+                failed += results[1]
+                postponed += results[2]
+
+            if delivered or failed:
+                self.stdout.write(
+                    f"Commented on {delivered} issue(s), {failed} failed and will be retried."
+                )
+
+            if postponed:
+                # more comments are due but trackers are rate limited
+                time.sleep(settings.TRACKER_COMMENT_INTERVAL)
+            elif kwargs["once"]:
+                return
+            else:
+                time.sleep(kwargs["interval"])
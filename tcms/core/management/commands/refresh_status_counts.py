@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from tcms.testruns.models import TestRunStatusCount
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the pre-aggregated number of executions in each "
+        "build and status for all or the specified test runs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--run",
+            type=int,
+            action="append",
+            dest="runs",
+            help="PK of TestRun to refresh. Can be specified multiple times",
+        )
+
+    def handle(self, *args, **kwargs):
+        TestRunStatusCount.refresh(kwargs["runs"])
+        self.stdout.write("Execution counters refreshed successfully.")
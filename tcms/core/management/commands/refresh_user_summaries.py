@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from tcms.testruns.models import UserSummary
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the pre-aggregated number of test plans and open "
+        "test runs shown on the dashboard for all or the specified users."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="users",
+            help="PK of User to refresh. Can be specified multiple times",
+        )
+
+    def handle(self, *args, **kwargs):
+        UserSummary.refresh(kwargs["users"])
+        self.stdout.write("User summaries refreshed successfully.")
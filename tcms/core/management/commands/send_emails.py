@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from tcms.core.models import OutgoingEmail
+from tcms.core.utils import each_schema
+
+
+class Command(BaseCommand):
+    help = (
+        "Send email notifications which are waiting in the outbox of every "
+        "tenant. "
+        "Runs until interrupted unless --once is specified."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit after all messages which are currently due have been sent",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait before checking for new messages. Default: 5",
+        )
+
+    def handle(self, *args, **kwargs):
+        while True:
+            close_old_connections()
+            sent = failed = dropped = 0
+            for _schema_name in each_schema():
+                results = OutgoingEmail.deliver()
+                sent += results[0]
+                failed += results[1]
+                dropped += results[2]
+
+            if sent or failed:
+                self.stdout.write(
+                    f"Sent {sent} message(s), {failed} failed and will be retried."
+                )
+
+            if dropped:
+                self.stdout.write(
+                    f"Dropped {dropped} message(s) which failed too many times."
+                )
+
+            # more messages may be due, e.g. when the outbox is larger than a batch
+            if sent + failed + dropped:
+                continue
+
+            if kwargs["once"]:
+                return
+
+            time.sleep(kwargs["interval"])
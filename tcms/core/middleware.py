@@ -1,19 +1,21 @@
 # pylint: disable=no-self-use, too-few-public-methods
 
 from django.conf import settings
-from django.contrib.sites.models import Site
 from django.db.utils import OperationalError, ProgrammingError
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.utils.deprecation import MiddlewareMixin
 
+from tcms.core.utils.sites import current_site
+
 
 class CheckDBStructureExistsMiddleware(MiddlewareMixin):
     def process_request(self, request):
-        if request.path == "/init-db/":
+        if request.path in ("/init-db/", "/healthz/"):
             return None
         try:
-            Site.objects.get(pk=settings.SITE_ID)
+            # cached once the database is ready
+            current_site()
         except (OperationalError, ProgrammingError):
             # Redirect to Setup view
             return HttpResponseRedirect(reverse("init-db"))
@@ -1,5 +1,150 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import json
+import logging
+from datetime import timedelta
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import models
+from django.utils import timezone
 
 get_user_model()._meta.ordering = ["username"]
+
+logger = logging.getLogger(__name__)
+
+
+class OutgoingEmail(models.Model):
+    """
+    Notification which is waiting to be sent by ``./manage.py send_emails``
+    so that requests don't block on the mail server, see :meth:`deliver`!
+    """
+
+    subject = models.TextField()
+    body = models.TextField()
+    sender = models.CharField(max_length=254)
+    recipients = models.JSONField()
+    # identical notifications which are waiting are sent only once
+    digest = models.CharField(max_length=64, db_index=True)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True)
+
+    @classmethod
+    def enqueue(cls, subject, body, sender, recipients):
+        """
+        Add a new message to the outbox unless an identical one is
+        still waiting to be sent.
+        """
+        digest = hashlib.sha256(
+            json.dumps([subject, body, sender, recipients]).encode()
+        ).hexdigest()
+
+        if cls.objects.filter(
+            digest=digest, attempts__lt=settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        ).exists():
+            return
+
+        cls.objects.create(
+            subject=subject,
+            body=body,
+            sender=sender,
+            recipients=recipients,
+            digest=digest,
+        )
+
+    @classmethod
+    def deliver(cls):
+        """
+        Send the messages which are due, at most
+        ``settings.EMAIL_OUTBOX_BATCH_SIZE`` of them, reusing a single
+        connection to the mail server. Messages which fail are retried
+        later with an exponential backoff and dropped after
+        ``settings.EMAIL_OUTBOX_MAX_ATTEMPTS``.
+
+        :return: Number of messages which were sent, failed and dropped
+        :rtype: tuple(int, int, int)
+        """
+        messages = {}
+        for email in cls.objects.filter(
+            next_attempt__lte=timezone.now(),
+            attempts__lt=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+        ).order_by("pk")[: settings.EMAIL_OUTBOX_BATCH_SIZE]:
+            messages.setdefault(email.digest, []).append(email)
+
+        if not messages:
+            return 0, 0, 0
+
+        sent = failed = dropped = 0
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            for emails in messages.values():
+                if cls._postpone(emails, err):
+                    dropped += 1
+                else:
+                    failed += 1
+            return 0, failed, dropped
+
+        try:
+            for emails in messages.values():
+                email = emails[0]
+                try:
+                    connection.send_messages(
+                        [
+                            EmailMessage(
+                                email.subject,
+                                email.body,
+                                email.sender,
+                                email.recipients,
+                                connection=connection,
+                            )
+                        ]
+                    )
+                except Exception as err:  # pylint: disable=broad-exception-caught
+                    if cls._postpone(emails, err):
+                        dropped += 1
+                    else:
+                        failed += 1
+                else:
+                    sent += 1
+                    # identical messages are removed as well
+                    cls.objects.filter(digest=email.digest).delete()
+        finally:
+            connection.close()
+
+        return sent, failed, dropped
+
+    @classmethod
+    def _postpone(cls, emails, err):
+        """
+        Schedule another attempt for identical messages which failed or
+        drop them once ``settings.EMAIL_OUTBOX_MAX_ATTEMPTS`` is reached.
+
+        :return: ``True`` if the messages were dropped
+        :rtype: bool
+        """
+        email = emails[0]
+        attempts = email.attempts + 1
+        if attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            logger.error(
+                "Dropping email '%s' to %s after %d attempts: %s",
+                email.subject,
+                ", ".join(email.recipients),
+                attempts,
+                err,
+            )
+            cls.objects.filter(digest=email.digest).delete()
+            return True
+
+        for email in emails:
+            email.attempts += 1
+            email.next_attempt = timezone.now() + timedelta(
+                seconds=settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (email.attempts - 1)
+            )
+            email.last_error = str(err)
+            email.save(update_fields=["attempts", "next_attempt", "last_error"])
+
+        return False
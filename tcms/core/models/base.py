@@ -1,15 +1,26 @@
 # -*- coding: utf-8 -*-
-from django.conf import settings
-from django.contrib.sites.models import Site
-
 from tcms.core.utils import request_host_link
+from tcms.core.utils.sites import current_site
+
+
+def get_full_urls(objects):
+    """
+    Same as calling ``get_full_url()`` for each object but the Site
+    is looked up only once. Use it when rendering many objects!
+    """
+    site = current_site()
+    result = []
+    for obj in objects:
+        result.append(obj.get_full_url(site))
+    return result
 
 
 class UrlMixin:  # pylint: disable=too-few-public-methods
     """Mixin class for getting full URL"""
 
-    def get_full_url(self):
-        site = Site.objects.get(pk=settings.SITE_ID)
+    def get_full_url(self, site=None):
+        if site is None:
+            site = current_site()
         host_link = request_host_link(None, site.domain)
         _absolute_url = self._get_absolute_url().strip("/")
         return f"{host_link}/{_absolute_url}/"
@@ -0,0 +1,156 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from mock import patch
+
+from tcms.issuetracker.base import IssueTrackerType
+from tcms.testcases.models import BugSystem
+from tcms.testruns.models import PendingTrackerComment
+from tcms.tests.factories import TestExecutionFactory
+
+
+class RecordingTracker(IssueTrackerType):  # pylint: disable=abstract-method
+    comments = []
+
+    def post_text(self, bug_id, text):
+        self.comments.append((bug_id, text))
+
+
+class FailingTracker(IssueTrackerType):  # pylint: disable=abstract-method
+    def post_text(self, bug_id, text):
+        raise ConnectionError("Tracker is down")
+
+
+class TestPostTrackerCommentsCommand(TestCase):
+    """Test manage.py post_tracker_comments command"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tracker = BugSystem.objects.create(
+            name="Recording tracker",
+            tracker_type="tcms.core.tests.test_post_tracker_comments.RecordingTracker",
+            base_url="https://tracker.example.com",
+        )
+        cls.broken_tracker = BugSystem.objects.create(
+            name="Failing tracker",
+            tracker_type="tcms.core.tests.test_post_tracker_comments.FailingTracker",
+            base_url="https://broken.example.com",
+        )
+        cls.executions = []
+        for _ in range(3):
+            cls.executions.append(TestExecutionFactory())
+
+    def setUp(self):
+        super().setUp()
+        RecordingTracker.comments.clear()
+
+    @staticmethod
+    def add_comment(bug_system, issue_url, execution, **kwargs):
+        return PendingTrackerComment.objects.create(
+            bug_system=bug_system, issue_url=issue_url, execution=execution, **kwargs
+        )
+
+    def test_comments_for_the_same_issue_are_coalesced(self):
+        for execution in self.executions:
+            self.add_comment(self.tracker, "https://tracker.example.com/1", execution)
+        self.add_comment(
+            self.tracker, "https://tracker.example.com/2", self.executions[0]
+        )
+
+        out = StringIO()
+        with override_settings(TRACKER_COMMENT_INTERVAL=0):
+            call_command("post_tracker_comments", "--once", stdout=out)
+
+        self.assertEqual(
+            "Commented on 2 issue(s), 0 failed and will be retried.\n", out.getvalue()
+        )
+        self.assertEqual(len(RecordingTracker.comments), 2)
+
+        bug_id, text = RecordingTracker.comments[0]
+        self.assertEqual(bug_id, 1)
+        for execution in self.executions:
+            self.assertIn(f"TE-{execution.pk}: {execution.case.summary}", text)
+
+        bug_id, text = RecordingTracker.comments[1]
+        self.assertEqual(bug_id, 2)
+        self.assertEqual(text, IssueTrackerType.text(self.executions[0]))
+        self.assertFalse(PendingTrackerComment.objects.exists())
+
+    def test_failed_comments_are_retried_with_backoff(self):
+        comment = self.add_comment(
+            self.broken_tracker, "https://broken.example.com/1", self.executions[0]
+        )
+
+        with override_settings(TRACKER_COMMENT_RETRY_DELAY=60):
+            PendingTrackerComment.deliver({})
+            comment.refresh_from_db()
+            self.assertEqual(comment.attempts, 1)
+            self.assertEqual(comment.last_error, "Tracker is down")
+            self.assertGreater(comment.next_attempt, timezone.now())
+
+            # not due yet
+            self.assertEqual(PendingTrackerComment.deliver({}), (0, 0, 0))
+
+            comment.next_attempt = timezone.now()
+            comment.save()
+            started_at = timezone.now()
+            PendingTrackerComment.deliver({})
+
+        comment.refresh_from_db()
+        self.assertEqual(comment.attempts, 2)
+        self.assertGreaterEqual(
+            comment.next_attempt, started_at + timedelta(seconds=120)
+        )
+
+    @override_settings(TRACKER_COMMENT_MAX_ATTEMPTS=3)
+    def test_comments_are_not_retried_after_max_attempts(self):
+        self.add_comment(
+            self.tracker,
+            "https://tracker.example.com/1",
+            self.executions[0],
+            attempts=3,
+        )
+
+        self.assertEqual(PendingTrackerComment.deliver({}), (0, 0, 0))
+        self.assertEqual(RecordingTracker.comments, [])
+
+    @override_settings(TRACKER_COMMENT_INTERVAL=3600)
+    def test_comments_to_the_same_tracker_are_rate_limited(self):
+        self.add_comment(
+            self.tracker, "https://tracker.example.com/1", self.executions[0]
+        )
+        self.add_comment(
+            self.tracker, "https://tracker.example.com/2", self.executions[1]
+        )
+        self.add_comment(
+            self.broken_tracker, "https://broken.example.com/1", self.executions[2]
+        )
+
+        last_posted = {}
+        self.assertEqual(PendingTrackerComment.deliver(last_posted), (1, 1, 1))
+        self.assertEqual(len(RecordingTracker.comments), 1)
+        self.assertEqual(PendingTrackerComment.deliver(last_posted), (0, 0, 1))
+        self.assertEqual(
+            PendingTrackerComment.objects.filter(bug_system=self.tracker).count(), 1
+        )
+
+    def test_comments_are_posted_for_every_schema(self):
+        with patch(
+            "tcms.core.management.commands.post_tracker_comments.each_schema",
+            return_value=iter(["public", "tenant"]),
+        ), patch.object(
+            PendingTrackerComment, "deliver", return_value=(1, 0, 0)
+        ) as deliver:
+            out = StringIO()
+            call_command("post_tracker_comments", "--once", stdout=out)
+
+        self.assertEqual(
+            "Commented on 2 issue(s), 0 failed and will be retried.\n", out.getvalue()
+        )
+        self.assertEqual(deliver.call_count, 2)
+        # rate limits are not shared between tenants
+        first, second = deliver.call_args_list
+        self.assertIsNot(first.args[0], second.args[0])
@@ -0,0 +1,39 @@
+# pylint: disable=objects-update-used
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from tcms.testruns.models import TestExecutionStatus, TestRunStatusCount
+from tcms.tests.factories import TestCaseFactory, TestRunFactory
+
+
+class TestRefreshStatusCountsCommand(TestCase):
+    """Test manage.py refresh_status_counts command"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_case = TestCaseFactory()
+        cls.test_case.save()  # we need 1 version in the history
+
+        cls.test_run = TestRunFactory()
+        cls.execution = cls.test_run.create_execution_batch([cls.test_case])[0]
+
+    def test_refresh_recalculates_counters(self):
+        passed = TestExecutionStatus.objects.filter(weight__gt=0).first()
+        # update() doesn't send signals and the counters become stale
+        self.test_run.executions.update(status=passed)
+        TestRunStatusCount.objects.filter(run=self.test_run).update(count=42)
+
+        out = StringIO()
+        call_command("refresh_status_counts", f"--run={self.test_run.pk}", stdout=out)
+
+        self.assertEqual("Execution counters refreshed successfully.\n", out.getvalue())
+        self.assertEqual(
+            list(
+                TestRunStatusCount.objects.filter(run=self.test_run).values_list(
+                    "build", "status", "count"
+                )
+            ),
+            [(self.execution.build_id, passed.pk, 1)],
+        )
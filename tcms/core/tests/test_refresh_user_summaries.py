@@ -0,0 +1,28 @@
+# pylint: disable=objects-update-used
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from tcms.testruns.models import UserSummary
+from tcms.tests.factories import TestPlanFactory, TestRunFactory, UserFactory
+
+
+class TestRefreshUserSummariesCommand(TestCase):
+    """Test manage.py refresh_user_summaries command"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        TestPlanFactory(author=cls.user)
+        TestRunFactory(manager=cls.user)
+
+    def test_refresh_recalculates_summaries(self):
+        UserSummary.objects.filter(user=self.user).update(plans=42, open_runs=42)
+
+        out = StringIO()
+        call_command("refresh_user_summaries", f"--user={self.user.pk}", stdout=out)
+
+        self.assertEqual("User summaries refreshed successfully.\n", out.getvalue())
+        summary = UserSummary.objects.get(user=self.user)
+        self.assertEqual((summary.plans, summary.open_runs), (1, 1))
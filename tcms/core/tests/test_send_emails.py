@@ -0,0 +1,114 @@
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from mock import patch
+
+from tcms.core.models import OutgoingEmail
+from tcms.core.utils.mailto import mailto
+
+
+class TestSendEmailsCommand(TestCase):
+    """Test manage.py send_emails command"""
+
+    @staticmethod
+    def send_emails():
+        out = StringIO()
+        call_command("send_emails", "--once", stdout=out)
+        return out.getvalue()
+
+    def test_messages_are_sent_from_the_outbox(self):
+        mailto(None, "First", ["first@example.com"], "Body")
+        mailto(None, "Second", ["second@example.com"], "Body")
+        self.assertEqual(len(mail.outbox), 0)
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.open"
+        ) as open_connection:
+            output = self.send_emails()
+
+        # a single connection is used for the whole batch
+        open_connection.assert_called_once()
+        self.assertEqual("Sent 2 message(s), 0 failed and will be retried.\n", output)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].subject, "[Kiwi-TCMS] First")
+        self.assertEqual(mail.outbox[0].to, ["first@example.com"])
+        self.assertEqual(mail.outbox[1].subject, "[Kiwi-TCMS] Second")
+        self.assertFalse(OutgoingEmail.objects.exists())
+
+    def test_identical_messages_are_sent_once(self):
+        for _ in range(3):
+            mailto(None, "Updated", ["tester@example.com"], "Body")
+
+        self.assertEqual(OutgoingEmail.objects.count(), 1)
+        self.send_emails()
+        self.assertEqual(len(mail.outbox), 1)
+
+        # can be sent again once the previous message is gone
+        mailto(None, "Updated", ["tester@example.com"], "Body")
+        self.send_emails()
+        self.assertEqual(len(mail.outbox), 2)
+
+    @override_settings(EMAIL_OUTBOX_BATCH_SIZE=2)
+    def test_all_batches_are_sent(self):
+        for number in range(5):
+            mailto(None, f"Message {number}", ["tester@example.com"], "Body")
+
+        self.send_emails()
+        self.assertEqual(len(mail.outbox), 5)
+
+    @override_settings(EMAIL_OUTBOX_RETRY_DELAY=60, EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_failed_messages_are_retried(self):
+        mailto(None, "Failing", ["tester@example.com"], "Body")
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError("Mail server is down"),
+        ):
+            output = self.send_emails()
+
+        self.assertEqual("Sent 0 message(s), 1 failed and will be retried.\n", output)
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.last_error, "Mail server is down")
+
+        # not due yet
+        self.assertEqual(self.send_emails(), "")
+
+        OutgoingEmail.objects.update(  # pylint: disable=objects-update-used
+            next_attempt=timezone.now()
+        )
+        self.assertEqual(
+            "Sent 1 message(s), 0 failed and will be retried.\n", self.send_emails()
+        )
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_messages_are_dropped_after_max_attempts(self):
+        mailto(None, "Failing", ["tester@example.com"], "Body")
+        OutgoingEmail.objects.update(attempts=1)  # pylint: disable=objects-update-used
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError("Mail server is down"),
+        ), self.assertLogs("tcms.core.models", "ERROR") as logs:
+            output = self.send_emails()
+
+        self.assertEqual("Dropped 1 message(s) which failed too many times.\n", output)
+        self.assertIn("Mail server is down", logs.output[0])
+        self.assertFalse(OutgoingEmail.objects.exists())
+
+        # can be enqueued again
+        mailto(None, "Failing", ["tester@example.com"], "Body")
+        self.assertEqual(OutgoingEmail.objects.count(), 1)
+
+    def test_messages_are_sent_for_every_schema(self):
+        with patch(
+            "tcms.core.management.commands.send_emails.each_schema",
+            side_effect=lambda: iter(["public", "tenant"]),
+        ), patch.object(OutgoingEmail, "deliver", return_value=(0, 0, 0)) as deliver:
+            self.send_emails()
+
+        self.assertEqual(deliver.call_count, 2)
@@ -2,10 +2,14 @@ import unittest
 from unittest.mock import patch
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.contrib.sites.models import Site
 from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
 
+from tcms.core.models.base import get_full_urls
 from tcms.core.utils.mailto import mailto
+from tcms.core.utils.sites import current_site, forget_sites
+from tcms.tests.factories import TestPlanFactory
 
 
 class TestMailTo(unittest.TestCase):
@@ -16,20 +20,15 @@ class TestMailTo(unittest.TestCase):
         self.expected_recipients = None
 
     @property
-    def expected_kwargs(self):
-        return {
-            "target": send_mail,
-            "args": (
-                settings.EMAIL_SUBJECT_PREFIX + self.expected_subject,
-                self.expected_body,
-                self.expected_sender,
-                self.expected_recipients,
-            ),
-            "kwargs": {"fail_silently": False},
-            "daemon": True,
-        }
+    def expected_args(self):
+        return (
+            settings.EMAIL_SUBJECT_PREFIX + self.expected_subject,
+            self.expected_body,
+            self.expected_sender,
+            self.expected_recipients,
+        )
 
-    @patch("threading.Thread")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_string_recipient(self, mock):
         self.expected_recipients = ["example@example.com"]
         mailto(
@@ -38,9 +37,9 @@ class TestMailTo(unittest.TestCase):
             recipients="example@example.com",
             context="Body text",
         )
-        mock.assert_called_once_with(**self.expected_kwargs)
+        mock.assert_called_once_with(*self.expected_args)
 
-    @patch("threading.Thread")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_duplicate_recipients(self, mock):
         self.expected_recipients = ["example@example.com"]
         mailto(
@@ -49,9 +48,9 @@ class TestMailTo(unittest.TestCase):
             recipients=["example@example.com", "example@example.com"],
             context="Body text",
         )
-        mock.assert_called_once_with(**self.expected_kwargs)
+        mock.assert_called_once_with(*self.expected_args)
 
-    @patch("threading.Thread")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_cc_email(self, mock):
         self.expected_recipients = ["example@example.com", "cc@example.com"]
         mailto(
@@ -61,11 +60,11 @@ class TestMailTo(unittest.TestCase):
             context="Body text",
             cc=["cc@example.com"],
         )
-        mock.assert_called_once_with(**self.expected_kwargs)
+        mock.assert_called_once_with(*self.expected_args)
 
     @patch("django.conf.settings.DEBUG", True)
     @patch("django.conf.settings.ADMINS", [("Admin", "admin@example.com")])
-    @patch("threading.Thread")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_admin_email_on_debug(self, mock):
         self.expected_recipients = ["example@example.com", "admin@example.com"]
         mailto(
@@ -74,9 +73,9 @@ class TestMailTo(unittest.TestCase):
             recipients="example@example.com",
             context="Body text",
         )
-        mock.assert_called_once_with(**self.expected_kwargs)
+        mock.assert_called_once_with(*self.expected_args)
 
-    @patch("threading.Thread")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_template(self, mock):
         template_name = "email/user_registered/notify_admins.txt"
         context = {
@@ -91,4 +90,36 @@ class TestMailTo(unittest.TestCase):
             recipients=["example@example.com"],
             context=context,
         )
-        mock.assert_called_once_with(**self.expected_kwargs)
+        mock.assert_called_once_with(*self.expected_args)
+
+
+@override_settings(SITE_CACHE_TIMEOUT=60)
+class TestCurrentSite(TestCase):
+    def setUp(self):
+        super().setUp()
+        forget_sites()
+
+    def test_site_is_cached(self):
+        site = current_site()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(current_site(), site)
+
+    def test_cache_is_cleared_when_site_is_saved(self):
+        site = Site.objects.get(pk=settings.SITE_ID)
+        current_site()
+
+        site.domain = "kiwi.example.com"
+        site.save()
+
+        self.assertEqual(current_site().domain, "kiwi.example.com")
+
+    @override_settings(SITE_CACHE_TIMEOUT=0)
+    def test_get_full_urls_looks_up_the_site_once(self):
+        plans = [TestPlanFactory(), TestPlanFactory(), TestPlanFactory()]
+
+        with self.assertNumQueries(1):
+            urls = get_full_urls(plans)
+
+        for plan, url in zip(plans, urls):
+            self.assertEqual(url, plan.get_full_url())
@@ -8,11 +8,15 @@ from django import test
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import include, path, reverse
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
+from mock import patch
 
 from tcms import urls
+from tcms.core import health
 from tcms.tests import LoggedInTestCase
 from tcms.tests.factories import (
     TestExecutionFactory,
@@ -77,6 +81,33 @@ class TestDashboard(LoggedInTestCase):
         response = self.client.get(reverse("core-views-index"))
         self.assertContains(response, execution.run.summary)
 
+    def test_dashboard_shows_counters_from_summary(self):
+        TestPlanFactory(author=self.tester, is_active=False)
+        for _i in range(2):
+            TestRunFactory(manager=self.tester)
+
+        response = self.client.get(reverse("core-views-index"))
+        self.assertEqual(response.context["test_plans_count"], 2)
+        self.assertEqual(response.context["test_plans_disable_count"], 1)
+        self.assertEqual(response.context["test_runs_count"], 2)
+        self.assertEqual(len(response.context["last_15_test_plans"]), 1)
+        self.assertEqual(len(response.context["last_15_test_runs"]), 2)
+
+    def test_dashboard_queries_do_not_depend_on_number_of_runs(self):
+        TestExecutionFactory(assignee=self.tester)
+        # warm up caches which are not related to the dashboard
+        self.client.get(reverse("core-views-index"))
+        with CaptureQueriesContext(connection) as single_run:
+            self.client.get(reverse("core-views-index"))
+
+        for _i in range(3):
+            TestExecutionFactory(assignee=self.tester)
+        with CaptureQueriesContext(connection) as many_runs:
+            response = self.client.get(reverse("core-views-index"))
+
+        self.assertEqual(len(response.context["last_15_test_runs"]), 4)
+        self.assertEqual(len(many_runs), len(single_run))
+
     def test_check_base_url_not_configured(self):
         response = self.client.get("/", follow=True)
         self.assertContains(response, self.base_url_error_message)
@@ -128,6 +159,57 @@ class TestDashboardCheckMigrations(test.TransactionTestCase):
         self.assertContains(response, self.unapplied_migration_message)
 
 
+class TestHealthz(test.TestCase):
+    def setUp(self):
+        super().setUp()
+        health.forget()
+
+    def test_healthy_without_login(self):
+        response = self.client.get(reverse("healthz"))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.json(),
+            {"status": "ok", "database": True, "unapplied_migrations": 0},
+        )
+
+    @patch("tcms.core.health._migration_plan_size", return_value=2)
+    def test_unhealthy_with_unapplied_migrations(self, _migration_plan_size):
+        response = self.client.get(reverse("healthz"))
+
+        self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(response.json()["unapplied_migrations"], 2)
+
+    @patch("tcms.core.health.MigrationExecutor")
+    def test_migration_plan_is_cached(self, migration_executor):
+        migration_executor.return_value.migration_plan.return_value = []
+
+        health.unapplied_migrations()
+        self.client.get(reverse("healthz"))
+
+        migration_executor.assert_called_once()
+
+    @patch("tcms.core.health.MigrationExecutor")
+    def test_migration_plan_is_refreshed_after_migrate(self, migration_executor):
+        migration_executor.return_value.migration_plan.return_value = []
+
+        health.unapplied_migrations()
+        call_command("migrate", verbosity=0, interactive=False)
+        health.unapplied_migrations()
+
+        self.assertEqual(migration_executor.call_count, 2)
+
+    @test.override_settings(HEALTH_CHECK_INTERVAL=-1)
+    @patch("tcms.core.health.MigrationExecutor")
+    def test_migration_plan_is_refreshed_periodically(self, migration_executor):
+        migration_executor.return_value.migration_plan.return_value = []
+
+        health.unapplied_migrations()
+        health.unapplied_migrations()
+
+        self.assertEqual(migration_executor.call_count, 2)
+
+
 def exception_view(request):
     raise RuntimeError
 
@@ -3,6 +3,9 @@
 
 import sys
 
+from django.conf import settings
+from django.db import connection
+
 
 def request_host_link(request, domain_name=None):
     protocol = "https://"
@@ -18,3 +21,44 @@ def request_host_link(request, domain_name=None):
             protocol = "http://"
 
     return protocol + domain_name
+
+
+def db_schema():
+    """
+    Returns the database schema of the current tenant when kiwitcms-tenants
+    is installed, otherwise ``None``. Must be part of the key for data which
+    is cached in the current process!
+    """
+    return getattr(connection, "schema_name", None)
+
+
+def each_schema():
+    """
+    Activate the database schema of every tenant in turn, starting with
+    the public one, when kiwitcms-tenants is installed. Otherwise yield once
+    for the default schema! Used by background commands which process
+    records stored in all tenants.
+
+    :return: the name of the active schema or ``None``
+    :rtype: generator
+    """
+    if "tcms_tenants" not in settings.INSTALLED_APPS:
+        yield None
+        return
+
+    from django_tenants.utils import (  # pylint: disable=E0401, C0415
+        get_public_schema_name,
+        get_tenant_model,
+        schema_context,
+    )
+
+    public_schema = get_public_schema_name()
+    schemas = [public_schema] + list(
+        get_tenant_model()
+        .objects.exclude(schema_name=public_schema)
+        .order_by("schema_name")
+        .values_list("schema_name", flat=True)
+    )
+    for schema_name in schemas:
+        with schema_context(schema_name):
+            yield schema_name
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
-import threading
-
 from django.conf import settings
-from django.core.mail import send_mail
 from django.forms import ValidationError
 from django.template.loader import render_to_string
 from django.utils.translation import override
 
+from tcms.core.models import OutgoingEmail
+
 
 def custom_email_validators(email):
     for validator in getattr(settings, "EMAIL_VALIDATORS", ()):
@@ -60,11 +59,10 @@ def mailto(  # pylint: disable=invalid-name
     else:
         body = context
 
-    sender = settings.DEFAULT_FROM_EMAIL
-    email_thread = threading.Thread(
-        target=send_mail,
-        args=(settings.EMAIL_SUBJECT_PREFIX + subject, body, sender, recipients),
-        kwargs={"fail_silently": False},
-        daemon=True,
+    # sent in the background by ./manage.py send_emails
+    OutgoingEmail.enqueue(
+        settings.EMAIL_SUBJECT_PREFIX + subject,
+        body,
+        settings.DEFAULT_FROM_EMAIL,
+        recipients,
     )
-    email_thread.start()
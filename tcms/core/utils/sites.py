@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+
+from tcms.core.utils import db_schema
+
+# (Site, cached_at) keyed by (database schema, SITE_ID), see current_site()
+_sites = {}
+
+
+def current_site():
+    """
+    Same as ``Site.objects.get(pk=settings.SITE_ID)`` but the result is
+    cached in the current process for ``settings.SITE_CACHE_TIMEOUT`` seconds
+    or until a Site is saved or deleted!
+
+    Unlike ``Site.objects.get_current()`` this is safe to use when
+    kiwitcms-tenants is installed.
+    """
+    key = (db_schema(), settings.SITE_ID)
+    site, cached_at = _sites.get(key, (None, 0))
+    if site is not None and time.monotonic() - cached_at < settings.SITE_CACHE_TIMEOUT:
+        return site
+
+    site = Site.objects.get(pk=settings.SITE_ID)
+    _sites[key] = (site, time.monotonic())
+    return site
+
+
+def forget_sites():
+    _sites.clear()
@@ -8,11 +8,10 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
-from django.contrib.sites.models import Site
-from django.db import DEFAULT_DB_ALIAS, connections
-from django.db.migrations.executor import MigrationExecutor
-from django.db.models import Count, Q
-from django.http import HttpResponseRedirect, StreamingHttpResponse
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.http import HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.template import loader
 from django.urls import reverse
 from django.utils import timezone, translation
@@ -24,8 +23,10 @@ from django.views import i18n
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.generic.base import TemplateView, View
 
+from tcms.core import health
+from tcms.core.utils.sites import current_site
 from tcms.testplans.models import TestPlan
-from tcms.testruns.models import TestRun
+from tcms.testruns.models import OpenTestRun, TestRun, TestRunStatusCount, UserSummary
 
 
 @method_decorator(login_required, name="dispatch")
@@ -34,7 +35,7 @@ class DashboardView(TemplateView):  # pylint: disable=missing-permission-require
 
     def get_context_data(self, **kwargs):
         # Check if domain is configured
-        site = Site.objects.get(pk=settings.SITE_ID)
+        site = current_site()
         doc_url = (
             "https://kiwitcms.readthedocs.io/en/latest/installing_docker.html"
             "#configuration-of-kiwi-tcms-domain"
@@ -59,9 +60,8 @@ class DashboardView(TemplateView):  # pylint: disable=missing-permission-require
             "https://kiwitcms.readthedocs.io/en/latest/"
             "installing_docker.html#initial-configuration-of-running-container"
         )
-        executor = MigrationExecutor(connections[DEFAULT_DB_ALIAS])
-        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
-        if plan:
+        unapplied_migrations = health.unapplied_migrations()
+        if unapplied_migrations:
             messages.add_message(
                 self.request,
                 messages.ERROR,
@@ -70,7 +70,7 @@ class DashboardView(TemplateView):  # pylint: disable=missing-permission-require
                         "You have {unapplied_migration_count} unapplied migration(s). "
                         'See <a href="{doc_url}">documentation</a>'
                     ),
-                    unapplied_migration_count=len(plan),
+                    unapplied_migration_count=unapplied_migrations,
                     doc_url=doc_url,
                 ),
             )
@@ -93,35 +93,100 @@ class DashboardView(TemplateView):  # pylint: disable=missing-permission-require
                 ),
             )
 
-        # List all recent TestPlans and TestRuns
-        test_plans = (
-            TestPlan.objects.filter(author=self.request.user)
-            .order_by("-pk")
-            .select_related("product", "type")
-            .annotate(num_runs=Count("run", distinct=True))
-        )
-        test_plans_disable_count = test_plans.filter(is_active=False).count()
-
-        # pylint: disable=unsupported-binary-operation
-        test_runs = (
-            TestRun.objects.filter(
-                Q(manager=self.request.user)
-                | Q(default_tester=self.request.user)
-                | Q(executions__assignee=self.request.user),
-                stop_date__isnull=True,
+        # List all recent TestPlans and TestRuns, counters are pre-aggregated
+        # and fetched together with the open test runs
+        open_runs = list(
+            OpenTestRun.objects.filter(user=self.request.user)
+            .select_related("run", "user__summary")
+            .annotate(
+                total=self._count_executions(),
+                completed=self._count_executions(~Q(status__weight=0)),
+                failing=self._count_executions(Q(status__weight__lt=0)),
             )
-            .order_by("-pk")
-            .distinct()
+            .order_by("-run")[:15]
         )
 
+        test_runs = []
+        for record in open_runs:
+            record.run.stats = TestRun.executions_subtotal(
+                record.total, record.completed, record.failing
+            )
+            test_runs.append(record.run)
+
+        try:
+            summary = open_runs[0].user.summary
+        except (IndexError, ObjectDoesNotExist):
+            summary = UserSummary.objects.filter(user=self.request.user).first()
+        if summary is None:
+            summary = UserSummary(user=self.request.user)
+
+        test_plans = []
+        if summary.plans > summary.disabled_plans:
+            test_plans = (
+                TestPlan.objects.filter(author=self.request.user, is_active=True)
+                .order_by("-pk")
+                .select_related("product", "type")
+                .annotate(
+                    num_runs=Coalesce(
+                        Subquery(
+                            TestRun.objects.filter(plan=OuterRef("pk"))
+                            .order_by()
+                            .values("plan")
+                            .annotate(count=Count("pk"))
+                            .values("count")
+                        ),
+                        0,
+                    )
+                )[:15]
+            )
+
         return {
-            "test_plans_count": test_plans.count(),
-            "test_plans_disable_count": test_plans_disable_count,
-            "last_15_test_plans": test_plans.filter(is_active=True)[:15],
-            "last_15_test_runs": test_runs[:15],
-            "test_runs_count": test_runs.count(),
+            "test_plans_count": summary.plans,
+            "test_plans_disable_count": summary.disabled_plans,
+            "last_15_test_plans": test_plans,
+            "last_15_test_runs": test_runs,
+            "test_runs_count": summary.open_runs,
         }
 
+    @staticmethod
+    def _count_executions(condition=None):
+        counters = TestRunStatusCount.objects.filter(run=OuterRef("run"))
+        if condition is not None:
+            counters = counters.filter(condition)
+
+        return Coalesce(
+            Subquery(
+                counters.order_by()
+                .values("run")
+                .annotate(count=Sum("count"))
+                .values("count")
+            ),
+            0,
+        )
+
+
+class HealthzView(View):  # pylint: disable=missing-permission-required
+    """
+    Health probe for load balancers and container orchestration. Responds
+    with 503 when the database isn't available or when there are unapplied
+    migrations. The latter is cached, see :mod:`tcms.core.health`!
+    """
+
+    @staticmethod
+    def get(request):
+        database = health.database_is_available()
+        unapplied_migrations = health.unapplied_migrations() if database else None
+        healthy = database and unapplied_migrations == 0
+
+        return JsonResponse(
+            {
+                "status": "ok" if healthy else "error",
+                "database": database,
+                "unapplied_migrations": unapplied_migrations,
+            },
+            status=200 if healthy else 503,
+        )
+
 
 @requires_csrf_token
 def server_error(request):  # pylint: disable=missing-permission-required
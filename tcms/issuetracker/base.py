@@ -1,4 +1,10 @@
+import hashlib
+import http.client
+import itertools
+import logging
 import re
+import threading
+import time
 
 from django.conf import settings
 from django.utils.module_loading import import_string
@@ -6,6 +12,70 @@ from opengraph.opengraph import OpenGraph
 
 RE_ENDS_IN_INT = re.compile(r"[\d]+$")
 
+logger = logging.getLogger(__name__)
+
+# authenticated clients reused between requests in the current process. Each
+# thread has its own clients b/c client libraries aren't thread-safe. Keyed by
+# (BugSystem.pk, credentials version), see IssueTrackerType.rpc
+_local = threading.local()
+
+# generation at which clients for a BugSystem, or for all of them (None),
+# have been dropped, see forget_rpc_connections()
+_forgotten = {}
+_generations = itertools.count(1)
+
+
+def _thread_clients():
+    if not hasattr(_local, "clients"):
+        _local.clients = {}
+    return _local.clients
+
+
+def _close(client):
+    close = getattr(client, "close", None)
+    if close is None:
+        return
+
+    try:
+        close()
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.warning("Closing issue tracker client failed: %s", err)
+
+
+def forget_rpc_connections(bug_system_id=None):
+    """
+    Drop the pooled clients for a BugSystem or for all of them! Clients of
+    the current thread are closed immediately, clients of other threads
+    when they are about to be used next time.
+    """
+    _forgotten[bug_system_id] = next(_generations)
+    _evict_clients(time.monotonic())
+
+
+def close_rpc_connections():
+    """
+    Close all pooled clients of the current thread, e.g. before it exits!
+    """
+    clients = _thread_clients()
+    while clients:
+        _close(clients.popitem()[1][0])
+
+
+def _evict_clients(now):
+    """
+    Close clients of the current thread which haven't been used for a while
+    or whose BugSystem has been changed since they connected!
+    """
+    clients = _thread_clients()
+    forgotten_all = _forgotten.get(None, 0)
+    for key, (client, generation, last_used) in list(clients.items()):
+        if (
+            now - last_used > settings.ISSUE_TRACKER_CLIENT_IDLE_TIMEOUT
+            or generation <= max(forgotten_all, _forgotten.get(key[0], 0))
+        ):
+            del clients[key]
+            _close(client)
+
 
 class IssueTrackerType:
     """
@@ -14,6 +84,11 @@ class IssueTrackerType:
     supports!
     """
 
+    #: Errors raised when bug details can't be fetched, e.g. because the
+    #: issue tracker can't be reached. Extend with the errors raised by
+    #: the client library of the issue tracker!
+    details_errors = (OSError, http.client.HTTPException, ValueError)
+
     def __init__(self, bug_system, request):
         """
         :bug_system: - BugSystem object
@@ -75,6 +150,34 @@ class IssueTrackerType:
 
         return result
 
+    def details_many(self, urls):
+        """
+        Returns a dictionary of bug details, keyed by URL. URLs for which
+        details can't be fetched are missing from the result.
+
+        The default implementation calls :meth:`details` for each URL.
+        Override this method if the issue tracker can return information
+        about multiple bugs with a single request!
+        """
+        result = {}
+        for url in urls:
+            try:
+                result[url] = self.details(url)
+            except self.details_errors as err:
+                logger.warning("Fetching details for %s failed: %s", url, err)
+        return result
+
+    @classmethod
+    def urls_by_bug_id(cls, urls):
+        """
+        Returns a dictionary of URL lists, keyed by bug ID. Used when
+        querying the issue tracker for multiple bugs at once!
+        """
+        result = {}
+        for url in urls:
+            result.setdefault(cls.bug_id_from_url(url), []).append(url)
+        return result
+
     def _report_comment(
         self, execution, user=None, max_text_length=None
     ):  # pylint: disable=no-self-use
@@ -172,10 +275,26 @@ class IssueTrackerType:
 
         :executions: - iterable of TestExecution objects
         :issue_url: - the URL of the existing defect
+
+        .. versionchanged:: 16.3
+
+            Integrations which implement :meth:`post_text` post a single
+            comment listing all executions.
         """
         bug_id = self.bug_id_from_url(issue_url)
+
+        if (
+            type(self).post_comment is not IssueTrackerType.post_comment
+            or type(self).post_text is IssueTrackerType.post_text
+        ):
+            for execution in executions:
+                self.post_comment(execution, bug_id)
+            return
+
+        texts = []
         for execution in executions:
-            self.post_comment(execution, bug_id)
+            texts.append(self.text(execution))
+        self.post_text(bug_id, "\n\n".join(texts))
 
     @staticmethod
     def text(execution):
@@ -195,6 +314,19 @@ TE-{execution.pk}: {execution.case.summary}"""
         :param bug_id: Unique defect identifier in the system. Usually an int.
         :type bug_id: int or str
         """
+        self.post_text(bug_id, self.text(execution))
+
+    def post_text(self, bug_id, text):
+        """
+        Add a new comment to an existing defect.
+
+        :param bug_id: Unique defect identifier in the system. Usually an int.
+        :type bug_id: int or str
+        :param text: The comment, see :meth:`text`
+        :type text: str
+
+        .. versionadded:: 16.3
+        """
         raise NotImplementedError()
 
     def is_adding_testcase_to_issue_disabled(self):  # pylint: disable=invalid-name
@@ -221,13 +353,60 @@ TE-{execution.pk}: {execution.case.summary}"""
         """
         Returns an object which is used to communicate to the external system.
         This property is meant to be used by the rest of the integration code.
+
+        .. versionchanged:: 16.3
+
+            Clients are reused between requests in the same thread until
+            the BugSystem is changed, its credentials change or the client
+            isn't used for ``settings.ISSUE_TRACKER_CLIENT_IDLE_TIMEOUT``
+            seconds. Dropped clients are closed.
         """
         # b/c jira.JIRA tries to connect when object is created
         # see https://github.com/kiwitcms/Kiwi/issues/100
         if self.is_adding_testcase_to_issue_disabled():
             return None
 
-        return self._rpc_connection()
+        # not saved yet, can't be invalidated
+        if self.bug_system.pk is None:
+            return self._rpc_connection()
+
+        key = (self.bug_system.pk, self.rpc_credentials_version)
+        now = time.monotonic()
+        _evict_clients(now)
+
+        clients = _thread_clients()
+        if key in clients:
+            client, generation, _last_used = clients[key]
+            clients[key] = (client, generation, now)
+            return client
+
+        # before connecting, so that forget_rpc_connections() called
+        # in the meantime applies to this client as well
+        generation = next(_generations)
+        client = self._rpc_connection()
+        clients[key] = (client, generation, now)
+        return client
+
+    @property
+    def rpc_credentials_version(self):
+        """
+        Changes whenever the connection settings for this tracker change,
+        including credentials provided via
+        ``settings.EXTERNAL_ISSUE_RPC_CREDENTIALS``. Used as part of the
+        key for pooled clients, see :attr:`rpc`!
+
+        .. versionadded:: 16.3
+        """
+        fingerprint = repr(
+            (
+                type(self).__module__,
+                type(self).__qualname__,
+                self.bug_system.base_url,
+                self.bug_system.api_url,
+                self.rpc_credentials,
+            )
+        )
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
 
     @property
     def rpc_credentials(self):
@@ -28,6 +28,11 @@ class Bugzilla(base.IssueTrackerType):
     into Bugzilla!
     """
 
+    details_errors = base.IssueTrackerType.details_errors + (
+        BugzillaError,
+        XmlRPCFault,
+    )
+
     def __init__(self, bug_system, request):
         super().__init__(bug_system, request)
 
@@ -119,7 +124,7 @@ class Bugzilla(base.IssueTrackerType):
 
         return (None, url + "enter_bug.cgi?" + urlencode(args, True))
 
-    def post_comment(self, execution, bug_id):
+    def post_text(self, bug_id, text):
         self.rpc.update_bugs(
-            bug_id, {"comment": {"comment": self.text(execution), "is_private": False}}
+            bug_id, {"comment": {"comment": text, "is_private": False}}
         )
@@ -15,7 +15,7 @@ from tcms.core.contrib.linkreference.models import LinkReference
 from tcms.issuetracker.base import IssueTrackerType
 
 
-class KiwiTCMS(IssueTrackerType):
+class KiwiTCMS(IssueTrackerType):  # pylint: disable=abstract-method
     """
     Support for Kiwi TCMS. Required fields:
 
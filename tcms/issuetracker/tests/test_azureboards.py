@@ -3,6 +3,7 @@
 import os
 import unittest
 
+from django.core.management import call_command
 from django.utils import timezone
 
 from tcms.core.contrib.linkreference.models import LinkReference
@@ -80,6 +81,9 @@ class TestAzureIntegration(APITestCase):
                 True,
             )
 
+            # comments are posted in the background
+            call_command("post_tracker_comments", "--once")
+
             # making sure RPC above returned the same URL
             self.assertEqual(self.existing_bug_url, result["url"])
 
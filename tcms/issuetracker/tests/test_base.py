@@ -0,0 +1,133 @@
+import threading
+
+from django.test import TestCase, override_settings
+from mock import Mock, patch
+
+from tcms.issuetracker.base import (
+    IssueTrackerType,
+    close_rpc_connections,
+    forget_rpc_connections,
+)
+from tcms.testcases.models import BugSystem
+
+
+class CountingTracker(IssueTrackerType):  # pylint: disable=abstract-method
+    """
+    Returns a new client object on every connection!
+    """
+
+    connections = 0
+
+    def _rpc_connection(self):
+        CountingTracker.connections += 1
+        return Mock()
+
+
+class TestRpcConnectionPool(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.bug_system = BugSystem.objects.create(  # nosec:B106
+            name="Counting tracker",
+            tracker_type="tcms.issuetracker.tests.test_base.CountingTracker",
+            base_url="https://tracker.example.com",
+            api_url="https://tracker.example.com/api",
+            api_username="kiwi",
+            api_password="secret",
+        )
+
+    def setUp(self):
+        super().setUp()
+        forget_rpc_connections()
+        CountingTracker.connections = 0
+
+    def connect(self):
+        return CountingTracker(self.bug_system, None).rpc
+
+    def test_client_is_reused_between_trackers(self):
+        first = self.connect()
+        second = self.connect()
+
+        self.assertIs(first, second)
+        self.assertEqual(CountingTracker.connections, 1)
+
+    def test_new_client_when_credentials_change(self):
+        first = self.connect()
+
+        self.bug_system.api_password = "new-secret"  # nosec:B105
+        second = self.connect()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(CountingTracker.connections, 2)
+
+    def test_clients_are_dropped_when_bug_system_changes(self):
+        first = self.connect()
+
+        self.bug_system.name = "Renamed tracker"
+        self.bug_system.save()
+        first.close.assert_called_once_with()
+
+        self.connect()
+        self.assertEqual(CountingTracker.connections, 2)
+
+    def connect_in_thread(self, clients, connected=None, resume=None):
+        clients.append(self.connect())
+        if connected is not None:
+            connected.set()
+            resume.wait(timeout=5)
+        clients.append(self.connect())
+
+    def test_clients_are_not_shared_between_threads(self):
+        first = self.connect()
+
+        clients = []
+        worker = threading.Thread(target=self.connect_in_thread, args=(clients,))
+        worker.start()
+        worker.join()
+
+        self.assertIsNot(first, clients[0])
+        self.assertIs(clients[0], clients[1])
+        self.assertEqual(CountingTracker.connections, 2)
+
+    def test_other_threads_drop_forgotten_clients(self):
+        clients = []
+        connected = threading.Event()
+        forgotten = threading.Event()
+        worker = threading.Thread(
+            target=self.connect_in_thread, args=(clients, connected, forgotten)
+        )
+        worker.start()
+        connected.wait(timeout=5)
+        forget_rpc_connections(self.bug_system.pk)
+        forgotten.set()
+        worker.join()
+
+        self.assertIsNot(clients[0], clients[1])
+        clients[0].close.assert_called_once_with()
+
+    def test_close_rpc_connections(self):
+        first = self.connect()
+
+        close_rpc_connections()
+        first.close.assert_called_once_with()
+
+        self.assertIsNot(first, self.connect())
+
+    @override_settings(ISSUE_TRACKER_CLIENT_IDLE_TIMEOUT=60)
+    def test_idle_clients_are_evicted(self):
+        with patch("tcms.issuetracker.base.time.monotonic", return_value=1000):
+            first = self.connect()
+
+        with patch("tcms.issuetracker.base.time.monotonic", return_value=1050):
+            self.connect()
+        self.assertEqual(CountingTracker.connections, 1)
+
+        with patch("tcms.issuetracker.base.time.monotonic", return_value=1111):
+            self.connect()
+        self.assertEqual(CountingTracker.connections, 2)
+        first.close.assert_called_once_with()
+
+    def test_disabled_tracker_does_not_connect(self):
+        self.bug_system.api_password = ""
+
+        self.assertIsNone(self.connect())
+        self.assertEqual(CountingTracker.connections, 0)
@@ -4,6 +4,8 @@ import os
 import unittest
 from urllib.parse import urlencode
 
+from django.core.management import call_command
+
 from tcms.core.contrib.linkreference.models import LinkReference
 from tcms.issuetracker.types import Bugzilla
 from tcms.management.models import Version
@@ -103,6 +105,9 @@ class TestBugzillaIntegration(APITestCase):
             True,
         )
 
+        # comments are posted in the background
+        call_command("post_tracker_comments", "--once")
+
         # making sure RPC above returned the same URL
         self.assertEqual(self.existing_bug_url, result["url"])
 
@@ -4,6 +4,7 @@ import os
 import time
 import unittest
 
+from django.core.management import call_command
 from django.utils import timezone
 
 from tcms.core.contrib.linkreference.models import LinkReference
@@ -64,6 +65,14 @@ class TestGitHubIntegration(APITestCase):
         self.assertEqual("Hello GitHub", result["title"])
         self.assertEqual(self.existing_bug_url, result["url"])
 
+    def test_details_many_returns_the_same_as_details(self):
+        result = self.integration.details_many([self.existing_bug_url])
+
+        self.assertEqual(
+            {self.existing_bug_url: self.integration.details(self.existing_bug_url)},
+            result,
+        )
+
     def test_details_for_private_url(self):
         bug_system = BugSystem.objects.create(  # nosec:B106:hardcoded_password_funcarg
             name="Private GitHub for kiwitcms/private-test-github-integration",
@@ -112,6 +121,9 @@ class TestGitHubIntegration(APITestCase):
             True,
         )
 
+        # comments are posted in the background
+        call_command("post_tracker_comments", "--once")
+
         # making sure RPC above returned the same URL
         self.assertEqual(self.existing_bug_url, result["url"])
 
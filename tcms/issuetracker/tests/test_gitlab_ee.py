@@ -4,6 +4,8 @@ import os
 import time
 import unittest
 
+from django.core.management import call_command
+
 from tcms.core.contrib.linkreference.models import LinkReference
 from tcms.issuetracker.types import Gitlab
 from tcms.rpc.tests.utils import APITestCase
@@ -138,6 +140,12 @@ class TestGitlabIntegration(APITestCase):
             True,
         )
 
+        # comments are posted in the background
+        call_command("post_tracker_comments", "--once")
+
+        # comments are posted in the background
+        call_command("post_tracker_comments", "--once")
+
         # making sure RPC above returned the same URL
         self.assertEqual(self.existing_bug_url, result["url"])
 
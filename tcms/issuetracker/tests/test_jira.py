@@ -4,6 +4,7 @@ import os
 import time
 import unittest
 
+from django.core.management import call_command
 from django.utils import timezone
 
 from tcms.core.contrib.linkreference.models import LinkReference
@@ -69,6 +70,14 @@ class TestJIRAIntegration(APITestCase):
         self.assertEqual("Hello Jira Cloud", result["title"])
         self.assertEqual(self.existing_bug_url, result["url"])
 
+    def test_details_many_returns_the_same_as_details(self):
+        result = self.integration.details_many([self.existing_bug_url])
+
+        self.assertEqual(
+            {self.existing_bug_url: self.integration.details(self.existing_bug_url)},
+            result,
+        )
+
     def test_auto_update_bugtracker(self):
         issue = self.integration.rpc.issue(self.existing_bug_id)
 
@@ -89,6 +98,9 @@ class TestJIRAIntegration(APITestCase):
             True,
         )
 
+        # comments are posted in the background
+        call_command("post_tracker_comments", "--once")
+
         # making sure RPC above returned the same URL
         self.assertEqual(self.existing_bug_url, result["url"])
 
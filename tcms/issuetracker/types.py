@@ -49,6 +49,8 @@ class JIRA(IssueTrackerType):
         Otherwise you may see 400, 414 and/or 500 errors!
     """
 
+    details_errors = IssueTrackerType.details_errors + (jira.exceptions.JIRAError,)
+
     def _rpc_connection(self):
         if hasattr(settings, "JIRA_OPTIONS"):
             options = settings.JIRA_OPTIONS
@@ -90,6 +92,37 @@ class JIRA(IssueTrackerType):
         except jira.exceptions.JIRAError:
             return super().details(url)
 
+    def details_many(self, urls):
+        """
+        Fetch all issues with a single JQL search. Issues which are not
+        returned by the search, e.g. moved ones, fall back to :meth:`details`.
+        """
+        urls_by_key = self.urls_by_bug_id(urls)
+        result = {}
+        try:
+            keys = ", ".join(f'"{key}"' for key in urls_by_key)
+            issues = self.rpc.search_issues(
+                f"key in ({keys})",
+                maxResults=len(urls_by_key),
+                fields="summary,description,status",
+            )
+            for issue in issues:
+                for url in urls_by_key.pop(issue.key, []):
+                    result[url] = {
+                        "id": issue.key,
+                        "description": issue.fields.description,
+                        "status": issue.fields.status.name,
+                        "title": issue.fields.summary,
+                        "url": url,
+                    }
+        except jira.exceptions.JIRAError:
+            pass
+
+        for remaining in urls_by_key.values():
+            for url, values in super().details_many(remaining).items():
+                result[url] = values
+        return result
+
     def get_issue_type_from_jira(self, project_key):
         """
         Returns the issue type from the actual Jira instance.
@@ -178,8 +211,8 @@ class JIRA(IssueTrackerType):
             f"{url}secure/CreateIssueDetails!init.jspa?" + urlencode(args, True),
         )
 
-    def post_comment(self, execution, bug_id):
-        self.rpc.add_comment(bug_id, self.text(execution))
+    def post_text(self, bug_id, text):
+        self.rpc.add_comment(bug_id, text)
 
 
 class GitHub(IssueTrackerType):
@@ -195,6 +228,8 @@ class GitHub(IssueTrackerType):
         the integration code doesn't use them!
     """
 
+    details_errors = IssueTrackerType.details_errors + (github.GithubException,)
+
     def _rpc_connection(self):
         _, api_password = self.rpc_credentials
 
@@ -251,14 +286,68 @@ class GitHub(IssueTrackerType):
             "url": url,
         }
 
+    def details_many(self, urls):
+        """
+        Fetch all issues and pull requests with a single GraphQL query.
+        Numbers which are not found fall back to :meth:`details`.
+        """
+        urls_by_number = self.urls_by_bug_id(urls)
+        owner, name = self.repo_id.split("/", 1)
+
+        try:
+            _headers, data = self.rpc.requester.graphql_query(
+                self.graphql_issues_query(urls_by_number),
+                {"owner": owner, "name": name},
+            )
+        except github.GithubException as err:
+            # unknown numbers are reported as errors next to the partial result
+            data = err.data if isinstance(err.data, dict) else {}
+
+        result = {}
+        issues = (data.get("data") or {}).get("repository") or {}
+        for issue in filter(None, issues.values()):
+            for url in urls_by_number.pop(issue["number"], []):
+                result[url] = {
+                    "id": issue["number"],
+                    "description": issue["body"],
+                    # the REST API returns lower case values
+                    "status": issue["state"].lower(),
+                    "title": issue["title"],
+                    "url": url,
+                }
+
+        for remaining in urls_by_number.values():
+            for url, values in super().details_many(remaining).items():
+                result[url] = values
+        return result
+
+    @staticmethod
+    def graphql_issues_query(numbers):
+        """
+        Returns a GraphQL query for the issues or pull requests with the
+        given numbers, each one aliased as ``issue<number>``!
+        """
+        fields = "number title body state"
+        aliases = ""
+        for number in numbers:
+            aliases += (
+                f" issue{number}: issueOrPullRequest(number: {number}) {{"
+                f" ... on Issue {{ {fields} }} ... on PullRequest {{ {fields} }} }}"
+            )
+
+        return (
+            "query($owner: String!, $name: String!) {"
+            f" repository(owner: $owner, name: $name) {{{aliases} }} }}"
+        )
+
     @property
     def repo_id(self):
         return github_repo_id(self.bug_system.base_url)
 
-    def post_comment(self, execution, bug_id):
+    def post_text(self, bug_id, text):
         repo = self.rpc.get_repo(self.repo_id)
 
-        repo.get_issue(bug_id).create_comment(self.text(execution))
+        repo.get_issue(bug_id).create_comment(text)
 
 
 class Gitlab(IssueTrackerType):
@@ -277,6 +366,8 @@ class Gitlab(IssueTrackerType):
         the integration code doesn't use it!
     """
 
+    details_errors = IssueTrackerType.details_errors + (gitlab.exceptions.GitlabError,)
+
     def _rpc_connection(self):
         _, api_password = self.rpc_credentials
 
@@ -325,10 +416,10 @@ class Gitlab(IssueTrackerType):
     def repo_id(self):
         return urlparse(self.bug_system.base_url).path.strip("/")
 
-    def post_comment(self, execution, bug_id):
+    def post_text(self, bug_id, text):
         repo = self.rpc.projects.get(self.repo_id)
 
-        repo.issues.get(bug_id).notes.create({"body": self.text(execution)})
+        repo.issues.get(bug_id).notes.create({"body": text})
 
 
 class Redmine(IssueTrackerType):
@@ -347,6 +438,10 @@ class Redmine(IssueTrackerType):
     (or ``https://<your-redmine-instance>/my/account`` if self-hosted).
     """
 
+    details_errors = IssueTrackerType.details_errors + (
+        redminelib.exceptions.BaseRedmineError,
+    )
+
     def is_adding_testcase_to_issue_disabled(self):
         _api_username, api_password = self.rpc_credentials
 
@@ -382,6 +477,36 @@ class Redmine(IssueTrackerType):
         except redminelib.exceptions.ResourceNotFoundError:
             return super().details(url)
 
+    def details_many(self, urls):
+        """
+        Fetch all issues with a single filtered request. Issues which are
+        not returned fall back to :meth:`details`.
+        """
+        urls_by_id = self.urls_by_bug_id(urls)
+        result = {}
+        try:
+            issues = self.rpc.issue.filter(
+                issue_id=",".join(map(str, urls_by_id)),
+                status_id="*",
+                limit=len(urls_by_id),
+            )
+            for issue in issues:
+                for url in urls_by_id.pop(issue.id, []):
+                    result[url] = {
+                        "id": issue.id,
+                        "description": issue.description,
+                        "status": issue.status.name,
+                        "title": issue.subject,
+                        "url": url,
+                    }
+        except redminelib.exceptions.BaseRedmineError:
+            pass
+
+        for remaining in urls_by_id.values():
+            for url, values in super().details_many(remaining).items():
+                result[url] = values
+        return result
+
     def redmine_project_by_name(self, name):
         """
         Return a Redmine project which matches the given product name.
@@ -447,5 +572,5 @@ class Redmine(IssueTrackerType):
 
         return (new_issue, new_url)
 
-    def post_comment(self, execution, bug_id):
-        self.rpc.issue.get(bug_id).save(notes=self.text(execution))
+    def post_text(self, bug_id, text):
+        self.rpc.issue.get(bug_id).save(notes=text)
@@ -151,7 +151,7 @@ class TestRegistration(TestCase):
         self.assertEqual(1, signal_mock.call_count)
 
     @override_settings(ADMINS=[("Test Admin", "admin@kiwitcms.org")])
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_signal_handler_notifies_admins(self, send_mail):
         # connect the handler b/c it is not connected by default
         signals.USER_REGISTERED_SIGNAL.connect(signals.notify_admins)
@@ -186,7 +186,7 @@ Go to %(user_url)s to activate the account!""") % values
         finally:
             signals.USER_REGISTERED_SIGNAL.disconnect(signals.notify_admins)
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_register_user_by_email_confirmation(self, send_mail):
         response, user = self.assert_user_registration("new-tester", follow=True)
         self.assertContains(
@@ -221,7 +221,6 @@ Kiwi TCMS""") % values + "\n"
             expected_body,
             settings.DEFAULT_FROM_EMAIL,
             ["new-tester@example.com"],
-            fail_silently=False,
         )
 
     @override_settings(
@@ -1,20 +1,36 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.core.cache import cache
-from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
-from tcms.rpc.api.utils import tracker_from_url
+from tcms.issuetracker.base import IssueTrackerType, close_rpc_connections
+from tcms.rpc.api.utils import tracker_class, tracker_from_url
 from tcms.rpc.decorators import django_login_required, permissions_required
 from tcms.rpc.views import rpc_method
 from tcms.testcases.models import BugSystem
 from tcms.testruns.models import TestExecution
 
+# conditional import b/c this App can be disabled
+if "tcms.bugs.apps.AppConfig" in settings.INSTALLED_APPS:
+    from tcms.issuetracker.kiwitcms import KiwiTCMS
+else:
+
+    class KiwiTCMS:  # pylint: disable=remove-empty-class,nested-class-found,too-few-public-methods
+        pass
+
+
+logger = logging.getLogger(__name__)
+
 
 @rpc_method(
     name="Bug.details",
     auth=django_login_required,
     context_target="rpc_context",
 )
-def details(url, rpc_context=None):
+async def details(url, rpc_context=None):
     """
     .. function:: RPC Bug.details(url)
 
@@ -29,21 +45,154 @@ def details(url, rpc_context=None):
         :return: Detailed information about this URL. Depends on the underlying
                  issue tracker.
         :rtype: dict
+
+        .. versionchanged:: 16.3
+
+            When called via the ``/async/json-rpc/`` or ``/async/xml-rpc/``
+            end-points external issue trackers are queried in a thread pool
+            so that slow trackers don't block other API calls. Multiple
+            ``Bug.details`` calls inside a JSON-RPC batch are executed
+            concurrently.
+
+            Details are cached for ``settings.BUG_DETAILS_CACHE_TIMEOUT``
+            seconds. If the issue tracker can't be reached an empty dict is
+            returned and cached for
+            ``settings.BUG_DETAILS_FAILURE_CACHE_TIMEOUT`` seconds.
     """
-    result = cache.get(url)
-    if result:
+    # note: details which could not be fetched are cached as {}
+    result = await cache.aget(url)
+    if result is not None:
         return result
 
     request = rpc_context.request
-    tracker = tracker_from_url(url, request)
+    tracker = await sync_to_async(tracker_from_url)(url, request)
     if not tracker:
         return {}
 
-    result = dict(tracker.details(url))
-    cache.set(url, result)
+    # Kiwi TCMS' own tracker reads from the database while all others wait
+    # on the network and don't need to run in the thread of this request
+    tracker_details = sync_to_async(
+        tracker.details, thread_sensitive=isinstance(tracker, KiwiTCMS)
+    )
+    try:
+        result = dict(await tracker_details(url))
+    except tracker.details_errors as err:
+        logger.warning("Fetching details for %s failed: %s", url, err)
+        await cache.aset(url, {}, settings.BUG_DETAILS_FAILURE_CACHE_TIMEOUT)
+        return {}
+
+    await cache.aset(url, result, settings.BUG_DETAILS_CACHE_TIMEOUT)
+    return result
+
+
+@rpc_method(
+    name="Bug.details_many",
+    auth=django_login_required,
+    context_target="rpc_context",
+)
+def details_many(urls, rpc_context=None):
+    """
+    .. function:: RPC Bug.details_many(urls)
+
+        Returns details about multiple bugs, see :func:`Bug.details`.
+        URLs are grouped by issue tracker and fetched concurrently. Trackers
+        which support it are queried with a single request for all of their
+        bugs.
+
+        :param urls: URL addresses
+        :type urls: list(str)
+        :param rpc_context: Provides access to the current request, protocol,
+                entry point name and handler instance from the rpc method
+        :type rpc_context: modernrpc.core.RpcRequestContext
+        :return: Detailed information keyed by URL. The value is an empty
+                 dict if the URL isn't from a known issue tracker or if
+                 its details could not be fetched
+        :rtype: dict
+
+        .. versionadded:: 16.3
+    """
+    result = cache.get_many(urls)
+
+    request = rpc_context.request
+    groups = {}
+    for url in urls:
+        if url in result:
+            continue
+
+        tracker = tracker_from_url(url, request)
+        if not tracker:
+            result[url] = {}
+            continue
+
+        groups.setdefault(tracker.bug_system.pk, (tracker, []))[1].append(url)
+
+    fetched = _fetch_details(groups.values())
+    failed = {}
+    for _tracker, tracker_urls in groups.values():
+        for url in tracker_urls:
+            result[url] = fetched.get(url, {})
+            if url not in fetched:
+                failed[url] = {}
+
+    cache.set_many(fetched, settings.BUG_DETAILS_CACHE_TIMEOUT)
+    cache.set_many(failed, settings.BUG_DETAILS_FAILURE_CACHE_TIMEOUT)
+    return result
+
+
+def _fetch_details(groups):
+    """
+    Calls ``details_many()`` for each tracker in a bounded thread pool.
+    URLs for trackers which don't implement a bulk API are split between
+    several tasks!
+    """
+    result = {}
+    futures = []
+    local = []
+    workers = settings.BUG_DETAILS_MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for tracker, urls in groups:
+            if isinstance(tracker, KiwiTCMS):
+                # reads from the database, in the thread of this request
+                local.append((tracker, urls))
+            elif type(tracker).details_many is IssueTrackerType.details_many:
+                for start in range(min(workers, len(urls))):
+                    chunk = urls[start::workers]
+                    futures.append(
+                        (tracker, chunk, pool.submit(_details_many, tracker, chunk))
+                    )
+            else:
+                futures.append(
+                    (tracker, urls, pool.submit(_details_many, tracker, urls))
+                )
+
+        # while remote trackers are being queried
+        for tracker, urls in local:
+            for url, values in tracker.details_many(urls).items():
+                result[url] = dict(values)
+
+        for tracker, urls, future in futures:
+            try:
+                for url, values in future.result().items():
+                    result[url] = dict(values)
+            except tracker.details_errors as err:
+                logger.warning(
+                    "Fetching details for %s failed: %s", ", ".join(urls), err
+                )
+
     return result
 
 
+def _details_many(tracker, urls):
+    """
+    Runs in a worker thread which exits together with the pool,
+    so clients connected in it can't be reused afterwards!
+    """
+    try:
+        return tracker.details_many(urls)
+    finally:
+        close_rpc_connections()
+
+
 @rpc_method(
     name="Bug.report",
     auth=permissions_required(
@@ -78,7 +227,7 @@ def report(execution_id, tracker_id, rpc_context=None):
 
     execution = TestExecution.objects.get(pk=execution_id)
     bug_system = BugSystem.objects.get(pk=tracker_id)
-    tracker = import_string(bug_system.tracker_type)(bug_system, request)
+    tracker = tracker_class(bug_system.tracker_type)(bug_system, request)
     if not tracker.is_adding_testcase_to_issue_disabled():
         url = tracker.report_issue_from_testexecution(execution, request.user)
         response = {"rc": 0, "response": url}
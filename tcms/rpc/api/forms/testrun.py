@@ -1,3 +1,5 @@
+from collections.abc import Hashable
+
 from django import forms
 
 from tcms.core.forms.fields import UserField
@@ -70,6 +72,56 @@ class UpdateExecutionForm(  # pylint: disable=remove-empty-class,too-many-ancest
     pass
 
 
+class CachedClean:  # pylint: disable=too-few-public-methods
+    """
+    Replaces ``Field.clean()`` and remembers its results in *lookup_cache*,
+    keyed by field name and input value!
+    """
+
+    def __init__(self, clean, name, lookup_cache):
+        self.clean = clean
+        self.name = name
+        self.lookup_cache = lookup_cache
+
+    def __call__(self, value):
+        if not isinstance(value, Hashable):
+            # e.g. a list, let the field report the error
+            return self.clean(value)
+
+        key = (self.name, value)
+        if key not in self.lookup_cache:
+            self.lookup_cache[key] = self.clean(value)
+        return self.lookup_cache[key]
+
+
+class BulkUpdateExecutionForm(  # pylint: disable=too-many-ancestors
+    UpdateExecutionForm
+):
+    """
+    Used by ``TestExecution.bulk_update()``. Validation results for
+    related objects are shared via ``lookup_cache`` between all forms
+    in the same batch so that thousands of executions which point to
+    the same status, build or user don't query the DB for each one of them!
+    """
+
+    cached_fields = ("assignee", "tested_by", "build", "status", "case", "run")
+
+    def __init__(self, *args, **kwargs):
+        lookup_cache = kwargs.pop("lookup_cache", {})
+        super().__init__(*args, **kwargs)
+
+        for name in self.cached_fields:
+            field = self.fields[name]
+            field.clean = CachedClean(field.clean, name, lookup_cache)
+
+    def _get_validation_exclusions(self):
+        # related objects have already been fetched from the DB by the form fields
+        # so there's no need for Model.full_clean() to check their existence again
+        exclude = super()._get_validation_exclusions()
+        exclude.update(self.cached_fields)  # pylint: disable=objects-update-used
+        return exclude
+
+
 class UserForm(forms.Form):  # pylint: disable=must-inherit-from-model-form
     user = UserField()
 
@@ -3,6 +3,7 @@ from django.forms.models import model_to_dict
 
 from tcms.management.forms import TagForm
 from tcms.management.models import Tag
+from tcms.rpc import utils
 from tcms.rpc.decorators import permissions_required
 from tcms.rpc.views import rpc_method
 
@@ -11,23 +12,35 @@ from tcms.rpc.views import rpc_method
     name="Tag.filter",
     auth=permissions_required("management.view_tag"),
 )
-def filter(query):  # pylint: disable=redefined-builtin
+def filter(query, limit=None, after_id=None):  # pylint: disable=redefined-builtin
     """
-    .. function:: RPC Tag.filter(query)
+    .. function:: RPC Tag.filter(query, limit, after_id)
 
         Search and return a list of tags
 
         :param query: Field lookups for :class:`tcms.management.models.Tag`
         :type query: dict
+        :param limit: If specified return at most this many objects and a cursor
+                      for the next page, see :func:`tcms.rpc.utils.paginate`
+        :type limit: int
+        :param after_id: Only return objects with PK greater than this value
+        :type after_id: int
         :return: Serialized list of :class:`tcms.management.models.Tag` objects
-        :rtype: list(dict)
+                 or a dictionary with ``results`` and ``next_cursor`` when
+                 ``limit`` is specified
+        :rtype: list(dict) or dict
+
+    .. versionchanged:: 16.3
+        Added the ``limit`` and ``after_id`` parameters
     """
     fields_list = ["id", "name", "case", "plan", "run", "execution"]
     if "tcms.bugs.apps.AppConfig" in settings.INSTALLED_APPS:
         fields_list.append("bugs")
 
-    return list(
-        Tag.objects.filter(**query).values(*fields_list).order_by("id").distinct()
+    return utils.paginate(
+        Tag.objects.filter(**query).values(*fields_list).order_by("id").distinct(),
+        limit,
+        after_id,
     )
 
 
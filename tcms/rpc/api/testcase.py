@@ -1,8 +1,8 @@
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
+from django.db.models import Q
 from django.db.models.functions import Coalesce
-from django.db.utils import NotSupportedError
 from django.forms import EmailField, ValidationError
 from django.forms.models import model_to_dict
 
@@ -270,70 +270,111 @@ def create(values, rpc_context=None):
     raise ValueError(list(form.errors.items()))
 
 
+# fields which can be returned by TestCase.filter()
+FILTER_FIELDS = (
+    "id",
+    "create_date",
+    "history_date",
+    "is_automated",
+    "script",
+    "arguments",
+    "extra_link",
+    "summary",
+    "requirement",
+    "notes",
+    "text",
+    "case_status",
+    "case_status__name",
+    "category",
+    "category__name",
+    "priority",
+    "priority__value",
+    "author",
+    "author__username",
+    "default_tester",
+    "default_tester__username",
+    "reviewer",
+    "reviewer__username",
+    "setup_duration",
+    "testing_duration",
+    "expected_duration",
+)
+
+
 @rpc_method(
     name="TestCase.filter",
     auth=permissions_required("testcases.view_testcase"),
+    safe=(
+        "id",
+        "create_date",
+        "history_date",
+        "is_automated",
+        "case_status",
+        "category",
+        "priority",
+        "author",
+        "default_tester",
+        "reviewer",
+    ),
 )
-def filter(query=None):  # pylint: disable=redefined-builtin
+def filter(  # pylint: disable=redefined-builtin
+    query=None, limit=None, after_id=None, fields=None
+):
     """
-    .. function:: RPC TestCase.filter(query)
+    .. function:: RPC TestCase.filter(query, limit, after_id, fields)
 
         Perform a search and return the resulting list of test cases
         augmented with their latest ``text``.
 
         :param query: Field lookups for :class:`tcms.testcases.models.TestCase`
         :type query: dict
-        :return: Serialized list of :class:`tcms.testcases.models.TestCase` objects.
-        :rtype: list(dict)
+        :param limit: If specified return at most this many objects and a cursor
+                      for the next page, see :func:`tcms.rpc.utils.paginate`
+        :type limit: int
+        :param after_id: Only return objects with PK greater than this value
+        :type after_id: int
+        :param fields: Names of the fields to return, defaults to all of them.
+                       ``id`` is always included
+        :type fields: list(str)
+        :return: Serialized list of :class:`tcms.testcases.models.TestCase` objects
+                 or a dictionary with ``results`` and ``next_cursor`` when
+                 ``limit`` is specified
+        :rtype: list(dict) or dict
+        :raises ValueError: if *fields* contains unsupported field names
+
+    .. versionchanged:: 16.3
+        Added the ``limit``, ``after_id`` and ``fields`` parameters
     """
     if query is None:
         query = {}
 
-    test_case_ids = TestCase.objects.filter(**query).values("id")
+    values = utils.select_fields(fields, FILTER_FIELDS)
+
+    test_cases = TestCase.objects.filter(**query)
+    # note: queries from HistoricalTestCase, only the latest record for each TC
     qs = (
-        # note: queries from HistoricalTestCase
-        TestCase.history.annotate(  # pylint: disable=no-member
+        TestCase.history.filter(  # pylint: disable=no-member
+            Q(latest_for__case__in=test_cases.values("id"))
+            # test cases without a pointer, e.g. after loaddata, fall back to
+            # their newest historical record
+            | Q(
+                history_id__in=utils.latest_history_ids(
+                    TestCase.history.filter(  # pylint: disable=no-member
+                        id__in=test_cases.filter(latest_history=None).values("id")
+                    )
+                )
+            )
+        )
+        .annotate(
             expected_duration=Coalesce("setup_duration", timedelta(0))
             + Coalesce("testing_duration", timedelta(0))
         )
-        .filter(id__in=test_case_ids)
-        .values(
-            "id",
-            "create_date",
-            "history_date",
-            "is_automated",
-            "script",
-            "arguments",
-            "extra_link",
-            "summary",
-            "requirement",
-            "notes",
-            "text",
-            "case_status",
-            "case_status__name",
-            "category",
-            "category__name",
-            "priority",
-            "priority__value",
-            "author",
-            "author__username",
-            "default_tester",
-            "default_tester__username",
-            "reviewer",
-            "reviewer__username",
-            "setup_duration",
-            "testing_duration",
-            "expected_duration",
-        )
-        .order_by("id", "-history_date")
+        .values(*values)
+        .order_by("id")
         .distinct()
     )
 
-    try:
-        return list(qs.distinct("id"))
-    except NotSupportedError:
-        # DISTINCT ON fields is supported only on PostgreSQL
-        return list(utils.filter_distinct(qs))
+    return utils.paginate(qs, limit, after_id)
 
 
 @rpc_method(
@@ -1,21 +1,38 @@
+import copy
+from collections import Counter
 from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import F
+from django.db import transaction
+from django.db.models import F, Max
 from django.db.models.functions import Coalesce
 from django.forms.models import model_to_dict
+from simple_history.utils import bulk_update_with_history
 
 from tcms.core.contrib.linkreference.models import LinkReference
 from tcms.core.helpers import comments
+from tcms.core.history import diff_objects
 from tcms.management.models import Tag
 from tcms.rpc import utils
 from tcms.rpc.api.forms.testexecution import LinkReferenceForm
-from tcms.rpc.api.forms.testrun import NewExecutionForm, UpdateExecutionForm
+from tcms.rpc.api.forms.testrun import (
+    BulkUpdateExecutionForm,
+    NewExecutionForm,
+    UpdateExecutionForm,
+)
 from tcms.rpc.api.utils import tracker_from_url
 from tcms.rpc.decorators import permissions_required
 from tcms.rpc.views import rpc_method
-from tcms.testruns.models import TestExecution, TestExecutionProperty, TestExecutionTag
+from tcms.testcases.models import TestCase
+from tcms.testruns.models import (
+    OpenTestRun,
+    PendingTrackerComment,
+    TestExecution,
+    TestExecutionProperty,
+    TestExecutionTag,
+    TestRunStatusCount,
+)
 
 # conditional import b/c this App can be disabled
 if "tcms.bugs.apps.AppConfig" in settings.INSTALLED_APPS:
@@ -116,54 +133,97 @@ def get_comments(execution_id):
     return list(execution_comments)
 
 
+# fields which can be returned by TestExecution.filter()
+FILTER_FIELDS = (
+    "id",
+    "assignee",
+    "assignee__username",
+    "tested_by",
+    "tested_by__username",
+    "case_text_version",
+    "start_date",
+    "stop_date",
+    "sortkey",
+    "run",
+    "case",
+    "case__summary",
+    "build",
+    "build__name",
+    "status",
+    "status__name",
+    "status__icon",
+    "status__color",
+    "expected_duration",
+    "actual_duration",
+)
+
+FILTER_ANNOTATIONS = {
+    "expected_duration": Coalesce("case__setup_duration", timedelta(0))
+    + Coalesce("case__testing_duration", timedelta(0)),
+    "actual_duration": F("stop_date") - F("start_date"),
+}
+
+
 @rpc_method(
     name="TestExecution.filter",
     auth=permissions_required("testruns.view_testexecution"),
+    safe=(
+        "id",
+        "assignee",
+        "tested_by",
+        "case_text_version",
+        "start_date",
+        "stop_date",
+        "sortkey",
+        "run",
+        "case",
+        "build",
+        "status",
+    ),
 )
-def filter(query):  # pylint: disable=redefined-builtin
+def filter(  # pylint: disable=redefined-builtin
+    query, limit=None, after_id=None, fields=None
+):
     """
-    .. function:: RPC TestExecution.filter(query)
+    .. function:: RPC TestExecution.filter(query, limit, after_id, fields)
 
         Perform a search and return the resulting list of test case executions.
 
         :param query: Field lookups for :class:`tcms.testruns.models.TestExecution`
         :type query: dict
+        :param limit: If specified return at most this many objects and a cursor
+                      for the next page, see :func:`tcms.rpc.utils.paginate`
+        :type limit: int
+        :param after_id: Only return objects with PK greater than this value
+        :type after_id: int
+        :param fields: Names of the fields to return, defaults to all of them.
+                       ``id`` is always included
+        :type fields: list(str)
         :return: List of serialized :class:`tcms.testruns.models.TestExecution` objects
-        :rtype: list(dict)
+                 or a dictionary with ``results`` and ``next_cursor`` when
+                 ``limit`` is specified
+        :rtype: list(dict) or dict
+        :raises ValueError: if *fields* contains unsupported field names
+
+    .. versionchanged:: 16.3
+        Added the ``limit``, ``after_id`` and ``fields`` parameters
     """
-    return list(
-        TestExecution.objects.annotate(
-            expected_duration=(
-                Coalesce("case__setup_duration", timedelta(0))
-                + Coalesce("case__testing_duration", timedelta(0))
-            ),
-            actual_duration=F("stop_date") - F("start_date"),
-        )
+    values = utils.select_fields(fields, FILTER_FIELDS)
+
+    # annotate only when returned or searched for to avoid unnecessary JOINs
+    annotations = {}
+    for name, expression in FILTER_ANNOTATIONS.items():
+        if name in values or any(key.split("__")[0] == name for key in query):
+            annotations[name] = expression
+
+    return utils.paginate(
+        TestExecution.objects.annotate(**annotations)
         .filter(**query)
-        .values(
-            "id",
-            "assignee",
-            "assignee__username",
-            "tested_by",
-            "tested_by__username",
-            "case_text_version",
-            "start_date",
-            "stop_date",
-            "sortkey",
-            "run",
-            "case",
-            "case__summary",
-            "build",
-            "build__name",
-            "status",
-            "status__name",
-            "status__icon",
-            "status__color",
-            "expected_duration",
-            "actual_duration",
-        )
+        .values(*values)
         .order_by("id")
-        .distinct()
+        .distinct(),
+        limit,
+        after_id,
     )
 
 
@@ -238,6 +298,10 @@ def update(execution_id, values, rpc_context=None):
     else:
         raise ValueError(list(form.errors.items()))
 
+    return _serialize_execution(test_execution)
+
+
+def _serialize_execution(test_execution):
     result = model_to_dict(test_execution)
 
     # augment result with additional information
@@ -254,6 +318,223 @@ def update(execution_id, values, rpc_context=None):
     return result
 
 
+@rpc_method(
+    name="TestExecution.bulk_update",
+    auth=permissions_required("testruns.change_testexecution"),
+    context_target="rpc_context",
+)
+def bulk_update(changes, rpc_context=None):  # pylint: disable=too-many-locals
+    """
+    .. function:: RPC TestExecution.bulk_update(changes)
+
+        Update multiple TestExecution objects with a single call. Same rules
+        as for ``TestExecution.update()`` apply for each individual change.
+        Objects are validated in bulk and then written to the database, together
+        with their history records, using a handful of queries.
+
+        :param changes: List of field values for
+                        :class:`tcms.testruns.models.TestExecution`. Each item must
+                        contain an ``id`` key which specifies the object to modify!
+        :type changes: list(dict)
+        :param rpc_context: Provides access to the current request, protocol,
+                entry point name and handler instance from the rpc method
+        :type rpc_context: modernrpc.core.RpcRequestContext
+        :return: List of results, in the same order as *changes*. Successfully
+                 updated items are ``{"id": int, "result": dict}`` where ``result``
+                 is the same as returned by ``TestExecution.update()``. Failed items
+                 are ``{"id": int, "error": dict}`` where ``error`` contains
+                 validation messages for each field. Items which are not
+                 dictionaries, don't have an integer ``id`` or specify the
+                 same ``id`` more than once are reported as failed
+        :rtype: list(dict)
+        :raises PermissionDenied: if missing *testruns.change_testexecution* permission
+
+    .. versionadded:: 16.3
+    """
+    request = rpc_context.request
+
+    occurrences = Counter(item["id"] for item in changes if _is_execution_change(item))
+    executions = (
+        TestExecution.objects.select_related(
+            "assignee", "tested_by", "case", "run", "build", "status"
+        )
+        .prefetch_related("tag")
+        .in_bulk(occurrences.keys())
+    )
+
+    latest_versions = {}
+    if any(
+        _is_execution_change(item) and item.get("case_text_version") == "latest"
+        for item in changes
+    ):
+        latest_versions = dict(
+            TestCase.history.filter(  # pylint: disable=no-member
+                id__in={execution.case_id for execution in executions.values()}
+            )
+            .values("id")
+            .annotate(latest=Max("history_id"))
+            .values_list("id", "latest")
+        )
+
+    original_assignees = {
+        pk: (execution.run_id, execution.assignee_id)
+        for pk, execution in executions.items()
+    }
+
+    # pre-seed with related objects which were already loaded via select_related().
+    # Users aren't included b/c their queryset may be limited to the current tenant
+    lookup_cache = {}
+    for execution in executions.values():
+        for name in ("case", "run", "build", "status"):
+            lookup_cache[(name, getattr(execution, f"{name}_id"))] = getattr(
+                execution, name
+            )
+
+    results = []
+    updated = []
+    updated_fields = set()
+    fields_included = (
+        TestExecution.history.model.tracked_fields  # pylint: disable=no-member
+    )
+    for item in changes:
+        error = _change_error(item, occurrences, executions)
+        if error:
+            results.append(error)
+            continue
+
+        values = dict(item)
+        execution_id = values.pop("id")
+        test_execution = executions[execution_id]
+
+        _apply_defaults(values, test_execution, request.user, latest_versions)
+
+        previous = copy.copy(test_execution)
+        form = BulkUpdateExecutionForm(
+            values, instance=test_execution, request=request, lookup_cache=lookup_cache
+        )
+        if not form.is_valid():
+            # form validation has already modified the instance, revert it
+            test_execution.__dict__.update(  # pylint: disable=objects-update-used
+                previous.__dict__
+            )
+            results.append(
+                {
+                    "id": execution_id,
+                    "error": {
+                        field: list(errors) for field, errors in form.errors.items()
+                    },
+                }
+            )
+            continue
+
+        # nothing to write, not even a history record
+        if not form.changed_data:
+            results.append({"id": execution_id, "result": test_execution})
+            continue
+
+        test_execution._change_reason = (  # pylint: disable=protected-access
+            diff_objects(previous, test_execution, fields_included)
+        )
+        updated.append(test_execution)
+        updated_fields.update(  # pylint: disable=objects-update-used
+            name for name in values if name in form.fields
+        )
+        results.append({"id": execution_id, "result": test_execution})
+
+    # note: executions loaded above may have been changed by someone else in
+    # the meantime, update the counters from the locked rows instead
+    statuses = (
+        TestExecution.objects.filter(pk__in={execution.pk for execution in updated})
+        .order_by("pk")
+        .values_list("run", "build", "status")
+    )
+    with transaction.atomic():
+        original_statuses = Counter(statuses.select_for_update())
+        bulk_update_with_history(
+            updated,
+            TestExecution,
+            list(updated_fields),
+            default_user=request.user,
+        )
+        status_deltas = Counter(statuses)
+        status_deltas.subtract(original_statuses)
+        TestRunStatusCount.update_counts(status_deltas)
+        _sync_open_runs(updated, original_assignees)
+
+    for result in results:
+        if "result" in result:
+            result["result"] = _serialize_execution(result["result"])
+
+    return results
+
+
+def _is_execution_change(item):
+    return (
+        isinstance(item, dict)
+        and isinstance(item.get("id"), int)
+        and not isinstance(item["id"], bool)
+    )
+
+
+def _change_error(item, occurrences, executions):
+    """
+    Validate the shape of a single item passed to ``bulk_update()``!
+
+    :return: Error result for this item or ``None`` if it can be processed
+    :rtype: dict
+    """
+    if not isinstance(item, dict):
+        return {"id": None, "error": {"__all__": ["Must be a dictionary"]}}
+
+    execution_id = item.get("id")
+    if not _is_execution_change(item):
+        if not isinstance(execution_id, (str, int, float, type(None))):
+            execution_id = None
+        return {"id": execution_id, "error": {"id": ["Must be an integer"]}}
+
+    if occurrences[execution_id] > 1:
+        return {
+            "id": execution_id,
+            "error": {"id": ["Object may be modified only once per call"]},
+        }
+
+    if execution_id not in executions:
+        return {"id": execution_id, "error": {"id": ["Object does not exist"]}}
+
+    return None
+
+
+def _apply_defaults(values, test_execution, user, latest_versions):
+    """
+    Same defaults as ``TestExecution.update()``, modifies *values* in place!
+    """
+    if values.get("case_text_version") == "latest":
+        values["case_text_version"] = latest_versions.get(test_execution.case_id)
+
+    if values.get("status") and not values.get("tested_by"):
+        values["tested_by"] = user.id
+
+    if values.get("status") and not values.get("build"):
+        values["build"] = test_execution.run.build_id
+
+
+def _sync_open_runs(executions, original_assignees):
+    """
+    Update the open test runs shown on the dashboard for
+    executions which have been reassigned!
+    """
+    run_ids = set()
+    user_ids = set()
+    for execution in executions:
+        run_id, assignee_id = original_assignees[execution.pk]
+        if (run_id, assignee_id) != (execution.run_id, execution.assignee_id):
+            run_ids |= {run_id, execution.run_id}
+            user_ids |= {assignee_id, execution.assignee_id}
+
+    if run_ids:
+        OpenTestRun.sync(run_ids, user_ids)
+
+
 @rpc_method(
     name="TestExecution.add_link",
     auth=permissions_required("linkreference.add_linkreference"),
@@ -269,7 +550,9 @@ def add_link(values, update_tracker=False, rpc_context=None):
                       :class:`tcms.core.contrib.linkreference.models.LinkReference`
         :type values: dict
         :param update_tracker: Automatically update Issue Tracker by placing a comment
-                               linking back to the failed TestExecution.
+                               linking back to the failed TestExecution. The comment
+                               is posted in the background by
+                               ``./manage.py post_tracker_comments``
         :type update_tracker: bool, default=False
         :param rpc_context: Provides access to the current request, protocol,
                 entry point name and handler instance from the rpc method
@@ -299,13 +582,19 @@ def add_link(values, update_tracker=False, rpc_context=None):
     request = rpc_context.request
     tracker = tracker_from_url(link.url, request)
 
-    if (
+    if isinstance(tracker, KiwiTCMS):
+        tracker.add_testexecution_to_issue([link.execution], link.url)
+    elif (
         link.is_defect
         and tracker is not None
         and update_tracker
         and not tracker.is_adding_testcase_to_issue_disabled()
-    ) or isinstance(tracker, KiwiTCMS):
-        tracker.add_testexecution_to_issue([link.execution], link.url)
+    ):
+        PendingTrackerComment.objects.create(
+            bug_system=tracker.bug_system,
+            issue_url=link.url,
+            execution=link.execution,
+        )
 
     return model_to_dict(link)
 
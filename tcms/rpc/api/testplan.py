@@ -1,6 +1,7 @@
 from django.db.models import Count
 from django.forms.models import model_to_dict
 
+from tcms.core.models.base import get_full_urls
 from tcms.management.models import Tag
 from tcms.rpc import utils
 from tcms.rpc.api.forms.testplan import EditPlanForm, NewPlanAPIForm
@@ -352,16 +353,17 @@ def tree(plan_id):
         :raises TestPlan.DoesNotExit: if object specified by PK is missing
     """
     plan = TestPlan.objects.get(pk=plan_id)
+    records = plan.tree_as_list()
     result = []
 
-    for record in plan.tree_as_list():
+    for record, url in zip(records, get_full_urls(records)):
         result.append(
             {
                 "id": record.pk,
                 "name": record.name,
                 "parent_id": record.parent_id,
                 "tree_depth": record.tree_depth,
-                "url": record.get_full_url(),
+                "url": url,
             }
         )
 
@@ -231,23 +231,46 @@ def create(values, rpc_context=None):
 @rpc_method(
     name="TestRun.filter",
     auth=permissions_required("testruns.view_testrun"),
+    safe=(
+        "id",
+        "start_date",
+        "stop_date",
+        "planned_start",
+        "planned_stop",
+        "plan",
+        "build",
+        "build__version",
+        "build__version__product",
+        "manager",
+        "default_tester",
+    ),
 )
-def filter(query=None):  # pylint: disable=redefined-builtin
+def filter(query=None, limit=None, after_id=None):  # pylint: disable=redefined-builtin
     """
-    .. function:: RPC TestRun.filter(query)
+    .. function:: RPC TestRun.filter(query, limit, after_id)
 
         Perform a search and return the resulting list of test runs.
 
         :param query: Field lookups for :class:`tcms.testruns.models.TestRun`
         :type query: dict
+        :param limit: If specified return at most this many objects and a cursor
+                      for the next page, see :func:`tcms.rpc.utils.paginate`
+        :type limit: int
+        :param after_id: Only return objects with PK greater than this value
+        :type after_id: int
         :return: List of serialized :class:`tcms.testruns.models.TestRun` objects
-        :rtype: list(dict)
+                 or a dictionary with ``results`` and ``next_cursor`` when
+                 ``limit`` is specified
+        :rtype: list(dict) or dict
+
+    .. versionchanged:: 16.3
+        Added the ``limit`` and ``after_id`` parameters
     """
 
     if query is None:
         query = {}
 
-    return list(
+    return utils.paginate(
         TestRun.objects.filter(**query)
         .values(
             "id",
@@ -270,7 +293,9 @@ def filter(query=None):  # pylint: disable=redefined-builtin
             "default_tester__username",
         )
         .order_by("id")
-        .distinct()
+        .distinct(),
+        limit,
+        after_id,
     )
 
 
@@ -539,3 +564,37 @@ def get_cc(run_id):
     .. versionadded:: 15.3
     """
     return list(TestRun.objects.get(pk=run_id).cc.values_list("email", flat=True))
+
+
+@rpc_method(
+    name="TestRun.statistics",
+    auth=permissions_required("testruns.view_testrun"),
+)
+def statistics(run_id):
+    """
+    .. function:: RPC TestRun.statistics(run_id)
+
+        Return the number of executions in each status for the specified TestRun.
+        The result is calculated without counting the executions themselves.
+
+        :param run_id: PK of TestRun
+        :type run_id: int
+        :return: Total number of executions, completion percentages and
+                 list of statuses with their respective execution count
+        :rtype: dict
+        :raises PermissionDenied: if missing *testruns.view_testrun* permission
+        :raises TestRun.DoesNotExist: if object doesn't exist
+
+    .. versionadded:: 16.3
+    """
+    test_run = TestRun.objects.get(pk=run_id)
+    stats = test_run.stats_executions_status()
+    statuses = test_run.statistics()
+
+    return {
+        "total": sum(status["count"] for status in statuses),
+        "complete_percent": stats.CompletedPercentage,
+        "failing_percent": stats.FailurePercentage,
+        "passing_percent": stats.SuccessPercentage,
+        "statuses": statuses,
+    }
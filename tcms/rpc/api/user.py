@@ -43,31 +43,42 @@ def _get_user_dict(user):
     auth=permissions_required("auth.view_user"),
     context_target="rpc_context",
 )
-def filter(query=None, rpc_context=None):  # pylint: disable=redefined-builtin
+def filter(  # pylint: disable=redefined-builtin
+    query=None, limit=None, after_id=None, rpc_context=None
+):
     """
-    .. function:: RPC User.filter(query)
+    .. function:: RPC User.filter(query, limit, after_id)
 
         Search and return the resulting list of users.
 
         :param query: Field lookups for :class:`django.contrib.auth.models.User`
         :type query: dict
+        :param limit: If specified return at most this many objects and a cursor
+                      for the next page, see :func:`tcms.rpc.utils.paginate`
+        :type limit: int
+        :param after_id: Only return objects with PK greater than this value
+        :type after_id: int
         :param rpc_context: Provides access to the current request, protocol,
                 entry point name and handler instance from the rpc method
         :type rpc_context: modernrpc.core.RpcRequestContext
         :return: Serialized list of :class:`django.contrib.auth.models.User` objects
-                 without the password field
-        :rtype: list(dict)
+                 without the password field or a dictionary with ``results``
+                 and ``next_cursor`` when ``limit`` is specified
+        :rtype: list(dict) or dict
         :raises PermissionDenied: if missing the *auth.view_user* permission
 
     .. note::
 
         If query is ``None`` will return the user issuing the RPC request.
+
+    .. versionchanged:: 16.3
+        Added the ``limit`` and ``after_id`` parameters
     """
     request = rpc_context.request
     if not query:
         query = {"pk": request.user.pk}
 
-    return list(
+    return utils.paginate(
         get_queryset(request)
         .filter(**query)
         .values(
@@ -81,7 +92,9 @@ def filter(query=None, rpc_context=None):  # pylint: disable=redefined-builtin
             "username",
         )
         .order_by("id")
-        .distinct()
+        .distinct(),
+        limit,
+        after_id,
     )
 
 
@@ -2,27 +2,89 @@
 
 # Licensed under the GPL 2.0: https://www.gnu.org/licenses/old-licenses/gpl-2.0.html
 
+import functools
+import time
 from urllib.parse import urlparse
 
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.module_loading import import_string
 
+from tcms.core.utils import db_schema
 from tcms.testcases.models import BugSystem
 
+# incremented whenever a BugSystem is saved or deleted,
+# see tcms.signals.handle_bug_systems_changed()
+BUG_SYSTEMS_VERSION_KEY = "bug-systems-version"
+
+# the latest result of tracker_index() and when/for which version it was built,
+# keyed by the database schema of the current tenant
+_index = {}
+
+
+def bug_systems_version():
+    # start from a timestamp so that versions never repeat after eviction
+    return cache.get_or_set(BUG_SYSTEMS_VERSION_KEY, int(time.time() * 1000), None)
+
+
+def invalidate_bug_systems():
+    _index.pop(db_schema(), None)
+
+    try:
+        cache.incr(BUG_SYSTEMS_VERSION_KEY)
+    except ValueError:
+        bug_systems_version()
+
+
+@functools.cache
+def tracker_class(tracker_type):
+    """
+    Same as ``import_string(tracker_type)`` but the result is cached!
+    """
+    return import_string(tracker_type)
+
+
+def tracker_index():
+    """
+    Return all BugSystem objects keyed by the (scheme, hostname, port)
+    of their ``base_url``. Each value is a list of ``(path, bug_system)``
+    with the longest path first. The result is shared between requests
+    until a BugSystem is modified or ``BUG_SYSTEMS_INDEX_TIMEOUT`` expires!
+    """
+    version = bug_systems_version()
+    built_for, built_at, prefixes = _index.get(db_schema(), (None, 0, {}))
+    if (
+        built_for == version
+        and time.monotonic() - built_at < settings.BUG_SYSTEMS_INDEX_TIMEOUT
+    ):
+        return prefixes
+
+    prefixes = {}
+    for bug_system in BugSystem.objects.exclude(base_url=None).exclude(base_url=""):
+        _db = urlparse(bug_system.base_url)
+        prefixes.setdefault((_db.scheme, _db.hostname, _db.port), []).append(
+            (_db.path, bug_system)
+        )
+
+    for candidates in prefixes.values():
+        candidates.sort(key=lambda candidate: len(candidate[0]), reverse=True)
+
+    _index[db_schema()] = (version, time.monotonic(), prefixes)
+    return prefixes
+
 
 def tracker_from_url(url, request):
     """
     Return the IssueTrackerType object for the system
     where ``base_url`` is part of ``url``. Usually we pass
-    URLs to pre-existing defects to this method.
+    URLs to pre-existing defects to this method. When more
+    than one system matches the one with the longest path wins!
     """
     _in = urlparse(url)
-    for bug_system in BugSystem.objects.all():
-        _db = urlparse(bug_system.base_url)
-        if (_in.scheme, _in.hostname, _in.port) == (
-            _db.scheme,
-            _db.hostname,
-            _db.port,
-        ) and _in.path.startswith(_db.path):
-            return import_string(bug_system.tracker_type)(bug_system, request)
+    for path, bug_system in tracker_index().get(
+        (_in.scheme, _in.hostname, _in.port), ()
+    ):
+        if _in.path.startswith(path):
+            return tracker_class(bug_system.tracker_type)(bug_system, request)
 
     return None
@@ -13,6 +13,27 @@ class AppConfig(DjangoAppConfig):
         import importlib
 
         from django.conf import settings
+        from django.contrib.auth import get_user_model
+        from django.contrib.auth.models import Group, Permission
+        from django.db.models.signals import m2m_changed, post_delete, post_save
+
+        from tcms import signals
+        from tcms.testcases.models import BugSystem
 
         for module_path in settings.MODERNRPC_METHODS_MODULES:
             importlib.import_module(module_path)
+
+        user_model = get_user_model()
+        for sender in (
+            Group.permissions.through,
+            user_model.groups.through,
+            user_model.user_permissions.through,
+        ):
+            m2m_changed.connect(signals.handle_permissions_changed, sender=sender)
+
+        for sender in (Group, Permission, user_model):
+            post_delete.connect(signals.handle_permissions_changed, sender=sender)
+        post_save.connect(signals.handle_permissions_changed, sender=user_model)
+
+        post_save.connect(signals.handle_bug_systems_changed, sender=BugSystem)
+        post_delete.connect(signals.handle_bug_systems_changed, sender=BugSystem)
@@ -1,7 +1,49 @@
+import time
 from collections.abc import Callable
 
+from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpRequest
 
+from tcms.core.utils import db_schema
+
+# incremented whenever users, groups or permissions are modified,
+# see tcms.signals.handle_permissions_changed(). One for each tenant
+PERMISSIONS_VERSION_KEY = "rpc-permissions-version:{schema}"
+
+
+def permissions_version():
+    # start from a timestamp so that versions never repeat after eviction
+    return cache.get_or_set(
+        PERMISSIONS_VERSION_KEY.format(schema=db_schema()),
+        int(time.time() * 1000),
+        None,
+    )
+
+
+def invalidate_permissions():
+    try:
+        cache.incr(PERMISSIONS_VERSION_KEY.format(schema=db_schema()))
+    except ValueError:
+        permissions_version()
+
+
+def has_perms_cached(user, perms):
+    """
+    Same as ``user.has_perms(perms)`` but the result is cached and shared
+    between all RPC calls, including calls inside a batch, until the
+    permissions version changes!
+    """
+    key = (
+        f"rpc-permissions:{db_schema()}:{permissions_version()}:{user.pk}:"
+        f"{int(user.is_active)}{int(user.is_superuser)}:{','.join(sorted(perms))}"
+    )
+    result = cache.get(key)
+    if result is None:
+        result = user.has_perms(perms)
+        cache.set(key, result, settings.RPC_PERMISSIONS_CACHE_TIMEOUT)
+    return result
+
 
 def django_login_required(request: HttpRequest):
     """
@@ -21,7 +63,7 @@ def django_login_required(request: HttpRequest):
 def permissions_required(*perms: str) -> Callable[[HttpRequest], object | None]:
     def check(request: HttpRequest):  # pylint: disable=nested-function-found
         user = django_login_required(request)
-        if user and user.has_perms(perms):
+        if user and has_perms_cached(user, perms):
             return user
         return None
 
@@ -1,63 +1,178 @@
 import html
+import itertools
+import json
+import logging
+import re
 from datetime import timedelta
+from http import HTTPStatus
+from types import GeneratorType
 
-from modernrpc.exceptions import RPCInvalidRequest
-from modernrpc.jsonrpc.handler import JsonRpcHandler
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models.query import QuerySet
+from modernrpc.exceptions import (
+    AuthenticationError,
+    RPCInternalError,
+    RPCInvalidParams,
+    RPCInvalidRequest,
+    RPCMethodNotFound,
+)
+from modernrpc.jsonrpc.backends.json import PythonJsonSerializer
+from modernrpc.jsonrpc.handler import JsonRpcHandler, JsonRpcRequest
+from modernrpc.types import RpcErrorResult
 from modernrpc.xmlrpc.handler import XmlRpcHandler
 
+# the characters which are replaced by html.escape()
+NEEDS_ESCAPE = re.compile("[&<>\"']").search
 
-class KiwiTCMSHandlerMixin:
+logger = logging.getLogger(__name__)
 
-    @staticmethod
-    def escape_value(value):
-        if isinstance(value, str):
-            return html.escape(value)
-        if isinstance(value, timedelta):
-            return value.total_seconds()
-        return value
+# marker for values which need to be walked by escape()
+CONTAINER = object()
 
-    @staticmethod
-    def escape(value):
-        """Recursively walk *value* and transform it in place."""
-        if isinstance(value, dict):
-            for key, val in value.items():
-                value[key] = __class__.escape(val)
-        elif isinstance(value, list):
-            for idx, item in enumerate(value):
-                value[idx] = __class__.escape(item)
-        else:
-            return __class__.escape_value(value)
+# field names which can not be used in queries, see inspect_rpc_args()
+RESTRICTED_FIELDS = re.compile("password|token|secret|activation_key|api_?key").search
+
+# number of rows serialized together when streaming
+STREAM_CHUNK_SIZE = 100
+
+# names of result fields, keyed by RPC method, which never contain
+# strings or timedelta values, see rpc_method(safe=...)
+safe_fields = {}
+
+
+def escape_str(value):
+    if NEEDS_ESCAPE(value) is None:
         return value
+    return html.escape(value)
+
+
+class KiwiTCMSHandlerMixin:
+    # when True querysets and generators returned by RPC methods are
+    # not evaluated but escaped one row at a time, see stream()
+    streaming = False
+
+    # how to transform values of each type, None means leave as-is.
+    # Sub-classes are resolved on first use, see converter_for()
+    converters = {
+        str: escape_str,
+        timedelta: timedelta.total_seconds,
+        dict: CONTAINER,
+        list: CONTAINER,
+        int: None,
+        float: None,
+        bool: None,
+        type(None): None,
+    }
+
+    @classmethod
+    def converter_for(cls, kind):
+        if kind not in cls.converters:
+            converter = None
+            for base in kind.__mro__[1:]:
+                if base in cls.converters:
+                    converter = cls.converters[base]
+                    break
+            cls.converters[kind] = converter
+
+        return cls.converters[kind]
+
+    @classmethod
+    def escape_value(cls, value):
+        converter = cls.converter_for(type(value))
+        if converter is None or converter is CONTAINER:
+            return value
+        return converter(value)
+
+    @classmethod
+    def escape(cls, value, safe=frozenset()):
+        """
+        Walk *value* and transform it in place. Dictionary keys listed
+        in *safe* are skipped, regardless of how deeply they are nested!
+        """
+        converters = cls.converters
+        root = [value]
+        pending = [root]
+
+        while pending:
+            container = pending.pop()
+            if isinstance(container, dict):
+                items = container.items()
+            else:
+                items = enumerate(container)
+
+            for key, item in items:
+                if key in safe:
+                    continue
+
+                try:
+                    converter = converters[type(item)]
+                except KeyError:
+                    converter = cls.converter_for(type(item))
+
+                if converter is None:
+                    continue
+
+                if converter is CONTAINER:
+                    pending.append(item)
+                else:
+                    container[key] = converter(item)
+
+        return root[0]
+
+    @classmethod
+    def stream(cls, rows, safe=frozenset()):
+        """
+        Return a generator which escapes *rows* one by one. The first chunk
+        of rows is fetched immediately so that invalid queries, and errors
+        in results which fit in a single chunk, are reported as regular
+        RPC errors. Such results are returned as a list and not streamed!
+        """
+        if isinstance(rows, QuerySet):
+            rows = rows.iterator()
+        rows = iter(rows)
+
+        first_chunk = list(itertools.islice(rows, STREAM_CHUNK_SIZE + 1))
+        if len(first_chunk) <= STREAM_CHUNK_SIZE:
+            return list(cls.escape_each(first_chunk, safe))
+
+        return cls.escape_each(itertools.chain(first_chunk, rows), safe)
+
+    @classmethod
+    def escape_each(cls, rows, safe):
+        for row in rows:
+            yield cls.escape(row, safe)
 
     @staticmethod
     def inspect_rpc_args(rpc_request):
+        """
+        Refuse queries which reference sensitive fields, directly or via
+        lookups like ``author__password``, anywhere inside the arguments!
+        """
         if rpc_request.method_name.endswith(
             ".create"
         ) or rpc_request.method_name.endswith(".update"):
             return
 
-        restricted_fields = (
-            "password",
-            "token",
-            "secret",
-            "activation_key",
-            "api_key",
-            "apikey",
-        )
-
-        keys_to_check = []
-        for arg in rpc_request.args:
-            if isinstance(arg, dict):
-                keys_to_check.extend(arg.keys())
-
+        pending = list(rpc_request.args)
         kwargs = getattr(rpc_request, "kwargs", None)
         if isinstance(kwargs, dict):
-            keys_to_check.extend(kwargs.keys())
+            pending.append(kwargs)
 
-        for key in keys_to_check:
-            key_str = str(key).lower()
-            if any(key_str.find(field) > -1 for field in restricted_fields):
-                raise RPCInvalidRequest("Unsupported field")
+        while pending:
+            value = pending.pop()
+            if isinstance(value, dict):
+                # all keys are inspected with a single search
+                if RESTRICTED_FIELDS("\n".join(map(str, value)).lower()):
+                    raise RPCInvalidRequest("Unsupported field")
+                value = value.values()
+            elif not isinstance(value, (list, tuple)):
+                continue
+
+            for item in value:
+                if isinstance(item, (dict, list, tuple)):
+                    pending.append(item)
 
     def process_single_request(self, rpc_request, context):
         try:
@@ -73,9 +188,34 @@ class KiwiTCMSHandlerMixin:
 
         return super().process_single_request(rpc_request, context)
 
+    def process_and_evaluate(self, rpc_request, context):
+        """
+        Same as ``process_single_request()`` but results which are
+        streamed are evaluated immediately!
+        """
+        return evaluate(self.process_single_request(rpc_request, context))
+
     async def aprocess_single_request(self, rpc_request, context):
+        """
+        RPC methods which are coroutines are awaited inside the event loop.
+        Everything else talks to the database and is executed in the thread
+        of the current request, see ``sync_to_async()``!
+        """
+        try:
+            wrapper = context.server.get_procedure_wrapper(
+                rpc_request.method_name, self.protocol
+            )
+            is_coroutine = iscoroutinefunction(wrapper.func_or_coro)
+        except RPCMethodNotFound:
+            # reported by process_single_request()
+            is_coroutine = False
+
+        if not is_coroutine:
+            return await sync_to_async(self.process_and_evaluate)(rpc_request, context)
+
         try:
             self.inspect_rpc_args(rpc_request)
+            result_data = await __class__.aexecute(wrapper, rpc_request, context)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             rpc_exc = context.server.on_error(exc, context)
             return self.build_error_result(
@@ -85,17 +225,196 @@ class KiwiTCMSHandlerMixin:
                 data=rpc_exc.data,
             )
 
-        return await super().aprocess_single_request(rpc_request, context)
+        return self.build_success_result(rpc_request, result_data)
+
+    @staticmethod
+    async def aexecute(wrapper, rpc_request, context):
+        """
+        Same as ``ProcedureWrapper.aexecute()`` but authentication, which
+        reads the session and permissions, is executed outside of the event loop!
+        """
+        try:
+            context.auth_result = await sync_to_async(wrapper.check_permissions)(
+                context.request
+            )
+        except Exception as exc:
+            raise AuthenticationError(wrapper.name) from exc
+
+        args = rpc_request.args or []
+        kwargs = getattr(rpc_request, "kwargs", None) or {}
+        if wrapper.context_target:
+            kwargs[wrapper.context_target] = context
+
+        try:
+            return await wrapper.func_or_coro(*args, **kwargs)
+        except TypeError as exc:
+            raise RPCInvalidParams(str(exc)) from None
 
     def build_success_result(self, request, data):
-        data = __class__.escape(data)
+        safe = safe_fields.get(getattr(request, "method_name", None), frozenset())
+
+        if isinstance(data, (QuerySet, GeneratorType)):
+            if not self.streaming:
+                data = list(data)
+            else:
+                try:
+                    data = __class__.stream(data, safe)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    rpc_exc = RPCInternalError(message=str(exc))
+                    return self.build_error_result(
+                        request=request,
+                        code=rpc_exc.code,
+                        message=rpc_exc.message,
+                        data=rpc_exc.data,
+                    )
+                return super().build_success_result(request, data)
+
+        data = __class__.escape(data, safe)
         return super().build_success_result(request, data)
 
 
-class KiwiTCMSJsonRpcHandler(
-    KiwiTCMSHandlerMixin, JsonRpcHandler
-):  # pylint: disable=remove-empty-class
-    pass
+def evaluate(result):
+    """
+    Evaluate a result which would otherwise be streamed. If that fails
+    return an error result for the same request instead!
+    """
+    if not isinstance(getattr(result, "data", None), GeneratorType):
+        return result
+
+    try:
+        result.data = list(result.data)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        logger.exception("Evaluating the result of %s failed", result.request)
+        rpc_exc = RPCInternalError(message=str(exc))
+        return RpcErrorResult(
+            request=result.request, code=rpc_exc.code, message=rpc_exc.message
+        )
+
+    return result
+
+
+class StreamingJsonSerializer(PythonJsonSerializer):
+    """
+    Emits results, which are generators, incrementally instead of
+    building the entire response in memory. Used together with
+    ``KiwiTCMSJsonRpcHandler`` and ``KiwiTCMSRpcServer``!
+    """
+
+    def dumps(self, result):
+        if isinstance(result, list):
+            # batch requests are always serialized at once
+            results = []
+            for item in result:
+                results.append(evaluate(item))
+            return super().dumps(results)
+
+        if isinstance(getattr(result, "data", None), GeneratorType):
+            return self.dumps_stream(result)
+
+        return super().dumps(result)
+
+    def dumps_stream(self, result):
+        """
+        The first chunk of rows has already been fetched, see
+        :meth:`KiwiTCMSHandlerMixin.stream`. If an error happens afterwards
+        the response has already been started. The error is raised again,
+        so the response is cut short and clients see an invalid response
+        instead of a partial result!
+        """
+        request_id = json.dumps(result.request.request_id, **self.dump_kwargs)
+        jsonrpc = json.dumps(result.request.jsonrpc, **self.dump_kwargs)
+
+        chunk = [f'{{"id": {request_id}, "jsonrpc": {jsonrpc}, "result": [']
+        separator = ""
+        try:
+            for row in result.data:
+                chunk.append(separator + json.dumps(row, **self.dump_kwargs))
+                separator = ", "
+
+                if len(chunk) >= STREAM_CHUNK_SIZE:
+                    yield "".join(chunk)
+                    chunk = []
+        except Exception:
+            logger.exception("Streaming the result of %s failed", result.request)
+            raise
+
+        chunk.append("]}")
+        yield "".join(chunk)
+
+
+class KiwiTCMSJsonRpcHandler(KiwiTCMSHandlerMixin, JsonRpcHandler):
+    streaming = True
+
+    def check_batch_size(self, requests):
+        """
+        Return a serialized error when the batch is too large, else None!
+        """
+        if len(requests) <= settings.RPC_BATCH_SIZE_LIMIT:
+            return None
+
+        rpc_exc = RPCInvalidRequest(
+            f"Batch exceeds the limit of {settings.RPC_BATCH_SIZE_LIMIT} requests"
+        )
+        return self.serializer.dumps(
+            self.build_error_result(
+                JsonRpcRequest(request_id=None, method_name=""),
+                rpc_exc.code,
+                rpc_exc.message,
+            )
+        )
+
+    def process_batch_request(self, requests, context):
+        """
+        Permissions are resolved once and then shared between all requests
+        in the batch, see :func:`tcms.rpc.decorators.has_perms_cached`.
+        When the ``X-RPC-Atomic: true`` header is present all requests are
+        executed in a single transaction and if one of them fails all changes
+        are rolled back!
+        """
+        error = self.check_batch_size(requests)
+        if error:
+            return error
+
+        if context.request.headers.get("X-RPC-Atomic", "").lower() != "true":
+            return super().process_batch_request(requests, context)
+
+        with transaction.atomic():
+            results = []
+            for rpc_request in requests:
+                # evaluate streamed results inside the transaction
+                results.append(self.process_and_evaluate(rpc_request, context))
+
+            if any(isinstance(result, RpcErrorResult) for result in results):
+                transaction.set_rollback(True)
+                rpc_exc = RPCInternalError(
+                    message="Transaction rolled back because of another error in this batch"
+                )
+                for index, result in enumerate(results):
+                    if not isinstance(result, RpcErrorResult):
+                        results[index] = self.build_error_result(
+                            result.request, rpc_exc.code, rpc_exc.message
+                        )
+
+        filtered_results = []
+        for result in results:
+            if not result.request.is_notification:
+                filtered_results.append(result)
+
+        if filtered_results:
+            return self.serializer.dumps(filtered_results)
+
+        # notifications-only batch request returns 204 no content
+        return HTTPStatus.NO_CONTENT, ""
+
+    async def aprocess_batch_request(self, requests, context):
+        error = self.check_batch_size(requests)
+        if error:
+            return error
+
+        if context.request.headers.get("X-RPC-Atomic", "").lower() == "true":
+            return await sync_to_async(self.process_batch_request)(requests, context)
+
+        return await super().aprocess_batch_request(requests, context)
 
 
 class KiwiTCMSXmlRpcHandler(
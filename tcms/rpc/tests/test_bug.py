@@ -1,15 +1,29 @@
 # pylint: disable=attribute-defined-outside-init
 
+import threading
 import unittest
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from django.conf import settings
 from django.core.cache import cache
-from django.test import RequestFactory, override_settings
+from django.test import RequestFactory, TestCase, override_settings
 from mock import MagicMock, patch
+from parameterized import parameterized
 
+from tcms.issuetracker.base import IssueTrackerType
 from tcms.rpc.api import utils
 from tcms.rpc.tests.utils import APITestCase
 from tcms.testcases.models import BugSystem
+from tcms.tests.factories import UserFactory
+
+# tracker_from_url() caches its index only when the cache is shared
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tracker-index",
+    }
+}
 
 if "tcms.bugs.apps.AppConfig" not in settings.INSTALLED_APPS:
     raise unittest.SkipTest("tcms.bugs is disabled")
@@ -83,3 +97,302 @@ class TestBug(APITestCase):
             RequestFactory(),
         )
         self.assertIsNone(tracker)
+
+    @patch("tcms.rpc.api.bug.tracker_from_url")
+    def test_details_many_uses_bulk_api(self, tracker_from_url):
+        tracker = BulkTracker(MagicMock(pk=1), None)
+        tracker_from_url.return_value = tracker
+        urls = [f"{self.url}/1", f"{self.url}/2", f"{self.url}/missing"]
+
+        result = self.rpc_client.Bug.details_many(urls)
+
+        self.assertEqual(tracker.calls, [urls])
+        self.assertEqual(result[urls[0]], {"id": 1, "title": "Bulk 1"})
+        self.assertEqual(result[urls[1]], {"id": 2, "title": "Bulk 2"})
+        self.assertEqual(result[urls[2]], {})
+
+    def test_details_many_when_tracker_does_not_exist(self):
+        url = "http://unknown-tracker.url/1"
+
+        result = self.rpc_client.Bug.details_many([url])
+        self.assertEqual(result, {url: {}})
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    @patch("tcms.rpc.api.bug.tracker_from_url")
+    def test_details_many_caches_hits_and_failures(self, tracker_from_url):
+        tracker = BulkTracker(MagicMock(pk=1), None)
+        tracker_from_url.return_value = tracker
+        urls = [f"{self.url}/1", f"{self.url}/missing"]
+
+        first = self.rpc_client.Bug.details_many(urls)
+        second = self.rpc_client.Bug.details_many(urls)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(tracker.calls), 1)
+        self.assertEqual(tracker_from_url.call_count, len(urls))
+        self.assertEqual(cache.get(urls[1]), {})
+
+    @parameterized.expand([(300, 1), (0, 2)])
+    @patch("tcms.rpc.api.bug.tracker_from_url")
+    def test_details_failure_is_logged_and_cached(
+        self, failure_timeout, expected_calls, tracker_from_url
+    ):
+        tracker = UnreachableTracker(MagicMock(pk=1), None)
+        tracker_from_url.return_value = tracker
+        url = f"{self.url}/unreachable/{failure_timeout}"
+
+        with override_settings(
+            CACHES=LOCMEM_CACHE, BUG_DETAILS_FAILURE_CACHE_TIMEOUT=failure_timeout
+        ), self.assertLogs("tcms.rpc.api.bug", "WARNING") as logs:
+            first = self.rpc_client.Bug.details(url)
+            second = self.rpc_client.Bug.details(url)
+
+        self.assertEqual(first, {})
+        self.assertEqual(second, {})
+        self.assertEqual(tracker.calls, expected_calls)
+        self.assertIn("Tracker is down", logs.output[0])
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    @patch("tcms.rpc.api.bug.tracker_from_url")
+    def test_details_many_logs_tracker_errors(self, tracker_from_url):
+        tracker_from_url.return_value = UnreachableTracker(MagicMock(pk=1), None)
+        urls = [f"{self.url}/unreachable/1", f"{self.url}/unreachable/2"]
+
+        with self.assertLogs("tcms.rpc.api.bug", "WARNING") as logs:
+            result = self.rpc_client.Bug.details_many(urls)
+
+        self.assertEqual(result, {urls[0]: {}, urls[1]: {}})
+        self.assertIn("Tracker is down", logs.output[0])
+
+    @patch("tcms.rpc.api.bug.tracker_from_url")
+    def test_details_many_does_not_hide_programming_errors(self, tracker_from_url):
+        tracker = UnreachableTracker(MagicMock(pk=1), None)
+        tracker.error = TypeError("Bug in the integration code")
+        tracker_from_url.return_value = tracker
+
+        with self.assertRaisesRegex(Exception, "Bug in the integration code"):
+            self.rpc_client.Bug.details_many([f"{self.url}/1"])
+
+
+class UnreachableTracker(IssueTrackerType):  # pylint: disable=abstract-method
+    """
+    Fails to fetch details with a network error!
+    """
+
+    error = ConnectionError("Tracker is down")
+
+    def __init__(self, bug_system, request):
+        super().__init__(bug_system, request)
+        self.calls = 0
+
+    def details(self, url):
+        self.calls += 1
+        raise self.error
+
+    def details_many(self, urls):
+        return self.details(urls[0])
+
+
+class BulkTracker(IssueTrackerType):  # pylint: disable=abstract-method
+    """
+    Returns details for bugs ending in a number with a single call!
+    """
+
+    def __init__(self, bug_system, request):
+        super().__init__(bug_system, request)
+        self.calls = []
+
+    def details_many(self, urls):
+        self.calls.append(list(urls))
+        result = {}
+        for url in urls:
+            if url[-1].isdigit():
+                result[url] = {"id": int(url[-1]), "title": f"Bulk {url[-1]}"}
+        return result
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TestTrackerFromUrl(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = BugSystem.objects.create(
+            name="GitHub organization",
+            tracker_type="tcms.issuetracker.types.GitHub",
+            base_url="https://github.com/kiwitcms",
+        )
+        cls.repository = BugSystem.objects.create(
+            name="GitHub repository",
+            tracker_type="tcms.issuetracker.types.GitHub",
+            base_url="https://github.com/kiwitcms/Kiwi",
+        )
+
+    def setUp(self):
+        super().setUp()
+        # objects created by other tests are rolled back without signals
+        cache.clear()
+        utils.invalidate_bug_systems()
+
+    def test_longest_prefix_wins(self):
+        tracker = utils.tracker_from_url(
+            "https://github.com/kiwitcms/Kiwi/issues/1", None
+        )
+        self.assertEqual(tracker.bug_system, self.repository)
+
+        tracker = utils.tracker_from_url(
+            "https://github.com/kiwitcms/tcms-api/issues/1", None
+        )
+        self.assertEqual(tracker.bug_system, self.organization)
+
+    def test_scheme_and_port_must_match(self):
+        self.assertIsNone(
+            utils.tracker_from_url("http://github.com/kiwitcms/Kiwi/issues/1", None)
+        )
+        self.assertIsNone(
+            utils.tracker_from_url(
+                "https://github.com:8443/kiwitcms/Kiwi/issues/1", None
+            )
+        )
+
+    def test_resolving_urls_does_not_query_the_database(self):
+        utils.tracker_from_url("https://github.com/kiwitcms/Kiwi/issues/1", None)
+
+        with self.assertNumQueries(0):
+            for number in range(1000):
+                tracker = utils.tracker_from_url(
+                    f"https://github.com/kiwitcms/Kiwi/issues/{number}", None
+                )
+                self.assertEqual(tracker.bug_system, self.repository)
+
+    def test_index_is_rebuilt_after_changes(self):
+        url = "https://github.com/kiwitcms/Kiwi/issues/1"
+        self.assertEqual(utils.tracker_from_url(url, None).bug_system, self.repository)
+
+        self.repository.base_url = "https://gitlab.com/kiwitcms/Kiwi"
+        self.repository.save()
+        self.assertEqual(
+            utils.tracker_from_url(url, None).bug_system, self.organization
+        )
+
+        self.organization.delete()
+        self.assertIsNone(utils.tracker_from_url(url, None))
+
+    @override_settings(BUG_SYSTEMS_INDEX_TIMEOUT=0)
+    def test_index_expires(self):
+        url = "https://bitbucket.org/kiwitcms/Kiwi/issues/1"
+        self.assertIsNone(utils.tracker_from_url(url, None))
+
+        # update() doesn't send signals
+        BugSystem.objects.filter(  # pylint: disable=objects-update-used
+            pk=self.organization.pk
+        ).update(base_url="https://bitbucket.org/kiwitcms")
+
+        self.assertEqual(
+            utils.tracker_from_url(url, None).bug_system.pk, self.organization.pk
+        )
+
+
+class FakeTracker(BaseHTTPRequestHandler):
+    """
+    Serves OpenGraph metadata for issues only after the expected number
+    of requests are waiting at the same time!
+    """
+
+    barrier = threading.Barrier(1)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        try:
+            self.barrier.wait()
+        except threading.BrokenBarrierError:
+            self.send_error(HTTPStatus.GATEWAY_TIMEOUT)
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        self.wfile.write(f"""<html><head>
+<meta property="og:title" content="Issue {self.path}" />
+<meta property="og:description" content="Reported via a fake tracker" />
+</head><body></body></html>""".encode())
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class TestBugDetailsAsync(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTracker)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tester = UserFactory()
+        BugSystem.objects.create(
+            name="Fake tracker",
+            tracker_type="tcms.issuetracker.base.IssueTrackerType",
+            base_url=cls.base_url,
+        )
+
+    def post(self, endpoint, data):
+        return self.client.post(endpoint, data, content_type="application/json")
+
+    def details(self, endpoint, *issues):
+        batch = []
+        for issue in issues:
+            batch.append(
+                {
+                    "id": issue,
+                    "jsonrpc": "2.0",
+                    "method": "Bug.details",
+                    "params": [f"{self.base_url}/issues/{issue}"],
+                }
+            )
+
+        FakeTracker.barrier = threading.Barrier(len(issues), timeout=5)
+        return self.post(endpoint, batch).json()
+
+    def test_details_in_batch_are_fetched_concurrently(self):
+        self.client.force_login(self.tester)
+
+        results = self.details("/async/json-rpc/", 1, 2, 3)
+
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertNotIn("error", result)
+            self.assertEqual(result["result"]["title"], f"Issue /issues/{result['id']}")
+            self.assertEqual(result["result"]["id"], result["id"])
+
+    def test_details_via_regular_endpoint(self):
+        self.client.force_login(self.tester)
+
+        results = self.details("/json-rpc/", 4)
+
+        self.assertEqual(results[0]["result"]["title"], "Issue /issues/4")
+
+    def test_details_require_login(self):
+        results = self.details("/async/json-rpc/", 5)
+
+        self.assertIn("Authentication failed", results[0]["error"]["message"])
+
+    def test_details_many_are_fetched_concurrently(self):
+        self.client.force_login(self.tester)
+        urls = []
+        for issue in range(6, 9):
+            urls.append(f"{self.base_url}/issues/{issue}")
+
+        FakeTracker.barrier = threading.Barrier(len(urls), timeout=5)
+        result = self.post(
+            "/json-rpc/",
+            {"id": 1, "jsonrpc": "2.0", "method": "Bug.details_many", "params": [urls]},
+        ).json()["result"]
+
+        for url in urls:
+            self.assertEqual(result[url]["title"], f"Issue {url[len(self.base_url):]}")
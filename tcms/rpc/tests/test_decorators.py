@@ -0,0 +1,71 @@
+from django.contrib.auth.models import Permission
+from django.test import TestCase, override_settings
+
+from tcms.rpc.decorators import has_perms_cached
+from tcms.tests.factories import GroupFactory, UserFactory
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-has-perms-cached",
+        }
+    }
+)
+class TestHasPermsCached(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.permission = Permission.objects.get(
+            content_type__app_label="management", codename="view_tag"
+        )
+        cls.group = GroupFactory()
+        cls.group.permissions.add(cls.permission)
+
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+        self.user.groups.add(self.group)
+
+    def has_perm(self):
+        # a fresh object, like on every HTTP request
+        user = type(self.user).objects.get(pk=self.user.pk)
+        return has_perms_cached(user, ["management.view_tag"])
+
+    def test_result_is_cached(self):
+        self.assertTrue(self.has_perm())
+
+        with self.assertNumQueries(1):  # only loads the user
+            self.assertTrue(self.has_perm())
+
+    def test_invalidated_when_group_permissions_change(self):
+        self.assertTrue(self.has_perm())
+
+        self.group.permissions.remove(self.permission)
+        self.assertFalse(self.has_perm())
+
+    def test_invalidated_when_user_groups_change(self):
+        self.assertTrue(self.has_perm())
+
+        self.user.groups.clear()
+        self.assertFalse(self.has_perm())
+
+    def test_invalidated_when_user_permissions_change(self):
+        self.user.groups.clear()
+        self.assertFalse(self.has_perm())
+
+        self.user.user_permissions.add(self.permission)
+        self.assertTrue(self.has_perm())
+
+    def test_invalidated_when_group_is_deleted(self):
+        self.assertTrue(self.has_perm())
+
+        self.group.delete()
+        self.assertFalse(self.has_perm())
+
+    def test_inactive_users_have_no_permissions(self):
+        self.assertTrue(self.has_perm())
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertFalse(self.has_perm())
@@ -1,10 +1,27 @@
 import html
+import json
 from datetime import timedelta
-from unittest.mock import Mock
+from types import GeneratorType
+from unittest.mock import Mock, patch
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.safestring import mark_safe
+from modernrpc.exceptions import RPCInvalidRequest
+from modernrpc.jsonrpc.handler import JsonRpcRequest
 
-from tcms.rpc.handlers import KiwiTCMSJsonRpcHandler, KiwiTCMSXmlRpcHandler
+from tcms.management.models import Tag
+from tcms.rpc.decorators import invalidate_permissions
+from tcms.rpc.handlers import (
+    STREAM_CHUNK_SIZE,
+    KiwiTCMSJsonRpcHandler,
+    KiwiTCMSXmlRpcHandler,
+    safe_fields,
+)
+from tcms.tests import remove_perm_from_user, user_should_have_perm
+from tcms.tests.factories import TagFactory, UserFactory
 
 
 class TestKiwiTCMSJsonRpcHandler(TestCase):
@@ -66,6 +83,36 @@ class TestKiwiTCMSJsonRpcHandler(TestCase):
         self.assertEqual(result.data["items"][1]["name"], html.escape("<item2>"))
         self.assertEqual(result.data["items"][1]["time"], 20.0)
 
+    def test_str_subclass_is_escaped(self):
+        data = {"name": mark_safe("<b>bold</b>")}
+        result = self.handler.build_success_result(self.request, data)
+        self.assertEqual(result.data["name"], html.escape("<b>bold</b>"))
+
+    def test_string_without_special_characters_is_not_copied(self):
+        data = ["normal text"]
+        result = self.handler.build_success_result(self.request, data)
+        self.assertIs(result.data[0], data[0])
+
+    def test_deeply_nested_structure(self):
+        data = "<tag>"
+        for _ in range(5000):
+            data = [data]
+
+        result = self.handler.build_success_result(self.request, data).data
+        for _ in range(5000):
+            result = result[0]
+        self.assertEqual(result, html.escape("<tag>"))
+
+    def test_safe_fields_are_not_inspected(self):
+        request = Mock(method_name="Test.filter")
+        data = [{"raw": "<b>", "text": "<b>"}]
+
+        with patch.dict(safe_fields, {"Test.filter": frozenset(["raw"])}):
+            result = self.handler.build_success_result(request, data)
+
+        self.assertEqual(result.data[0]["raw"], "<b>")
+        self.assertEqual(result.data[0]["text"], html.escape("<b>"))
+
 
 class TestKiwiTCMSXmlRpcHandler(TestCase):
     @classmethod
@@ -124,3 +171,303 @@ class TestKiwiTCMSXmlRpcHandler(TestCase):
         self.assertEqual(result.data["items"][0]["time"], 10.0)
         self.assertEqual(result.data["items"][1]["name"], html.escape("<item2>"))
         self.assertEqual(result.data["items"][1]["time"], 20.0)
+
+
+class TestInspectRpcArgs(TestCase):
+    def assert_refused(self, method_name, *args, **kwargs):
+        request = Mock(method_name=method_name, args=list(args), kwargs=kwargs)
+        with self.assertRaisesRegex(RPCInvalidRequest, "Unsupported field"):
+            KiwiTCMSJsonRpcHandler.inspect_rpc_args(request)
+
+    def assert_allowed(self, method_name, *args, **kwargs):
+        request = Mock(method_name=method_name, args=list(args), kwargs=kwargs)
+        self.assertIsNone(KiwiTCMSJsonRpcHandler.inspect_rpc_args(request))
+
+    def test_top_level_lookup_is_refused(self):
+        self.assert_refused("User.filter", {"password__startswith": "pbkdf2"})
+
+    def test_lookup_chain_is_refused(self):
+        self.assert_refused("TestCase.filter", {"author__password": "x"})
+
+    def test_case_insensitive_lookup_is_refused(self):
+        self.assert_refused("User.filter", {"API_KEY": "x"})
+
+    def test_nested_dict_is_refused(self):
+        self.assert_refused("TestCase.filter", {"pk": 1, "extra": {"secret": "x"}})
+
+    def test_dict_inside_list_is_refused(self):
+        self.assert_refused("TestCase.filter", [{"pk": 1}, {"author__token": "x"}])
+
+    def test_kwargs_are_refused(self):
+        self.assert_refused("TestCase.filter", query={"activation_key": "x"})
+
+    def test_values_are_not_refused(self):
+        self.assert_allowed(
+            "TestCase.filter", {"summary__icontains": "password"}, ["token"]
+        )
+
+    def test_regular_query_is_allowed(self):
+        self.assert_allowed(
+            "TestExecution.filter",
+            {"run": 1, "assignee__username__in": ["alice", "bob"]},
+            None,
+            None,
+            ["id", "status"],
+        )
+
+    def test_create_and_update_are_not_inspected(self):
+        self.assert_allowed("User.update", 1, {"password": "secret"})
+        self.assert_allowed("Bug.create", {"api_key": "x"})
+
+
+def broken_rows():
+    raise ValueError("Invalid query")
+    yield  # pylint: disable=unreachable
+
+
+def failing_rows(count):
+    for index in range(count):
+        yield {"id": index, "name": f"tag-{index}"}
+    raise ValueError("Connection lost")
+
+
+class TestStreamingResults(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.json_handler = KiwiTCMSJsonRpcHandler()
+        cls.xml_handler = KiwiTCMSXmlRpcHandler()
+        cls.request = JsonRpcRequest(request_id=7, method_name="Tag.filter")
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(STREAM_CHUNK_SIZE * 2 + 1):
+            TagFactory(name=f"<tag-{index:03}>")
+
+    def test_json_handler_streams_querysets(self):
+        queryset = Tag.objects.values("id", "name").order_by("name")
+        result = self.json_handler.build_success_result(self.request, queryset)
+
+        self.assertIsInstance(result.data, GeneratorType)
+        tags = list(result.data)
+        self.assertEqual(len(tags), STREAM_CHUNK_SIZE * 2 + 1)
+        self.assertEqual(tags[0]["name"], html.escape("<tag-000>"))
+
+    def test_xml_handler_does_not_stream(self):
+        queryset = Tag.objects.values("id", "name").order_by("name")
+        result = self.xml_handler.build_success_result(self.request, queryset)
+
+        self.assertIsInstance(result.data, list)
+        self.assertEqual(result.data[0]["name"], html.escape("<tag-000>"))
+
+    def test_empty_result_is_not_streamed(self):
+        queryset = Tag.objects.filter(pk=-1).values("id", "name")
+        result = self.json_handler.build_success_result(self.request, queryset)
+
+        self.assertEqual(result.data, [])
+
+    def test_error_before_the_first_row_is_reported(self):
+        result = self.json_handler.build_success_result(self.request, broken_rows())
+
+        self.assertIn("Invalid query", result.message)
+
+    def test_serializer_emits_chunks(self):
+        queryset = Tag.objects.values("id", "name").order_by("name")
+        result = self.json_handler.build_success_result(self.request, queryset)
+
+        chunks = list(self.json_handler.serializer.dumps(result))
+        self.assertEqual(len(chunks), 3)
+
+        response = json.loads("".join(chunks))
+        self.assertEqual(response["id"], 7)
+        self.assertEqual(len(response["result"]), STREAM_CHUNK_SIZE * 2 + 1)
+        self.assertEqual(response["result"][-1]["name"], html.escape("<tag-200>"))
+
+    def test_error_in_the_first_chunk_is_reported(self):
+        result = self.json_handler.build_success_result(
+            self.request, failing_rows(STREAM_CHUNK_SIZE)
+        )
+
+        self.assertIn("Connection lost", result.message)
+
+    def test_error_after_the_first_chunk_cuts_the_response_short(self):
+        result = self.json_handler.build_success_result(
+            self.request, failing_rows(STREAM_CHUNK_SIZE + 1)
+        )
+
+        chunks = []
+        with self.assertLogs("tcms.rpc.handlers", "ERROR"), self.assertRaisesRegex(
+            ValueError, "Connection lost"
+        ):
+            for chunk in self.json_handler.serializer.dumps(result):
+                chunks.append(chunk)
+
+        self.assertEqual(len(chunks), 1)
+        with self.assertRaises(json.JSONDecodeError):
+            json.loads("".join(chunks))
+
+    def test_error_in_a_batch_is_reported_for_its_request_only(self):
+        failing = self.json_handler.build_success_result(
+            self.request, failing_rows(STREAM_CHUNK_SIZE + 1)
+        )
+        other = self.json_handler.build_success_result(
+            JsonRpcRequest(request_id=8, method_name="Tag.filter"), [{"id": 1}]
+        )
+
+        with self.assertLogs("tcms.rpc.handlers", "ERROR"):
+            response = json.loads(self.json_handler.serializer.dumps([failing, other]))
+
+        self.assertEqual(response[0]["id"], 7)
+        self.assertNotIn("result", response[0])
+        self.assertIn("Connection lost", response[0]["error"]["message"])
+        self.assertEqual(
+            response[1], {"id": 8, "jsonrpc": "2.0", "result": [{"id": 1}]}
+        )
+
+
+# permissions are cached, see tcms.rpc.decorators.has_perms_cached()
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-json-rpc-batch",
+        }
+    }
+)
+class TestJsonRpcBatch(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.tester = UserFactory()
+        user_should_have_perm(cls.tester, "management.view_tag")
+        user_should_have_perm(cls.tester, "management.add_tag")
+
+    def setUp(self):
+        super().setUp()
+        # permission changes are rolled back after each test but not cached results
+        cache.clear()
+        self.client.force_login(self.tester)
+
+    def post_batch(self, calls, endpoint="/json-rpc/", **kwargs):
+        batch = []
+        for index, (method, params) in enumerate(calls):
+            batch.append(
+                {"id": index, "jsonrpc": "2.0", "method": method, "params": params}
+            )
+
+        return self.client.post(
+            endpoint, batch, content_type="application/json", **kwargs
+        )
+
+    def count_permission_queries(self, size):
+        with CaptureQueriesContext(connection) as context:
+            response = self.post_batch([("Tag.filter", [{"pk": -1}])] * size)
+
+        self.assertEqual(len(response.json()), size)
+        return sum(
+            "auth_permission" in query["sql"] for query in context.captured_queries
+        )
+
+    def test_permissions_are_resolved_once_per_batch(self):
+        invalidate_permissions()
+        single_call = self.count_permission_queries(1)
+
+        invalidate_permissions()
+        self.assertGreater(single_call, 0)
+        self.assertEqual(self.count_permission_queries(5), single_call)
+
+    def test_permissions_are_shared_between_batches(self):
+        self.count_permission_queries(1)
+        self.assertEqual(self.count_permission_queries(5), 0)
+
+    def test_permissions_are_not_shared_between_tenants(self):
+        self.count_permission_queries(1)
+
+        with patch("tcms.rpc.decorators.db_schema", return_value="tenant"):
+            self.assertGreater(self.count_permission_queries(1), 0)
+
+    def test_permission_changes_are_visible_immediately(self):
+        self.count_permission_queries(1)
+        remove_perm_from_user(self.tester, "management.view_tag")
+
+        result = self.post_batch([("Tag.filter", [{"pk": -1}])]).json()
+        self.assertIn("Authentication failed", result[0]["error"]["message"])
+
+    @override_settings(RPC_BATCH_SIZE_LIMIT=2)
+    def test_batch_size_limit(self):
+        response = self.post_batch([("Tag.filter", [{"pk": -1}])] * 3)
+
+        result = response.json()
+        self.assertIsNone(result["id"])
+        self.assertIn(
+            "Batch exceeds the limit of 2 requests", result["error"]["message"]
+        )
+
+    def test_batch_without_transaction_keeps_successful_changes(self):
+        response = self.post_batch(
+            [("Tag.create", [{"name": "batch-tag"}]), ("Tag.create", [{}])]
+        )
+
+        result = response.json()
+        self.assertEqual(result[0]["result"]["name"], "batch-tag")
+        self.assertIn("error", result[1])
+        self.assertTrue(Tag.objects.filter(name="batch-tag").exists())
+
+    def test_atomic_batch_rolls_back_all_changes(self):
+        response = self.post_batch(
+            [("Tag.create", [{"name": "batch-tag"}]), ("Tag.create", [{}])],
+            headers={"X-RPC-Atomic": "true"},
+        )
+
+        result = response.json()
+        self.assertIn("Transaction rolled back", result[0]["error"]["message"])
+        self.assertIn("error", result[1])
+        self.assertFalse(Tag.objects.filter(name="batch-tag").exists())
+
+    def test_atomic_batch_commits_all_changes(self):
+        response = self.post_batch(
+            [
+                ("Tag.create", [{"name": "batch-tag-1"}]),
+                ("Tag.create", [{"name": "batch-tag-2"}]),
+                ("Tag.filter", [{"name__startswith": "batch-tag"}]),
+            ],
+            headers={"X-RPC-Atomic": "true"},
+        )
+
+        result = response.json()
+        self.assertEqual(len(result[2]["result"]), 2)
+        self.assertEqual(
+            Tag.objects.filter(name__startswith="batch-tag").count(),
+            2,
+        )
+
+    def test_async_batch_evaluates_querysets(self):
+        tag = TagFactory()
+        response = self.post_batch(
+            [("Tag.filter", [{"pk": tag.pk}]), ("Tag.filter", [{"pk": -1}])],
+            endpoint="/async/json-rpc/",
+        )
+
+        self.assertFalse(response.streaming)
+        result = response.json()
+        self.assertEqual(result[0]["result"][0]["name"], tag.name)
+        self.assertEqual(result[1]["result"], [])
+
+    def test_async_atomic_batch_rolls_back_all_changes(self):
+        response = self.post_batch(
+            [("Tag.create", [{"name": "batch-tag"}]), ("Tag.create", [{}])],
+            endpoint="/async/json-rpc/",
+            headers={"X-RPC-Atomic": "true"},
+        )
+
+        result = response.json()
+        self.assertIn("Transaction rolled back", result[0]["error"]["message"])
+        self.assertFalse(Tag.objects.filter(name="batch-tag").exists())
+
+    def test_async_batch_requires_permissions(self):
+        remove_perm_from_user(self.tester, "management.view_tag")
+
+        response = self.post_batch(
+            [("Tag.filter", [{"pk": -1}])], endpoint="/async/json-rpc/"
+        )
+
+        self.assertIn("Authentication failed", response.json()[0]["error"]["message"])
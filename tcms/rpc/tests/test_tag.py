@@ -5,7 +5,7 @@ from django.conf import settings
 
 from tcms.management.models import Tag
 from tcms.rpc.tests.utils import APIPermissionsTestCase, APITestCase
-from tcms.tests.factories import TagFactory
+from tcms.tests.factories import TagFactory, TestCaseFactory
 from tcms.xmlrpc_wrapper import XmlRPCFault
 
 
@@ -63,6 +63,31 @@ class TestTagFilter(APITestCase):
         self.assertIn("run", test_tag[0])
         self.assertIn("execution", test_tag[0])
 
+    def test_get_tags_with_keyset_pagination(self):
+        # python is returned twice, once for every TC
+        for _ in range(2):
+            TestCaseFactory().add_tag(self.tag_python)
+
+        query = {"name__in": ["python", "fedora", "db"]}
+        page = self.rpc_client.Tag.filter(query, 2)
+        self.assertEqual(page["next_cursor"], self.tag_fedora.pk)
+        self.assertEqual(2, len(page["results"]))
+        self.assertEqual(page["results"][0]["id"], self.tag_db.pk)
+        self.assertEqual(page["results"][1]["id"], self.tag_fedora.pk)
+
+        page = self.rpc_client.Tag.filter(query, 2, page["next_cursor"])
+        self.assertIsNone(page["next_cursor"])
+        self.assertEqual(2, len(page["results"]))
+        self.assertEqual(page["results"][0]["id"], self.tag_python.pk)
+        self.assertEqual(page["results"][1]["id"], self.tag_python.pk)
+
+    def test_get_tags_with_invalid_limit(self):
+        for limit in (0, -1):
+            with self.assertRaisesRegex(
+                XmlRPCFault, "limit must be a positive integer"
+            ):
+                self.rpc_client.Tag.filter({}, limit)
+
 
 class TestTagCreate(APIPermissionsTestCase):
     permission_label = "management.add_tag"
@@ -15,7 +15,12 @@ from tcms.core.helpers import comments
 from tcms.management.models import Priority
 from tcms.rpc.api.testcase import _validate_cc_list
 from tcms.rpc.tests.utils import APIPermissionsTestCase, APITestCase
-from tcms.testcases.models import Category, TestCase, TestCaseStatus
+from tcms.testcases.models import (
+    Category,
+    TestCase,
+    TestCaseLatestHistory,
+    TestCaseStatus,
+)
 from tcms.tests import remove_perm_from_user
 from tcms.tests.factories import (
     CategoryFactory,
@@ -174,6 +179,18 @@ class TestCaseFilter(APITestCase):
             test_case.save()
             cls.cases.append(test_case)
 
+    def test_filter_with_fields(self):
+        result = self.rpc_client.TestCase.filter(
+            {"pk__in": [self.cases[0].pk, self.cases[1].pk]},
+            None,
+            None,
+            ["summary"],
+        )
+
+        self.assertEqual(2, len(result))
+        for case, record in zip(self.cases, result):
+            self.assertEqual(record, {"id": case.pk, "summary": case.summary})
+
     def test_filter_query_none(self):
         result = self.rpc_client.TestCase.filter()
 
@@ -206,6 +223,30 @@ class TestCaseFilter(APITestCase):
         self.assertIsNotNone(cases)
         self.assertEqual(len(cases), self.cases_count)
 
+    def test_filter_returns_latest_text_once_per_case(self):
+        test_case = self.cases[0]
+        for revision in range(3):
+            test_case.text = f"Revision {revision}"
+            test_case.save()
+
+        result = self.rpc_client.TestCase.filter({"pk": test_case.pk})
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["id"], test_case.pk)
+        self.assertEqual(result[0]["text"], "Revision 2")
+
+    def test_filter_returns_cases_without_latest_history_pointer(self):
+        test_case = self.cases[0]
+        test_case.text = "Loaded from fixture"
+        test_case.save()
+        # e.g. after loaddata or when old history has been pruned
+        TestCaseLatestHistory.objects.filter(case=test_case).delete()
+
+        result = self.rpc_client.TestCase.filter({"pk": test_case.pk})
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["text"], "Loaded from fixture")
+
     @parameterized.expand(
         [
             ("both_values_are_not_set", {}, None, None, 0),
@@ -8,11 +8,21 @@ from attachments.models import Attachment
 from django.forms.models import model_to_dict
 from django.test import override_settings
 from django.utils import timezone
+from mock import DEFAULT, Mock, patch
 
 from tcms.core.contrib.linkreference.models import LinkReference
 from tcms.core.helpers import comments
+from tcms.rpc.api import testexecution
+from tcms.rpc.api.forms.testrun import CachedClean
 from tcms.rpc.tests.utils import APIPermissionsTestCase, APITestCase
-from tcms.testruns.models import TestExecution, TestExecutionStatus, TestExecutionTag
+from tcms.testcases.models import BugSystem
+from tcms.testruns.models import (
+    OpenTestRun,
+    PendingTrackerComment,
+    TestExecution,
+    TestExecutionStatus,
+    TestExecutionTag,
+)
 from tcms.tests import remove_perm_from_user, user_should_have_perm
 from tcms.tests.factories import (
     BuildFactory,
@@ -252,6 +262,28 @@ class TestExecutionAddLink(APITestCase):
                 {"execution_id": self.execution.pk, "name": name, "url": url}
             )
 
+    def test_add_link_does_not_wait_for_tracker(self):
+        bug_system = BugSystem.objects.create(  # nosec:B106:hardcoded_password_funcarg
+            name="GitHub for add_link",
+            tracker_type="tcms.issuetracker.types.GitHub",
+            base_url="https://github.com/kiwitcms/add-link",
+            api_url="https://api.github.com",
+            api_username="kiwitcms",
+            api_password="token",
+        )
+        url = "https://github.com/kiwitcms/add-link/issues/1"
+
+        result = self.rpc_client.TestExecution.add_link(
+            {"execution_id": self.execution.pk, "is_defect": True, "url": url},
+            True,
+        )
+
+        self.assertEqual(result["url"], url)
+        comment = PendingTrackerComment.objects.get(execution=self.execution)
+        self.assertEqual(comment.bug_system, bug_system)
+        self.assertEqual(comment.issue_url, url)
+        self.assertEqual(comment.attempts, 0)
+
 
 class TestExecutionAddLinkPermissions(APIPermissionsTestCase):
     """Test permissions of TestExecution.add_link"""
@@ -399,6 +431,30 @@ class TestExecutionFilter(APITestCase):
         self.assertEqual(execution["status"], self.status_idle.pk)
         self.assertIn("expected_duration", execution)
 
+    def test_filter_with_fields(self):
+        result = self.rpc_client.TestExecution.filter(
+            {"run": self.execution.run.pk, "actual_duration__isnull": True},
+            None,
+            None,
+            ["status", "status__name"],
+        )
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(
+            result[0],
+            {
+                "id": self.execution.pk,
+                "status": self.status_idle.pk,
+                "status__name": self.status_idle.name,
+            },
+        )
+
+    def test_filter_with_unknown_fields(self):
+        with self.assertRaisesRegex(XmlRPCFault, "Unknown fields: case__text"):
+            self.rpc_client.TestExecution.filter(
+                {"pk": self.execution.pk}, None, None, ["status", "case__text"]
+            )
+
 
 class ActualDurationProperty(APITestCase):
     def test_calculation_of_actual_duration(self):
@@ -839,6 +895,224 @@ class TestExecutionUpdateStatus(APITestCase):
         self.assertNotEqual(self.execution_1.run.build, build03)
 
 
+@override_settings(LANGUAGE_CODE="en")
+class TestExecutionBulkUpdate(APITestCase):
+    @classmethod
+    def _fixture_setup(cls):
+        super()._fixture_setup()
+
+        cls.user = UserFactory()
+        cls.build = BuildFactory()
+        cls.status_positive = TestExecutionStatus.objects.filter(weight__gt=0).last()
+        cls.status_negative = TestExecutionStatus.objects.filter(weight__lt=0).last()
+
+    def test_bulk_update_multiple_executions(self):
+        execution_1 = TestExecutionFactory(tested_by=None)
+        execution_2 = TestExecutionFactory(tested_by=None)
+        history_count = execution_1.history.count()
+
+        results = self.rpc_client.TestExecution.bulk_update(
+            [
+                {"id": execution_1.pk, "status": self.status_positive.pk},
+                {
+                    "id": execution_2.pk,
+                    "status": self.status_negative.pk,
+                    "build": self.build.pk,
+                    "assignee": self.user.username,
+                },
+            ]
+        )
+
+        execution_1.refresh_from_db()
+        execution_2.refresh_from_db()
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]["id"], execution_1.pk)
+        self.assertEqual(results[0]["result"]["status"], self.status_positive.pk)
+        self.assertEqual(
+            results[0]["result"]["tested_by__username"], self.api_user.username
+        )
+        self.assertEqual(execution_1.status, self.status_positive)
+        self.assertEqual(execution_1.tested_by, self.api_user)
+        self.assertEqual(execution_1.build, execution_1.run.build)
+
+        self.assertEqual(results[1]["id"], execution_2.pk)
+        self.assertEqual(results[1]["result"]["build__name"], self.build.name)
+        self.assertEqual(execution_2.status, self.status_negative)
+        self.assertEqual(execution_2.build, self.build)
+        self.assertEqual(execution_2.assignee, self.user)
+
+        # history is recorded together with the changelog
+        self.assertEqual(execution_1.history.count(), history_count + 1)
+        latest = execution_1.history.latest()
+        self.assertEqual(latest.history_user, self.api_user)
+        self.assertIn("status_id", latest.history_change_reason)
+
+        # per-status counters of the parent TestRun are updated as well
+        self.assertEqual(
+            execution_2.run.statistics()[0]["status"], self.status_negative.pk
+        )
+
+        # the new assignee sees the TestRun on their dashboard
+        self.assertTrue(
+            OpenTestRun.objects.filter(user=self.user, run=execution_2.run).exists()
+        )
+
+    def test_bulk_update_reports_errors_per_item(self):
+        execution = TestExecutionFactory()
+        other_execution = TestExecutionFactory()
+
+        results = self.rpc_client.TestExecution.bulk_update(
+            [
+                {"id": -1, "status": self.status_positive.pk},
+                {"id": other_execution.pk, "build": -1},
+                {"id": execution.pk, "sortkey": 42},
+                "not a dictionary",
+                {"id": [execution.pk], "sortkey": 43},
+                {"sortkey": 44},
+            ]
+        )
+        execution.refresh_from_db()
+        other_execution.refresh_from_db()
+
+        self.assertEqual(results[0]["id"], -1)
+        self.assertIn("error", results[0])
+
+        self.assertEqual(results[1]["id"], other_execution.pk)
+        self.assertIn("build", results[1]["error"])
+        self.assertNotEqual(other_execution.build_id, -1)
+
+        self.assertEqual(results[2]["result"]["sortkey"], 42)
+        self.assertEqual(execution.sortkey, 42)
+
+        self.assertEqual(
+            results[3], {"id": None, "error": {"__all__": ["Must be a dictionary"]}}
+        )
+        self.assertEqual(
+            results[4], {"id": None, "error": {"id": ["Must be an integer"]}}
+        )
+        self.assertEqual(
+            results[5], {"id": None, "error": {"id": ["Must be an integer"]}}
+        )
+
+    def test_bulk_update_with_unhashable_values(self):
+        execution = TestExecutionFactory()
+        other_execution = TestExecutionFactory()
+
+        results = self.rpc_client.TestExecution.bulk_update(
+            [
+                {"id": execution.pk, "status": [self.status_positive.pk]},
+                {"id": other_execution.pk, "status": self.status_positive.pk},
+            ]
+        )
+
+        self.assertIn("status", results[0]["error"])
+        self.assertEqual(results[1]["result"]["status"], self.status_positive.pk)
+
+    def test_bulk_update_does_not_retry_failed_lookups(self):
+        clean = Mock(side_effect=TypeError("from clean()"))
+        cached_clean = CachedClean(clean, "status", {})
+
+        with self.assertRaisesRegex(TypeError, "from clean()"):
+            cached_clean(self.status_positive.pk)
+        clean.assert_called_once_with(self.status_positive.pk)
+
+    def test_bulk_update_rejects_duplicate_ids(self):
+        execution = TestExecutionFactory(sortkey=1)
+
+        results = self.rpc_client.TestExecution.bulk_update(
+            [
+                {"id": execution.pk, "sortkey": 42},
+                {"id": execution.pk, "sortkey": 43},
+            ]
+        )
+        execution.refresh_from_db()
+
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertEqual(result["id"], execution.pk)
+            self.assertIn("id", result["error"])
+        self.assertEqual(execution.sortkey, 1)
+
+    def test_bulk_update_skips_unchanged_executions(self):
+        execution = TestExecutionFactory(sortkey=42)
+        history_count = execution.history.count()
+
+        results = self.rpc_client.TestExecution.bulk_update(
+            [{"id": execution.pk, "sortkey": 42}]
+        )
+
+        self.assertEqual(results[0]["result"]["sortkey"], 42)
+        self.assertEqual(execution.history.count(), history_count)
+
+    def _fail_concurrently(self, _values, test_execution, *_args):
+        # somebody else changes the status after bulk_update() has loaded it
+        concurrent = TestExecution.objects.get(pk=test_execution.pk)
+        concurrent.status = self.status_negative
+        concurrent.save()
+        return DEFAULT
+
+    def test_bulk_update_counters_with_stale_executions(self):
+        execution = TestExecutionFactory()
+
+        with patch.object(
+            testexecution,
+            "_apply_defaults",
+            wraps=testexecution._apply_defaults,  # pylint: disable=protected-access
+            side_effect=self._fail_concurrently,
+        ):
+            self.rpc_client.TestExecution.bulk_update(
+                [{"id": execution.pk, "status": self.status_positive.pk}]
+            )
+
+        self.assertEqual(
+            {row["status"]: row["count"] for row in execution.run.statistics()},
+            {self.status_positive.pk: 1},
+        )
+
+    def test_bulk_update_when_case_text_version_is_string_latest(self):
+        execution = TestExecutionFactory()
+        execution.case.summary = "Summary Updated"
+        execution.case.save()
+
+        results = self.rpc_client.TestExecution.bulk_update(
+            [{"id": execution.pk, "case_text_version": "latest"}]
+        )
+        execution.refresh_from_db()
+
+        latest_version = execution.case.history.latest().history_id
+        self.assertEqual(results[0]["result"]["case_text_version"], latest_version)
+        self.assertEqual(execution.case_text_version, latest_version)
+
+
+class TestExecutionBulkUpdatePermissions(APIPermissionsTestCase):
+    permission_label = "testruns.change_testexecution"
+
+    @classmethod
+    def _fixture_setup(cls):
+        super()._fixture_setup()
+
+        cls.execution = TestExecutionFactory()
+
+    def verify_api_with_permission(self):
+        results = self.rpc_client.TestExecution.bulk_update(
+            [{"id": self.execution.pk, "sortkey": 99}]
+        )
+        self.execution.refresh_from_db()
+
+        self.assertEqual(results[0]["result"]["sortkey"], 99)
+        self.assertEqual(self.execution.sortkey, 99)
+
+    def verify_api_without_permission(self):
+        with self.assertRaisesRegex(
+            XmlRPCFault,
+            'Authentication failed when calling "TestExecution.bulk_update"',
+        ):
+            self.rpc_client.TestExecution.bulk_update(
+                [{"id": self.execution.pk, "sortkey": 99}]
+            )
+
+
 class TestExecutionRemovePermissions(APIPermissionsTestCase):
     permission_label = "testruns.delete_testexecution"
 
@@ -10,7 +10,7 @@ from django.utils.translation import gettext_lazy as _
 
 from tcms.rpc.tests.utils import APIPermissionsTestCase, APITestCase
 from tcms.testcases.models import TestCaseStatus
-from tcms.testruns.models import TestExecution, TestRun, TestRunCC
+from tcms.testruns.models import TestExecution, TestExecutionStatus, TestRun, TestRunCC
 from tcms.tests import remove_perm_from_user, user_should_have_perm
 from tcms.tests.factories import (
     BuildFactory,
@@ -826,3 +826,41 @@ class TestRunGetCC(APIPermissionsTestCase):
             'Authentication failed when calling "TestRun.get_cc"',
         ):
             self.rpc_client.TestRun.get_cc(self.test_run.pk)
+
+
+class TestRunStatistics(APIPermissionsTestCase):
+    permission_label = "testruns.view_testrun"
+
+    @classmethod
+    def _fixture_setup(cls):
+        super()._fixture_setup()
+
+        cls.test_run = TestRunFactory()
+        cls.test_case = TestCaseFactory()
+        cls.test_case.save()  # we need 1 version in the history
+        cls.executions = cls.test_run.create_execution_batch(
+            [cls.test_case, cls.test_case]
+        )
+
+        cls.passed = TestExecutionStatus.objects.filter(weight__gt=0).first()
+        cls.executions[0].status = cls.passed
+        cls.executions[0].save()
+
+    def verify_api_with_permission(self):
+        result = self.rpc_client.TestRun.statistics(self.test_run.pk)
+
+        self.assertEqual(result["total"], 2)
+        self.assertEqual(result["complete_percent"], 50.0)
+        self.assertEqual(result["failing_percent"], 0.0)
+        self.assertEqual(result["passing_percent"], 50.0)
+
+        counts = {status["status"]: status["count"] for status in result["statuses"]}
+        self.assertEqual(counts[self.passed.pk], 1)
+        self.assertEqual(sum(counts.values()), 2)
+
+    def verify_api_without_permission(self):
+        with self.assertRaisesRegex(
+            XmlRPCFault,
+            'Authentication failed when calling "TestRun.statistics"',
+        ):
+            self.rpc_client.TestRun.statistics(self.test_run.pk)
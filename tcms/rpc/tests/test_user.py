@@ -2,6 +2,8 @@
 # pylint: disable=attribute-defined-outside-init, invalid-name, objects-update-used
 
 
+import json
+
 from django.contrib.auth.models import Group, Permission
 from django.test import TestCase
 
@@ -358,7 +360,8 @@ class TestUserFilterJsonRpc(APIPermissionsTestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        result = response.json()
+        self.assertTrue(response.streaming)
+        result = json.loads(b"".join(response.streaming_content))
         self.assertIn("result", result)
         users = result["result"]
         self.assertEqual(len(users), 1)
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import builtins
 import io
 import json
 import time
@@ -8,6 +7,7 @@ from http import HTTPStatus
 
 from attachments import views as attachment_views
 from attachments.models import Attachment
+from django.db.models import Max
 from django.http import HttpRequest
 from django.middleware.csrf import get_token
 from mock import MagicMock
@@ -104,19 +104,113 @@ def add_attachment(obj_id, app_model, user, filename, b64content):
         raise ValueError(errors)
 
 
-def filter_distinct(qs):
+def filter_distinct(qs, key="id"):
     """
     Python implementation of .distinct("id")!
+
+    Records are streamed from the database and only the keys which
+    have already been seen are kept in memory. Because the first record
+    for every key wins ``qs`` must be ordered accordingly.
     """
-    unique_ids = []
+    unique_ids = set()
 
-    # pylint: disable=nested-function-found
-    def distinct_only(record):
+    records = qs.iterator() if hasattr(qs, "iterator") else qs
+    for record in records:
         # skip duplicate records
-        if record["id"] in unique_ids:
-            return None
+        if record[key] in unique_ids:
+            continue
+
+        unique_ids.add(record[key])
+        yield record
+
+
+def latest_history_ids(history_qs):
+    """
+    Return a subquery with the ``history_id`` of the latest historical
+    record for every object in ``history_qs``. Works on all databases,
+    unlike .distinct("id") which requires DISTINCT ON!
+    """
+    return (
+        history_qs.order_by()
+        .values("id")
+        .annotate(latest=Max("history_id"))
+        .values("latest")
+    )
+
 
-        unique_ids.append(record["id"])
-        return record
+def paginate(queryset, limit=None, after_id=None, key="id"):
+    """
+    Opt-in keyset pagination for the ``*.filter`` RPC methods!
+
+    When ``limit`` is ``None`` return all records as a queryset, which is
+    streamed by the JSON-RPC handler, see
+    :func:`tcms.rpc.handlers.KiwiTCMSHandlerMixin.stream`. Otherwise
+    always return a dictionary with at most ``limit`` distinct objects,
+    ordered by ``key`` and ``next_cursor`` which should be passed as
+    ``after_id`` to fetch the next page. ``next_cursor`` is ``None`` on the
+    last page.
+
+    .. note::
+
+        ``queryset`` may contain more than one record per object, e.g. when
+        values of a many-to-many relationship are returned. The limit is
+        applied to the number of objects, not to the number of records!
+
+    :raises ValueError: if ``limit`` is not a positive integer
+    """
+    if after_id is not None:
+        queryset = queryset.filter(**{f"{key}__gt": after_id})
 
-    return builtins.filter(distinct_only, qs)
+    if limit is None:
+        return queryset
+
+    page_ids, next_cursor = page_keys(queryset, limit, key)
+    return {
+        "results": list(queryset.filter(**{f"{key}__in": page_ids}).order_by(key)),
+        "next_cursor": next_cursor,
+    }
+
+
+def page_keys(queryset, limit, key="id"):
+    """
+    Return at most ``limit`` distinct values of ``key``, in ascending order,
+    together with the cursor for the next page. The cursor is ``None`` on
+    the last page!
+
+    :raises ValueError: if ``limit`` is not a positive integer
+    """
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+        raise ValueError(f"limit must be a positive integer, got {limit!r}")
+
+    # fetch one more key to find out if there are more pages
+    page_ids = list(
+        queryset.values_list(key, flat=True).order_by(key).distinct()[: limit + 1]
+    )
+    if len(page_ids) > limit:
+        page_ids = page_ids[:limit]
+        return page_ids, page_ids[-1]
+
+    return page_ids, None
+
+
+def select_fields(fields, allowed, key="id"):
+    """
+    Validate a client specified projection against the ``allowed``
+    field names and return the list of values to select. When ``fields``
+    is empty all ``allowed`` fields are returned. ``key`` is always
+    included so that records remain distinct!
+
+    :raises ValueError: if ``fields`` contains names which are not allowed
+    """
+    if not fields:
+        return list(allowed)
+
+    unknown = set(fields) - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    values = [key]
+    for field in fields:
+        if field not in values:
+            values.append(field)
+    return values
@@ -2,15 +2,39 @@
 
 # Licensed under the GPL 2.0: https://www.gnu.org/licenses/old-licenses/gpl-2.0.html
 
+from types import GeneratorType
+
+from django.http import StreamingHttpResponse
 from modernrpc.constants import Protocol
 from modernrpc.server import RpcServer
 
-xml_rpc_server = RpcServer(supported_protocol=Protocol.XML_RPC)
-json_rpc_server = RpcServer(supported_protocol=Protocol.JSON_RPC)
+from tcms.rpc.handlers import safe_fields
+
+
+class KiwiTCMSRpcServer(RpcServer):  # pylint: disable=missing-permission-required
+    @staticmethod
+    def build_response(handler, result_data):
+        # see tcms.rpc.handlers.StreamingJsonSerializer
+        if isinstance(result_data, GeneratorType):
+            return StreamingHttpResponse(
+                result_data, content_type=handler.response_content_type
+            )
+
+        return RpcServer.build_response(handler, result_data)
 
 
-def rpc_method(name, auth, context_target=None):
+xml_rpc_server = KiwiTCMSRpcServer(supported_protocol=Protocol.XML_RPC)
+json_rpc_server = KiwiTCMSRpcServer(supported_protocol=Protocol.JSON_RPC)
+
+
+def rpc_method(name, auth, context_target=None, safe=None):
+    # *func* may also be a coroutine function. It is awaited by the async
+    # end-points, see KiwiTCMSHandlerMixin.aprocess_single_request(), and
+    # executed via async_to_sync() by the regular ones
     def decorator(func):  # pylint: disable=nested-function-found
+        if safe:
+            safe_fields[name] = frozenset(safe)
+
         json_rpc_server.register_procedure(
             func, name=name, auth=auth, context_target=context_target
         )
@@ -76,6 +76,15 @@ EMAIL_VALIDATORS = ()
 #  EMAIL_HOST_USER = 'smtp_username'
 #  EMAIL_HOST_PASSWORD = 'smtp_password'
 
+# Notifications are sent in the background by ``./manage.py send_emails``,
+# at most EMAIL_OUTBOX_BATCH_SIZE messages over a single connection.
+# Messages which fail are retried after EMAIL_OUTBOX_RETRY_DELAY seconds,
+# doubled after every attempt. After EMAIL_OUTBOX_MAX_ATTEMPTS they are
+# dropped and an error is logged
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 8
+EMAIL_OUTBOX_RETRY_DELAY = 60
+
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # ~~ You may want to override the following settings as well
@@ -167,6 +176,15 @@ CACHES = {
     }
 }
 
+# For how many seconds the Site object, used to build full URLs, is cached in
+# each process. Changes made via the admin are visible immediately in the
+# process which made them, other processes may take up to this long
+SITE_CACHE_TIMEOUT = 60
+
+# For how many seconds the results of expensive health checks, e.g. for
+# unapplied migrations, are cached in each process. See /healthz/
+HEALTH_CHECK_INTERVAL = 300
+
 # https://docs.djangoproject.com/en/5.1/ref/settings/#std-setting-STORAGES
 STORAGES = {
     "default": {
@@ -238,6 +256,16 @@ JIRA_ISSUE_TYPE = "Bug"
 # via 1-click integration.
 REDMINE_TRACKER_NAME = "Bugs"
 
+# Comments which link test executions to existing issues in external trackers
+# are posted in the background by ``./manage.py post_tracker_comments``.
+# Comments which fail are retried after TRACKER_COMMENT_RETRY_DELAY seconds,
+# doubled after every attempt, until TRACKER_COMMENT_MAX_ATTEMPTS is reached
+TRACKER_COMMENT_MAX_ATTEMPTS = 8
+TRACKER_COMMENT_RETRY_DELAY = 60
+
+# Minimum number of seconds between 2 comments posted to the same tracker
+TRACKER_COMMENT_INTERVAL = 1
+
 # Anonymous/GDPR compliant analytics via https://plausible.io/
 # see https://plausible.io/privacy-focused-web-analytics for more details
 ANONYMOUS_ANALYTICS = "runserver" not in sys.argv and "test" not in sys.argv
@@ -374,7 +402,7 @@ INSTALLED_APPS = TENANT_APPS + [
     "django_extensions",
     "tree_queries",
     "vinaigrette",
-    "tcms.core",
+    "tcms.core.apps.AppConfig",
     "tcms.kiwi_auth",
     "tcms.telemetry",
     "tcms.rpc.apps.AppConfig",
@@ -479,6 +507,37 @@ MODERNRPC_HANDLERS = [
     "tcms.rpc.handlers.KiwiTCMSJsonRpcHandler",
 ]
 
+# streams large results, see KiwiTCMSHandlerMixin.stream()
+MODERNRPC_JSON_SERIALIZER = {
+    "class": "tcms.rpc.handlers.StreamingJsonSerializer",
+    "kwargs": {},
+}
+
+# maximum number of requests inside a single JSON-RPC batch
+RPC_BATCH_SIZE_LIMIT = 1000
+
+# For how many seconds permissions resolved for RPC methods are cached.
+# Changes are visible immediately when CACHES is shared between all
+# processes, e.g. memcached, otherwise they may take up to this long
+RPC_PERMISSIONS_CACHE_TIMEOUT = 60
+
+# For how many seconds the list of bug trackers used to resolve URLs is
+# cached in each process. Changes are visible immediately when CACHES is
+# shared between all processes, otherwise they may take up to this long
+BUG_SYSTEMS_INDEX_TIMEOUT = 60
+
+# For how many seconds details about bugs, see Bug.details_many, are cached.
+# URLs for which details could not be fetched are retried sooner
+BUG_DETAILS_CACHE_TIMEOUT = 3600
+BUG_DETAILS_FAILURE_CACHE_TIMEOUT = 300
+
+# Maximum number of concurrent requests to issue trackers made by Bug.details_many
+BUG_DETAILS_MAX_WORKERS = 8
+
+# Clients for external issue trackers are reused between requests in the same
+# thread. Clients which haven't been used for this many seconds are closed
+ISSUE_TRACKER_CLIENT_IDLE_TIMEOUT = 300
+
 # in alphabetic order
 MODERNRPC_METHODS_MODULES = [
     "tcms.telemetry.api",
@@ -28,6 +28,9 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
     }
 }
+# the database is often recreated during development and testing
+SITE_CACHE_TIMEOUT = 0
+
 # django-debug-toolbar settings
 
 MIDDLEWARE += [  # noqa: F405
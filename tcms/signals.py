@@ -21,6 +21,8 @@ altering the following setting::
     INSTALLED_APPS += ['my_custom_app']
 """
 
+import threading
+
 from django.db.models import ObjectDoesNotExist
 from django.dispatch import Signal, receiver
 from django.utils.translation import gettext_lazy as _
@@ -37,6 +39,20 @@ __all__ = [
     "handle_emails_post_plan_save",
     "handle_emails_post_run_save",
     "handle_emails_post_bug_save",
+    "handle_status_count_post_execution_save",
+    "handle_status_count_post_execution_delete",
+    "handle_user_summary_post_plan_save",
+    "handle_user_summary_post_plan_delete",
+    "handle_user_summary_post_run_save",
+    "handle_user_summary_pre_run_delete",
+    "handle_executions_pre_run_delete",
+    "handle_executions_post_run_delete",
+    "handle_user_summary_post_execution_save",
+    "handle_user_summary_post_execution_delete",
+    "handle_permissions_changed",
+    "handle_bug_systems_changed",
+    "handle_migrations_applied",
+    "handle_sites_changed",
 ]
 
 
@@ -262,3 +278,254 @@ def handle_emails_post_bug_save(sender, instance, created=False, **kwargs):
             "comment": comments.last(),
         },
     )
+
+
+def handle_status_count_post_execution_save(sender, instance, created=False, **kwargs):
+    """
+    Update the per-status execution counters of the parent TestRun(s)
+    after a TestExecution has been created or updated!
+    """
+    from collections import Counter
+
+    from tcms.testruns.models import TestRunStatusCount
+
+    if kwargs.get("raw", False):
+        return
+
+    deltas = Counter()
+    deltas[(instance.run_id, instance.build_id, instance.status_id)] += 1
+
+    if not created:
+        # set by KiwiHistoricalRecords.pre_save()
+        previous = getattr(instance, "previous", None)
+        if previous is None:
+            return
+        deltas[(previous.run_id, previous.build_id, previous.status_id)] -= 1
+
+    TestRunStatusCount.update_counts(deltas)
+
+
+def handle_status_count_post_execution_delete(sender, instance, origin=None, **kwargs):
+    """
+    Update the per-status execution counters of the parent TestRun
+    after a TestExecution has been deleted!
+    """
+    from tcms.testruns.models import TestRunStatusCount
+
+    if _run_is_being_deleted(instance.run_id, origin):
+        return
+
+    TestRunStatusCount.update_counts(
+        {(instance.run_id, instance.build_id, instance.status_id): -1}
+    )
+
+
+def handle_user_summary_post_plan_save(sender, instance, created=False, **kwargs):
+    """
+    Update the dashboard summary of the TestPlan author after
+    a TestPlan has been created or updated!
+    """
+    from collections import Counter
+
+    from tcms.testruns.models import UserSummary
+
+    if kwargs.get("raw", False):
+        return
+
+    deltas = Counter()
+    deltas[(instance.author_id, "plans")] += 1
+    deltas[(instance.author_id, "disabled_plans")] += int(not instance.is_active)
+
+    if not created:
+        # set by KiwiHistoricalRecords.pre_save()
+        previous = getattr(instance, "previous", None)
+        if previous is None:
+            return
+        deltas[(previous.author_id, "plans")] -= 1
+        deltas[(previous.author_id, "disabled_plans")] -= int(not previous.is_active)
+
+    UserSummary.update_counts(deltas)
+
+
+def handle_user_summary_post_plan_delete(sender, instance, **kwargs):
+    """
+    Update the dashboard summary of the TestPlan author after
+    a TestPlan has been deleted!
+    """
+    from tcms.testruns.models import UserSummary
+
+    UserSummary.update_counts(
+        {
+            (instance.author_id, "plans"): -1,
+            (instance.author_id, "disabled_plans"): -int(not instance.is_active),
+        }
+    )
+
+
+def handle_user_summary_post_run_save(sender, instance, created=False, **kwargs):
+    """
+    Update the list of open test runs for the manager and default tester
+    after a TestRun has been created, finished or reassigned!
+    """
+    from tcms.testruns.models import OpenTestRun
+
+    if kwargs.get("raw", False):
+        return
+
+    if not created:
+        # set by KiwiHistoricalRecords.pre_save()
+        previous = getattr(instance, "previous", None)
+        if previous is not None and (
+            previous.manager_id,
+            previous.default_tester_id,
+            previous.stop_date,
+        ) == (instance.manager_id, instance.default_tester_id, instance.stop_date):
+            return
+
+    OpenTestRun.sync([instance.pk])
+
+
+def handle_user_summary_pre_run_delete(sender, instance, **kwargs):
+    """
+    Update the dashboard summary of all participants before a TestRun
+    is deleted!
+    """
+    from tcms.testruns.models import OpenTestRun
+
+    OpenTestRun.discard([instance.pk])
+
+
+# PKs of TestRun objects which are being deleted in the current thread and
+# the object, or QuerySet, whose delete() is deleting them,
+# see handle_executions_pre_run_delete()
+_deleted_runs = threading.local()
+
+
+def _run_is_being_deleted(run_id, origin):
+    # note: a delete() which has failed may leave its TestRuns behind. They are
+    # ignored b/c any later delete() has a different origin
+    return (
+        origin is not None
+        and getattr(_deleted_runs, "origin", None) is origin
+        and run_id in _deleted_runs.ids
+    )
+
+
+def handle_executions_pre_run_delete(sender, instance, origin=None, **kwargs):
+    """
+    Mark a TestRun as being deleted. Signal handlers for its executions,
+    which are deleted together with it, skip updating counters and open
+    test runs one row at a time, see :func:`handle_executions_post_run_delete`!
+    """
+    if getattr(_deleted_runs, "origin", None) is not origin:
+        _deleted_runs.origin = origin
+        _deleted_runs.ids = set()
+    _deleted_runs.ids.add(instance.pk)
+
+
+def handle_executions_post_run_delete(sender, instance, origin=None, **kwargs):
+    """
+    Unmark a TestRun after it has been deleted together with all of
+    its executions. Its counters have been deleted as well and its
+    participants updated before that!
+    """
+    if getattr(_deleted_runs, "origin", None) is not origin:
+        return
+
+    _deleted_runs.ids.discard(instance.pk)
+    if not _deleted_runs.ids:
+        _deleted_runs.origin = None
+
+
+def handle_user_summary_post_execution_save(sender, instance, created=False, **kwargs):
+    """
+    Update the list of open test runs for the assignee(s)
+    after a TestExecution has been created or reassigned!
+    """
+    from tcms.testruns.models import OpenTestRun
+
+    if kwargs.get("raw", False):
+        return
+
+    if created:
+        if instance.assignee_id:
+            OpenTestRun.sync([instance.run_id], {instance.assignee_id})
+        return
+
+    # set by KiwiHistoricalRecords.pre_save()
+    previous = getattr(instance, "previous", None)
+    if previous is None or (previous.run_id, previous.assignee_id) == (
+        instance.run_id,
+        instance.assignee_id,
+    ):
+        return
+
+    OpenTestRun.sync(
+        {previous.run_id, instance.run_id},
+        {previous.assignee_id, instance.assignee_id},
+    )
+
+
+def handle_user_summary_post_execution_delete(sender, instance, origin=None, **kwargs):
+    """
+    Update the list of open test runs for the assignee
+    after a TestExecution has been deleted!
+    """
+    from tcms.testruns.models import OpenTestRun
+
+    if _run_is_being_deleted(instance.run_id, origin):
+        return
+
+    if instance.assignee_id:
+        OpenTestRun.sync([instance.run_id], {instance.assignee_id}, remove_only=True)
+
+
+def handle_permissions_changed(sender, **kwargs):
+    """
+    Invalidate the cached permissions used by RPC methods after
+    users, groups or their permissions have been modified!
+    """
+    # only new users are interesting
+    if kwargs.get("created") is False:
+        return
+
+    # m2m_changed is sent both before and after the change
+    if kwargs.get("action", "post_").startswith("pre_"):
+        return
+
+    from tcms.rpc.decorators import invalidate_permissions
+
+    invalidate_permissions()
+
+
+def handle_bug_systems_changed(sender, **kwargs):
+    """
+    Rebuild the index used to find the BugSystem for a URL,
+    see :func:`tcms.rpc.api.utils.tracker_from_url` and drop
+    clients connected with the previous settings!
+    """
+    from tcms.issuetracker.base import forget_rpc_connections
+    from tcms.rpc.api.utils import invalidate_bug_systems
+
+    invalidate_bug_systems()
+    forget_rpc_connections(kwargs["instance"].pk)
+
+
+def handle_migrations_applied(sender, **kwargs):
+    """
+    Check for unapplied migrations again, see
+    :func:`tcms.core.health.unapplied_migrations`!
+    """
+    from tcms.core import health
+
+    health.forget()
+
+
+def handle_sites_changed(sender, **kwargs):
+    """
+    Drop the Site objects cached by
+    :func:`tcms.core.utils.sites.current_site`!
+    """
+    from tcms.core.utils.sites import forget_sites
+
+    forget_sites()
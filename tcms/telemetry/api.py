@@ -1,11 +1,12 @@
-from django.db.models import CharField, Count, Value
-from django.db.models.functions import Concat
+from django.db.models import CharField, Count, FloatField, Q, Sum, Value
+from django.db.models.functions import Cast, Concat
 from django.utils.translation import gettext_lazy as _
 
+from tcms.rpc import utils
 from tcms.rpc.decorators import django_login_required
 from tcms.rpc.views import rpc_method
 from tcms.testcases.models import TestCase
-from tcms.testruns.models import TestExecution, TestExecutionStatus
+from tcms.testruns.models import TestExecution, TestExecutionStatus, TestRunStatusCount
 
 
 @rpc_method(
@@ -72,23 +73,61 @@ def _map_query_set(query_set, field):
     name="Testing.status_matrix",
     auth=django_login_required,
 )
-def status_matrix(query=None):
+def status_matrix(query=None, compact=None, run_after=None, run_limit=None):
     """
-    .. function:: RPC Testing.status_matrix(query)
+    .. function:: RPC Testing.status_matrix(query, compact, run_after, run_limit)
 
         Perform a search and return data_set needed to visualize the status matrix
         of test plans, test cases and test executions
 
         :param query: Field lookups for :class:`tcms.testcases.models.TestPlan`
         :type query: dict
+        :param compact: Return a columnar result instead of a dictionary of
+                        executions. Either ``"dense"`` or ``"sparse"``
+        :type compact: str
+        :param run_after: Only include test runs with PK greater than this value
+        :type run_after: int
+        :param run_limit: Include at most this many test runs. When there are
+                          more the result contains ``next_run`` which should be
+                          used as ``run_after`` for the next call
+        :type run_limit: int
         :return: A dictionary, containing the information about test executions
         :rtype: dict
+        :raises ValueError: if *run_limit* is not a positive integer
+
+        The compact result contains the following keys:
+
+        - ``case_ids``, ``case_summaries``: list of TCs, one row for each
+        - ``run_ids``, ``run_summaries``, ``run_plans``: list of TRs, one
+          column for each
+        - ``statuses``, ``executions``: for ``"dense"`` - lists of rows, each
+          containing one status ID and one TE ID per column or 0 if there is no
+          execution. For ``"sparse"`` ``executions`` is a list of
+          ``[row, column, status_id, execution_id]`` and ``statuses`` is missing
+        - ``statusColors``: dictionary of status colors, keyed by status ID
     """
     if query is None:
         query = {}
 
+    result = {}
     base_query = TestExecution.objects.filter(**query)
 
+    if run_after is not None:
+        base_query = base_query.filter(run_id__gt=run_after)
+
+    if run_limit is not None:
+        run_ids, next_run = utils.page_keys(base_query, run_limit, "run_id")
+        base_query = base_query.filter(run_id__in=run_ids)
+
+        if next_run is not None:
+            result["next_run"] = next_run
+
+    if compact:
+        result.update(  # pylint: disable=objects-update-used
+            _compact_status_matrix(base_query, compact == "sparse")
+        )
+        return result
+
     test_cases = list(
         base_query.values("case_id", "case__summary").order_by("case_id").distinct()
     )
@@ -111,13 +150,78 @@ def status_matrix(query=None):
 
     status_colors = dict(TestExecutionStatus.objects.values_list("pk", "color"))
 
-    return {
-        "cases": test_cases,
-        "executions": test_executions,
-        "plans": test_plans,
-        "runs": test_runs,
-        "statusColors": status_colors,
+    result.update(  # pylint: disable=objects-update-used
+        {
+            "cases": test_cases,
+            "executions": test_executions,
+            "plans": test_plans,
+            "runs": test_runs,
+            "statusColors": status_colors,
+        }
+    )
+    return result
+
+
+def _compact_status_matrix(base_query, sparse):
+    cases = _columns_for(base_query, "case_id", "case__summary")
+    runs = _columns_for(base_query, "run_id", "run__summary", "run__plan")
+
+    result = {
+        "case_ids": cases["case_id"],
+        "case_summaries": cases["case__summary"],
+        "run_ids": runs["run_id"],
+        "run_summaries": runs["run__summary"],
+        "run_plans": runs["run__plan"],
+        "statusColors": {},
     }
+    for status_id, color in TestExecutionStatus.objects.values_list("pk", "color"):
+        result["statusColors"][str(status_id)] = color
+
+    rows = dict(zip(cases["case_id"], range(len(cases["case_id"]))))
+    columns = dict(zip(runs["run_id"], range(len(runs["run_id"]))))
+    executions = base_query.values_list(
+        "case_id", "run_id", "status_id", "pk"
+    ).order_by("pk")
+
+    if sparse:
+        result["executions"] = []
+        for case_id, run_id, status_id, execution_id in executions.iterator():
+            result["executions"].append(
+                [rows[case_id], columns[run_id], status_id, execution_id]
+            )
+        return result
+
+    result["statuses"] = []
+    result["executions"] = []
+    for _case_id in cases["case_id"]:
+        result["statuses"].append([0] * len(columns))
+        result["executions"].append([0] * len(columns))
+
+    for case_id, run_id, status_id, execution_id in executions.iterator():
+        result["statuses"][rows[case_id]][columns[run_id]] = status_id
+        result["executions"][rows[case_id]][columns[run_id]] = execution_id
+
+    return result
+
+
+def _columns_for(base_query, *fields):
+    """
+    Distinct values of *fields*, ordered by the first one,
+    as a separate list for each field!
+    """
+    columns = {}
+    for field in fields:
+        columns[field] = []
+
+    for row in base_query.values_list(*fields).order_by(fields[0]).distinct():
+        for field, value in zip(fields, row):
+            columns[field].append(value)
+
+    return columns
+
+
+# lookups which are also valid for TestRunStatusCount, see _count_by_run_and_status()
+STATUS_COUNT_LOOKUPS = ("run", "run_id", "build", "build_id", "status", "status_id")
 
 
 @rpc_method(
@@ -131,52 +235,44 @@ def execution_trends(query=None):
     data_set = {}
     categories = []
     colors = []
-    counts = {}
+    status_names = {}
+    status_count = {
+        "positive": 0,
+        "negative": 0,
+        "neutral": 0,
+    }
 
     for status in TestExecutionStatus.objects.all():
         data_set[status.name] = []
         colors.append(status.color)
+        status_names[status.pk] = status.name
     data_set[str(_("TOTAL"))] = []
     colors.append("black")
 
-    status_count = {
-        "positive": 0,
-        "negative": 0,
-        "neutral": 0,
-    }
-    run_id = 0
-    for test_execution in (
-        TestExecution.objects.filter(**query)
-        .select_related("status")
-        .order_by("run_id")
-    ):
-        status = test_execution.status
-
-        if status.weight > 0:
-            status_count["positive"] += 1
-        elif status.weight < 0:
-            status_count["negative"] += 1
+    counts = {}
+    run_id = None
+    for row in _count_by_run_and_status(query):
+        if row["status__weight"] > 0:
+            status_count["positive"] += row["total"]
+        elif row["status__weight"] < 0:
+            status_count["negative"] += row["total"]
         else:
-            status_count["neutral"] += 1
+            status_count["neutral"] += row["total"]
 
-        if test_execution.run_id == run_id:
-            if status.name in counts:
-                counts[status.name] += 1
-            else:
-                counts[status.name] = 1
-
-        else:
-            _append_status_counts_to_result(counts, data_set)
+        if row["run_id"] != run_id:
+            if run_id is not None:
+                _append_status_counts_to_result(counts, data_set)
 
-            counts = {status.name: 1}
-            run_id = test_execution.run_id
+            counts = {}
+            run_id = row["run_id"]
             categories.append(run_id)
 
-    # append the last result
-    _append_status_counts_to_result(counts, data_set)
+        status_name = status_names[row["status_id"]]
+        counts[status_name] = counts.get(status_name, 0) + row["total"]
 
-    for _key, value in data_set.items():
-        del value[0]
+    # append the last result
+    if run_id is not None:
+        _append_status_counts_to_result(counts, data_set)
 
     return {
         "categories": categories,
@@ -186,6 +282,26 @@ def execution_trends(query=None):
     }
 
 
+def _count_by_run_and_status(query):
+    """
+    Number of executions grouped by TR and status. When possible read
+    the pre-aggregated values from TestRunStatusCount, otherwise count
+    the matching executions in the database!
+    """
+    if all(key.split("__")[0] in STATUS_COUNT_LOOKUPS for key in query):
+        queryset = TestRunStatusCount.objects.filter(count__gt=0, **query)
+        total = Sum("count")
+    else:
+        queryset = TestExecution.objects.filter(**query)
+        total = Count("pk")
+
+    return (
+        queryset.values("run_id", "status_id", "status__weight")
+        .annotate(total=total)
+        .order_by("run_id")
+    )
+
+
 def _append_status_counts_to_result(counts, result):
     total = 0
     for status_name in filter(lambda x: x != _("TOTAL"), result.keys()):
@@ -201,37 +317,58 @@ def _append_status_counts_to_result(counts, result):
     name="Testing.test_case_health",
     auth=django_login_required,
 )
-def test_case_health(query=None):
+def test_case_health(query=None, limit=30, min_executions=1):
+    """
+    .. function:: RPC Testing.test_case_health(query, limit, min_executions)
+
+        Return the test cases with the highest failure rate among the
+        selected test executions. Test cases which never failed are excluded!
+
+        :param query: Field lookups for :class:`tcms.testruns.models.TestExecution`
+        :type query: dict
+        :param limit: Maximum number of test cases to return
+        :type limit: int
+        :param min_executions: Ignore test cases with fewer executions
+        :type min_executions: int
+        :return: List of test cases and their execution counts, ordered by
+                 failure rate
+        :rtype: list(dict)
+        :raises ValueError: if *limit* or *min_executions* is not a positive integer
+    """
     if query is None:
         query = {}
 
-    all_test_executions = TestExecution.objects.filter(**query)
+    for name, value in (("limit", limit), ("min_executions", min_executions)):
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"{name} must be a positive integer, got {value!r}")
 
-    test_executions = _get_count_for(all_test_executions)
-    failed_test_executions = _get_count_for(
-        all_test_executions.filter(status__weight__lt=0)
+    data = (
+        TestExecution.objects.filter(**query)
+        .values("case_id", "case__summary")
+        .annotate(
+            count_all=Count("pk"),
+            count_fail=Count("pk", filter=Q(status__weight__lt=0)),
+        )
+        # remove all with 100% success rate, because they are not interesting
+        .filter(count_fail__gt=0, count_all__gte=min_executions)
+        .annotate(
+            failing_rate=Cast("count_fail", FloatField())
+            / Cast("count_all", FloatField())
+        )
+        .order_by("-failing_rate", "case_id")[:limit]
     )
 
-    data = {}
-    for value in test_executions:
-        data[value["case_id"]] = {
-            "case_id": value["case_id"],
-            "case_summary": value["case__summary"],
-            "count": {"all": value["count"], "fail": 0},
-        }
-
-    _count_test_executions(data, failed_test_executions, "fail")
+    result = []
+    for value in data:
+        result.append(
+            {
+                "case_id": value["case_id"],
+                "case_summary": value["case__summary"],
+                "count": {"all": value["count_all"], "fail": value["count_fail"]},
+            }
+        )
 
-    # remove all with 100% success rate, because they are not interesting
-    _remove_all_excellent_executions(data)
-
-    data = list(data.values())
-    data.sort(key=_sort_by_failing_rate, reverse=True)
-
-    if len(data) > 30:
-        data = data[:30]
-
-    return data
+    return result
 
 
 @rpc_method(
@@ -249,26 +386,3 @@ def individual_test_case_health_simple(query=None):
     )
 
     return list(res)
-
-
-def _remove_all_excellent_executions(data):
-    for key in dict.fromkeys(data):
-        if data[key]["count"]["fail"] == 0:
-            data.pop(key)
-
-
-def _count_test_executions(data, test_executions, status):
-    for value in test_executions:
-        data[value["case_id"]]["count"][status] = value["count"]
-
-
-def _sort_by_failing_rate(element):
-    return element["count"]["fail"] / element["count"]["all"]
-
-
-def _get_count_for(test_executions):
-    return (
-        test_executions.values("case_id", "case__summary")
-        .annotate(count=Count("case_id"))
-        .order_by("case_id")
-    )
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+from django.utils.translation import gettext_lazy as _
+from parameterized import parameterized
+
+from tcms.rpc.tests.utils import APITestCase
+from tcms.telemetry.api import (
+    individual_test_case_health_simple,
+    status_matrix,
+    test_case_health,
+)
+from tcms.testruns.models import TestExecutionStatus
+from tcms.tests.factories import TestCaseFactory, TestRunFactory
+from tcms.xmlrpc_wrapper import XmlRPCFault
+
+
+class TestExecutionTrends(APITestCase):
+    @classmethod
+    def _fixture_setup(cls):
+        super()._fixture_setup()
+
+        cls.test_case = TestCaseFactory()
+        cls.test_case.save()  # we need 1 version in the history
+
+        cls.passed = TestExecutionStatus.objects.filter(weight__gt=0).first()
+        cls.failed = TestExecutionStatus.objects.filter(weight__lt=0).first()
+
+        cls.run_1 = TestRunFactory()
+        cls.run_2 = TestRunFactory(plan=cls.run_1.plan)
+        for test_run, statuses in [
+            (cls.run_1, [cls.passed, cls.passed, cls.failed]),
+            (cls.run_2, [cls.failed, None]),
+        ]:
+            executions = test_run.create_execution_batch(
+                [cls.test_case] * len(statuses)
+            )
+            for execution, status in zip(executions, statuses):
+                if status:
+                    execution.status = status
+                    execution.save()
+
+    def assert_trends(self, result):
+        self.assertEqual(result["categories"], [self.run_1.pk, self.run_2.pk])
+        self.assertEqual(result["data_set"][self.passed.name], [2, 0])
+        self.assertEqual(result["data_set"][self.failed.name], [1, 1])
+        self.assertEqual(result["data_set"][str(_("TOTAL"))], [3, 2])
+        self.assertEqual(
+            result["status_count"], {"positive": 2, "negative": 2, "neutral": 1}
+        )
+
+    def test_execution_trends_from_status_counters(self):
+        result = self.rpc_client.Testing.execution_trends(
+            {"run__plan": self.run_1.plan.pk}
+        )
+        self.assert_trends(result)
+
+    def test_execution_trends_from_executions(self):
+        result = self.rpc_client.Testing.execution_trends(
+            {"run__plan": self.run_1.plan.pk, "stop_date__isnull": True}
+        )
+        self.assert_trends(result)
+
+    def test_execution_trends_without_matching_executions(self):
+        result = self.rpc_client.Testing.execution_trends({"run": -1})
+
+        self.assertEqual(result["categories"], [])
+        self.assertEqual(result["data_set"][str(_("TOTAL"))], [])
+
+
+class TestCaseHealth(APITestCase):
+    @classmethod
+    def _fixture_setup(cls):
+        super()._fixture_setup()
+
+        cls.passed = TestExecutionStatus.objects.filter(weight__gt=0).first()
+        cls.failed = TestExecutionStatus.objects.filter(weight__lt=0).first()
+
+        cls.test_run = TestRunFactory()
+        cls.cases = []
+        for statuses in [
+            [cls.passed, cls.passed],
+            [cls.failed, cls.passed, cls.passed],
+            [cls.failed, cls.failed],
+            [cls.failed],
+        ]:
+            test_case = TestCaseFactory()
+            test_case.save()  # we need 1 version in the history
+            cls.cases.append(test_case)
+
+            executions = cls.test_run.create_execution_batch(
+                [test_case] * len(statuses)
+            )
+            for execution, status in zip(executions, statuses):
+                execution.status = status
+                execution.save()
+
+    def test_ordered_by_failing_rate(self):
+        result = self.rpc_client.Testing.test_case_health({"run": self.test_run.pk})
+
+        self.assertEqual(len(result), 3)
+        for value, (test_case, count) in zip(
+            result,
+            [
+                (self.cases[2], {"all": 2, "fail": 2}),
+                (self.cases[3], {"all": 1, "fail": 1}),
+                (self.cases[1], {"all": 3, "fail": 1}),
+            ],
+        ):
+            self.assertEqual(value["case_id"], test_case.pk)
+            self.assertEqual(value["count"], count)
+        self.assertEqual(result[0]["case_summary"], self.cases[2].summary)
+
+    def test_with_limit_and_min_executions(self):
+        result = self.rpc_client.Testing.test_case_health(
+            {"run": self.test_run.pk}, 1, 2
+        )
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["case_id"], self.cases[2].pk)
+
+    def test_results_are_lists(self):
+        query = {"run": self.test_run.pk}
+
+        self.assertIsInstance(test_case_health(query), list)
+        self.assertIsInstance(individual_test_case_health_simple(query), list)
+
+    @parameterized.expand(
+        [
+            ("zero_limit", 0, 1, "limit"),
+            ("negative_limit", -5, 1, "limit"),
+            ("zero_min_executions", 30, 0, "min_executions"),
+            ("string_min_executions", 30, "2", "min_executions"),
+        ]
+    )
+    def test_rejects_invalid_values(self, _name, limit, min_executions, param):
+        with self.assertRaisesRegex(XmlRPCFault, f"{param} must be a positive integer"):
+            self.rpc_client.Testing.test_case_health(
+                {"run": self.test_run.pk}, limit, min_executions
+            )
+
+
+class TestStatusMatrix(APITestCase):
+    @classmethod
+    def _fixture_setup(cls):
+        super()._fixture_setup()
+
+        cls.passed = TestExecutionStatus.objects.filter(weight__gt=0).first()
+
+        cls.case_1 = TestCaseFactory()
+        cls.case_1.save()  # we need 1 version in the history
+        cls.case_2 = TestCaseFactory()
+        cls.case_2.save()
+
+        cls.run_1 = TestRunFactory()
+        cls.run_2 = TestRunFactory(plan=cls.run_1.plan)
+
+        cls.execution_1, cls.execution_2 = cls.run_1.create_execution_batch(
+            [cls.case_1, cls.case_2]
+        )
+        cls.execution_3 = cls.run_2.create_execution_batch([cls.case_2])[0]
+        cls.execution_3.status = cls.passed
+        cls.execution_3.save()
+
+        cls.query = {"run__plan": cls.run_1.plan.pk}
+
+    def test_dense(self):
+        result = self.rpc_client.Testing.status_matrix(self.query, "dense")
+
+        self.assertEqual(result["case_ids"], [self.case_1.pk, self.case_2.pk])
+        self.assertEqual(
+            result["case_summaries"], [self.case_1.summary, self.case_2.summary]
+        )
+        self.assertEqual(result["run_ids"], [self.run_1.pk, self.run_2.pk])
+        self.assertEqual(result["run_plans"], [self.run_1.plan.pk] * 2)
+        self.assertEqual(
+            result["statuses"],
+            [
+                [self.execution_1.status_id, 0],
+                [self.execution_2.status_id, self.passed.pk],
+            ],
+        )
+        self.assertEqual(
+            result["executions"],
+            [
+                [self.execution_1.pk, 0],
+                [self.execution_2.pk, self.execution_3.pk],
+            ],
+        )
+        self.assertEqual(result["statusColors"][str(self.passed.pk)], self.passed.color)
+        self.assertNotIn("next_run", result)
+
+    def test_sparse(self):
+        result = self.rpc_client.Testing.status_matrix(self.query, "sparse")
+
+        self.assertNotIn("statuses", result)
+        self.assertEqual(
+            result["executions"],
+            [
+                [0, 0, self.execution_1.status_id, self.execution_1.pk],
+                [1, 0, self.execution_2.status_id, self.execution_2.pk],
+                [1, 1, self.passed.pk, self.execution_3.pk],
+            ],
+        )
+
+    def test_windowing_by_run(self):
+        result = self.rpc_client.Testing.status_matrix(self.query, "dense", None, 1)
+
+        self.assertEqual(result["run_ids"], [self.run_1.pk])
+        self.assertEqual(result["next_run"], self.run_1.pk)
+
+        result = self.rpc_client.Testing.status_matrix(
+            self.query, "dense", result["next_run"], 1
+        )
+
+        self.assertEqual(result["case_ids"], [self.case_2.pk])
+        self.assertEqual(result["run_ids"], [self.run_2.pk])
+        self.assertEqual(result["executions"], [[self.execution_3.pk]])
+        # this is the last page
+        self.assertNotIn("next_run", result)
+
+    def test_exact_fit_has_no_next_run(self):
+        result = self.rpc_client.Testing.status_matrix(self.query, "dense", None, 2)
+
+        self.assertEqual(result["run_ids"], [self.run_1.pk, self.run_2.pk])
+        self.assertNotIn("next_run", result)
+
+    @parameterized.expand(
+        [
+            ("zero", 0),
+            ("negative", -1),
+            ("string", "1"),
+        ]
+    )
+    def test_rejects_invalid_run_limit(self, _name, run_limit):
+        with self.assertRaisesRegex(XmlRPCFault, "limit must be a positive integer"):
+            self.rpc_client.Testing.status_matrix(self.query, "dense", None, run_limit)
+
+    def test_default_format(self):
+        result = status_matrix(self.query, run_limit=1)
+
+        self.assertEqual(list(result["runs"].keys()), [self.run_1.pk])
+        self.assertEqual(
+            result["executions"][f"{self.case_1.pk}-{self.run_1.pk}"]["pk"],
+            self.execution_1.pk,
+        )
+        self.assertEqual(result["next_run"], self.run_1.pk)
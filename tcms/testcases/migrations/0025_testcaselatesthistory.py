@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:09
+# pylint: disable=invalid-name, unused-argument
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_latest_history(apps, schema_editor):
+    TestCase = apps.get_model("testcases", "TestCase")
+    HistoricalTestCase = apps.get_model("testcases", "HistoricalTestCase")
+    TestCaseLatestHistory = apps.get_model("testcases", "TestCaseLatestHistory")
+
+    latest = (
+        HistoricalTestCase.objects.filter(id__in=TestCase.objects.values("pk"))
+        .order_by()
+        .values_list("id")
+        .annotate(latest=models.Max("history_id"))
+    )
+
+    TestCaseLatestHistory.objects.bulk_create(
+        (
+            TestCaseLatestHistory(case_id=case_id, history_id=history_id)
+            for case_id, history_id in latest.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("testcases", "0024_alter_testcase_extra_link"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TestCaseLatestHistory",
+            fields=[
+                (
+                    "case",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="latest_history",
+                        serialize=False,
+                        to="testcases.testcase",
+                    ),
+                ),
+                (
+                    "history",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_for",
+                        to="testcases.historicaltestcase",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(populate_latest_history, migrations.RunPython.noop),
+    ]
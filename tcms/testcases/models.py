@@ -49,7 +49,7 @@ class Category(models.Model, UrlMixin):
 
 
 class TestCase(models.Model, UrlMixin):
-    history = KiwiHistoricalRecords()
+    history = KiwiHistoricalRecords(latest_model="testcases.TestCaseLatestHistory")
 
     create_date = models.DateTimeField(auto_now_add=True)
     is_automated = models.BooleanField(default=False)
@@ -377,6 +377,25 @@ class TestCaseEmailSettings(models.Model):
         self.save()
 
 
+class TestCaseLatestHistory(models.Model):
+    """
+    Pointer to the latest historical record for each test case,
+    maintained by :class:`tcms.core.history.KiwiHistoricalRecords`.
+    """
+
+    case = models.OneToOneField(
+        TestCase,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="latest_history",
+    )
+    history = models.ForeignKey(
+        "testcases.HistoricalTestCase",
+        on_delete=models.CASCADE,
+        related_name="latest_for",
+    )
+
+
 class Template(models.Model):
     history = KiwiHistoricalRecords()
 
@@ -4,8 +4,10 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.template.loader import render_to_string
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext_lazy as _
 from mock import patch
 from parameterized import parameterized
@@ -13,6 +15,7 @@ from parameterized import parameterized
 from tcms.core.history import history_email_for
 from tcms.core.utils.mailto import mailto
 from tcms.testcases.helpers.email import get_case_notification_recipients
+from tcms.testcases.models import TestCaseLatestHistory as LatestHistory
 from tcms.tests import BasePlanCase, deny_certain_email_addresses
 from tcms.tests.factories import (
     ComponentFactory,
@@ -33,6 +36,43 @@ class SupportsCyrillic(TestCase):
         self.assertTrue(case.summary.endswith("кирилица"))
 
 
+class TestCaseLatestHistory(TestCase):
+    def test_points_to_latest_historical_record(self):
+        case = TestCaseFactory(text="Given-When-Then")
+        # generate history record
+        case.save()
+        self.assertEqual(case.latest_history.history.text, "Given-When-Then")
+
+        case.text = "Updated text"
+        case.save()
+
+        case.refresh_from_db()
+        self.assertEqual(case.latest_history.history, case.history.latest())
+        self.assertEqual(case.latest_history.history.text, "Updated text")
+
+    def test_pointer_is_updated_without_reading_all_revisions(self):
+        case = TestCaseFactory()
+        case.save()
+
+        case.text = "Updated text"
+        with CaptureQueriesContext(connection) as context:
+            case.save()
+
+        for query in context.captured_queries:
+            self.assertNotIn("MAX(", query["sql"].upper())
+        self.assertEqual(
+            LatestHistory.objects.get(pk=case.pk).history, case.history.latest()
+        )
+
+    def test_pointer_is_deleted_together_with_test_case(self):
+        case = TestCaseFactory()
+        case.save()
+        case_id = case.pk
+
+        case.delete()
+        self.assertFalse(LatestHistory.objects.filter(pk=case_id).exists())
+
+
 class TestCaseRemoveComponent(BasePlanCase):
     """Test TestCase.remove_component"""
 
@@ -103,7 +143,7 @@ class TestSendMailOnCaseIsUpdated(BasePlanCase):
         cls.case.emailing.auto_to_case_author = True
         cls.case.emailing.save()
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_send_mail_to_case_author(self, send_mail):
         # note: includes \n and \r characters
         self.case.summary = "New summary\n for\r running test"
@@ -124,7 +164,6 @@ class TestSendMailOnCaseIsUpdated(BasePlanCase):
             expected_body,
             settings.DEFAULT_FROM_EMAIL,
             recipients,
-            fail_silently=False,
         )
 
 
@@ -139,7 +178,7 @@ class TestSendMailOnCaseIsDeleted(BasePlanCase):
         cls.case.emailing.auto_to_case_author = True
         cls.case.emailing.save()
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_send_mail_to_case_author(self, send_mail):
         expected_subject = _("DELETED: TestCase #%(pk)d - %(summary)s") % {
             "pk": self.case.pk,
@@ -158,7 +197,6 @@ class TestSendMailOnCaseIsDeleted(BasePlanCase):
             expected_body,
             settings.DEFAULT_FROM_EMAIL,
             recipients,
-            fail_silently=False,
         )
 
     @override_settings(
@@ -170,7 +208,7 @@ class TestSendMailOnCaseIsDeleted(BasePlanCase):
             "email/post_case_delete/email.txt", {"case": self.case}
         )
 
-        with patch("tcms.core.utils.mailto.send_mail") as send_mail:
+        with patch("tcms.core.utils.mailto.OutgoingEmail.enqueue") as send_mail:
             mailto(
                 template_name="email/post_case_delete/email.txt",
                 recipients=["invalid@yahoo.com", "tester@example.bg"],
@@ -185,7 +223,6 @@ class TestSendMailOnCaseIsDeleted(BasePlanCase):
                 expected_body,
                 settings.DEFAULT_FROM_EMAIL,
                 ["tester@example.bg"],
-                fail_silently=False,
             )
 
     @override_settings(
@@ -194,7 +231,7 @@ class TestSendMailOnCaseIsDeleted(BasePlanCase):
     def test_email_not_sent_when_recipient_list_is_empty(self):
         expected_subject = "Test recipient filtering"
 
-        with patch("tcms.core.utils.mailto.send_mail") as send_mail:
+        with patch("tcms.core.utils.mailto.OutgoingEmail.enqueue") as send_mail:
             mailto(
                 template_name="email/post_case_delete/email.txt",
                 recipients=["invalid@yahoo.com", "another-invalid@yahoo.co.in"],
@@ -153,7 +153,7 @@ class TestNewCase(BasePlanCase):
             html=False,
         )
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_create_test_case_successfully(self, send_mail):
         response = self.client.post(self.new_case_url, self.data)
 
@@ -185,7 +185,6 @@ Text:
             expected_body,
             settings.DEFAULT_FROM_EMAIL,
             recipients,
-            fail_silently=False,
         )
 
     def test_create_test_case_successfully_from_plan(self):
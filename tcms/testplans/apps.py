@@ -6,7 +6,12 @@ class AppConfig(DjangoAppConfig):
     name = "tcms.testplans"
 
     def ready(self):
-        from django.db.models.signals import post_save, pre_delete, pre_save
+        from django.db.models.signals import (
+            post_delete,
+            post_save,
+            pre_delete,
+            pre_save,
+        )
 
         from tcms import signals
 
@@ -15,3 +20,5 @@ class AppConfig(DjangoAppConfig):
         pre_save.connect(signals.pre_save_clean, TestPlan)
         post_save.connect(signals.handle_emails_post_plan_save, TestPlan)
         pre_delete.connect(signals.handle_attachments_pre_delete, sender=TestPlan)
+        post_save.connect(signals.handle_user_summary_post_plan_save, TestPlan)
+        post_delete.connect(signals.handle_user_summary_post_plan_delete, TestPlan)
@@ -84,8 +84,8 @@ class TestPlan(TreeNode, UrlMixin):
     def get_absolute_url(self):
         return self._get_absolute_url()
 
-    def get_full_url(self):
-        return super().get_full_url().rstrip("/")
+    def get_full_url(self, site=None):
+        return super().get_full_url(site).rstrip("/")
 
     def _get_email_conf(self):
         try:
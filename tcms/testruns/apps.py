@@ -6,7 +6,12 @@ class AppConfig(DjangoAppConfig):
     name = "tcms.testruns"
 
     def ready(self):
-        from django.db.models.signals import post_save, pre_delete, pre_save
+        from django.db.models.signals import (
+            post_delete,
+            post_save,
+            pre_delete,
+            pre_save,
+        )
 
         from tcms import signals
 
@@ -15,6 +20,22 @@ class AppConfig(DjangoAppConfig):
         post_save.connect(signals.handle_emails_post_run_save, sender=TestRun)
         pre_save.connect(signals.pre_save_clean, sender=TestRun)
         pre_delete.connect(signals.handle_attachments_pre_delete, TestRun)
+        post_save.connect(signals.handle_user_summary_post_run_save, sender=TestRun)
+        pre_delete.connect(signals.handle_user_summary_pre_run_delete, sender=TestRun)
+        pre_delete.connect(signals.handle_executions_pre_run_delete, sender=TestRun)
+        post_delete.connect(signals.handle_executions_post_run_delete, sender=TestRun)
 
         pre_delete.connect(signals.handle_attachments_pre_delete, TestExecution)
         pre_delete.connect(signals.handle_comments_pre_delete, TestExecution)
+        post_save.connect(
+            signals.handle_status_count_post_execution_save, sender=TestExecution
+        )
+        post_delete.connect(
+            signals.handle_status_count_post_execution_delete, sender=TestExecution
+        )
+        post_save.connect(
+            signals.handle_user_summary_post_execution_save, sender=TestExecution
+        )
+        post_delete.connect(
+            signals.handle_user_summary_post_execution_delete, sender=TestExecution
+        )
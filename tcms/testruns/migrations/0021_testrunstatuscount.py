@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:18
+
+# pylint: disable=invalid-name, unused-argument
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_status_counts(apps, schema_editor):
+    TestExecution = apps.get_model("testruns", "TestExecution")
+    TestRunStatusCount = apps.get_model("testruns", "TestRunStatusCount")
+
+    counts = (
+        TestExecution.objects.order_by()
+        .values_list("run", "build", "status")
+        .annotate(count=models.Count("pk"))
+    )
+
+    TestRunStatusCount.objects.bulk_create(
+        (
+            TestRunStatusCount(
+                run_id=run_id, build_id=build_id, status_id=status_id, count=count
+            )
+            for run_id, build_id, status_id, count in counts.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("management", "0013_remove_initial_qa_contact"),
+        ("testruns", "0020_testexecutiontag"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TestRunStatusCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="status_counts",
+                        to="testruns.testrun",
+                    ),
+                ),
+                (
+                    "build",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="management.build",
+                    ),
+                ),
+                (
+                    "status",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="testruns.testexecutionstatus",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("run", "build", "status")},
+            },
+        ),
+        migrations.RunPython(populate_status_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:38
+
+# pylint: disable=invalid-name, unused-argument
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_user_summaries(apps, schema_editor):
+    OpenTestRun = apps.get_model("testruns", "OpenTestRun")
+    TestExecution = apps.get_model("testruns", "TestExecution")
+    TestPlan = apps.get_model("testplans", "TestPlan")
+    TestRun = apps.get_model("testruns", "TestRun")
+    UserSummary = apps.get_model("testruns", "UserSummary")
+
+    participants = set()
+    open_runs = TestRun.objects.filter(stop_date__isnull=True)
+    for run_id, manager_id, default_tester_id in open_runs.values_list(
+        "pk", "manager", "default_tester"
+    ).iterator():
+        participants.add((manager_id, run_id))
+        if default_tester_id:
+            participants.add((default_tester_id, run_id))
+
+    participants.update(
+        TestExecution.objects.filter(run__in=open_runs, assignee__isnull=False)
+        .order_by()
+        .values_list("assignee", "run")
+        .distinct()
+        .iterator()
+    )
+
+    OpenTestRun.objects.bulk_create(
+        (
+            OpenTestRun(user_id=user_id, run_id=run_id)
+            for user_id, run_id in participants
+        ),
+        batch_size=1000,
+    )
+
+    summaries = {}
+    for user_id, _run_id in participants:
+        summary = summaries.setdefault(user_id, UserSummary(user_id=user_id))
+        summary.open_runs += 1
+
+    for author_id, is_active, count in (
+        TestPlan.objects.order_by()
+        .values_list("author", "is_active")
+        .annotate(count=models.Count("pk"))
+    ):
+        summary = summaries.setdefault(author_id, UserSummary(user_id=author_id))
+        summary.plans += count
+        if not is_active:
+            summary.disabled_plans += count
+
+    UserSummary.objects.bulk_create(summaries.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("testplans", "0011_alter_testplan_extra_link"),
+        ("testruns", "0022_pendingtrackercomment"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserSummary",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("plans", models.IntegerField(default=0)),
+                ("disabled_plans", models.IntegerField(default=0)),
+                ("open_runs", models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="OpenTestRun",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="testruns.testrun",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("user", "run")},
+            },
+        ),
+        migrations.RunPython(populate_user_summaries, migrations.RunPython.noop),
+    ]
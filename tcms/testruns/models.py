@@ -1,15 +1,20 @@
 # -*- coding: utf-8 -*-
 import itertools
-from collections import OrderedDict, namedtuple
+import time
+from collections import Counter, OrderedDict, namedtuple
+from datetime import timedelta
 
 import vinaigrette
 from allpairspy import AllPairs
 from colorfield.fields import ColorField
 from django.conf import settings
-from django.db import models
+from django.contrib.auth import get_user_model
+from django.db import connection, models, transaction
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import override
+from simple_history.utils import bulk_create_with_history
 
 from tcms.core.contrib.linkreference.models import LinkReference
 from tcms.core.history import KiwiHistoricalRecords
@@ -77,45 +82,34 @@ class TestRun(models.Model, UrlMixin):
     def get_notify_addrs(self):
         """
         Get the all related mails from the run
+
+        .. versionchanged:: 16.3
+
+            Recipients are resolved with a single query without loading
+            the executions of this run.
         """
-        send_to = []
-        if self.manager.is_active:
-            send_to.append(self.manager.email)
-        send_to.extend(self.cc.filter(is_active=True).values_list("email", flat=True))
-        if self.default_tester_id and self.default_tester.is_active:
-            send_to.append(self.default_tester.email)
-
-        for execution in self.executions.select_related("assignee").filter(
-            assignee__is_active=True
-        ):
-            if execution.assignee_id:
-                send_to.append(execution.assignee.email)
+        active_users = get_user_model().objects.filter(is_active=True).order_by()
+        send_to = set(
+            active_users.filter(pk__in=(self.manager_id, self.default_tester_id))
+            .values_list("email", flat=True)
+            .union(
+                active_users.filter(
+                    pk__in=TestRunCC.objects.filter(run=self).values("user")
+                ).values_list("email", flat=True),
+                active_users.filter(
+                    pk__in=TestExecution.objects.filter(run=self).values("assignee")
+                ).values_list("email", flat=True),
+            )
+        )
 
-        send_to = set(send_to)
         # don't email author of last change
         send_to.discard(
-            getattr(
-                self.history.latest().history_user,  # pylint: disable=no-member
-                "email",
-                "",
-            )
+            self.history.values_list(  # pylint: disable=no-member
+                "history_user__email", flat=True
+            ).latest()
         )
         return list(send_to)
 
-    def _create_single_execution(self, case, assignee, build, sortkey):
-        return self.executions.create(
-            case=case,
-            assignee=assignee,
-            tested_by=None,
-            # usually IDLE but users can customize statuses
-            status=TestExecutionStatus.objects.filter(weight=0).first(),
-            case_text_version=case.history.latest().history_id,
-            build=build or self.build,
-            sortkey=sortkey,
-            stop_date=None,
-            start_date=None,
-        )
-
     def create_execution(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         case,
@@ -124,46 +118,182 @@ class TestRun(models.Model, UrlMixin):
         sortkey=0,
         matrix_type="full",
     ):
-        # pylint: disable=import-outside-toplevel
-        from tcms.testcases.models import Property as TestCaseProperty
-
-        assignee = (
-            assignee
-            or (case.default_tester_id and case.default_tester)
-            or (self.default_tester_id and self.default_tester)
+        return self.create_execution_batch(
+            [case],
+            assignee=assignee,
+            build=build,
+            sortkeys={case.pk: sortkey},
+            matrix_type=matrix_type,
         )
 
-        executions = []
-        properties = self.property_set.union(TestCaseProperty.objects.filter(case=case))
+    def create_execution_batch(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        cases,
+        assignee=None,
+        build=None,
+        sortkeys=None,
+        matrix_type="full",
+    ):
+        """
+        Create executions for all of the specified test cases using a fixed
+        number of queries, regardless of how many cases there are. On databases
+        which can't return rows from bulk inserts executions are saved one by one.
+
+        :param cases: TestCase objects
+        :type cases: iterable
+        :param assignee: Defaults to ``case.default_tester`` or
+                         ``self.default_tester``
+        :type assignee: User
+        :param build: Defaults to ``self.build``
+        :type build: Build
+        :param sortkeys: dict of (case_id, sortkey). If not specified then sortkeys
+                         are taken from the parent TestPlan or calculated based on the
+                         position of each case inside *cases*
+        :type sortkeys: dict
+        :param matrix_type: how to combine properties, "full" or "pairwise"
+        :type matrix_type: str
+        :return: list of newly created TestExecution objects
+        """
+        cases = list(cases)
+        case_ids = []
+        for case in cases:
+            case_ids.append(case.pk)
 
-        if properties.count():
-            for prop_tuple in self.property_matrix(properties, matrix_type):
-                execution = self._create_single_execution(
-                    case, assignee, build, sortkey
-                )
-                executions.append(execution)
+        default_testers = {}
+        if assignee is None:
+            default_testers = self._default_testers_for(cases)
+
+        latest_versions = self._latest_versions_for(case_ids)
+
+        if sortkeys is None:
+            sortkeys = self._sortkeys_for(case_ids)
 
-                for prop in prop_tuple:
-                    TestExecutionProperty.objects.create(
-                        execution=execution, name=prop.name, value=prop.value
+        case_properties = self._properties_for(case_ids)
+
+        executions = []
+        execution_properties = []
+        # usually IDLE but users can customize statuses
+        status = TestExecutionStatus.objects.filter(weight=0).first()
+        for case in cases:
+            for prop_tuple in (
+                self.property_matrix(case_properties[case.pk], matrix_type)
+                if case_properties[case.pk]
+                else [()]
+            ):
+                executions.append(
+                    TestExecution(
+                        run=self,
+                        case=case,
+                        assignee=assignee
+                        or default_testers.get(case.default_tester_id)
+                        or (self.default_tester_id and self.default_tester),
+                        tested_by=None,
+                        status=status,
+                        case_text_version=latest_versions.get(case.pk),
+                        build=build or self.build,
+                        sortkey=sortkeys.get(case.pk),
+                        stop_date=None,
+                        start_date=None,
                     )
-        else:
-            executions.append(
-                self._create_single_execution(case, assignee, build, sortkey)
+                )
+                execution_properties.append(prop_tuple)
+
+        with transaction.atomic():
+            self._insert_executions(executions)
+            TestExecutionProperty.objects.bulk_create(  # pylint: disable=bulk-create-used
+                TestExecutionProperty(
+                    execution=execution, name=prop.name, value=prop.value
+                )
+                for execution, prop_tuple in zip(executions, execution_properties)
+                for prop in prop_tuple
             )
 
         return executions
 
+    def _insert_executions(self, executions):
+        if not connection.features.can_return_rows_from_bulk_insert:
+            # note: rows inserted in bulk can't be matched to their objects,
+            # e.g. on MySQL, so that properties may end up attached to the
+            # wrong executions. Counters are updated by signal handlers here
+            for execution in executions:
+                execution.save()
+            return
+
+        bulk_create_with_history(executions, TestExecution)
+        TestRunStatusCount.update_counts(
+            Counter(
+                (self.pk, execution.build_id, execution.status_id)
+                for execution in executions
+            )
+        )
+        OpenTestRun.sync([self.pk], {execution.assignee_id for execution in executions})
+
+    @staticmethod
+    def _default_testers_for(cases):
+        return get_user_model().objects.in_bulk(
+            {case.default_tester_id for case in cases if case.default_tester_id}
+        )
+
+    @staticmethod
+    def _latest_versions_for(case_ids):
+        # pylint: disable=import-outside-toplevel
+        from tcms.testcases.models import TestCase
+
+        return dict(
+            TestCase.history.filter(id__in=case_ids)  # pylint: disable=no-member
+            .values("id")
+            .annotate(latest=models.Max("history_id"))
+            .values_list("id", "latest")
+        )
+
+    def _sortkeys_for(self, case_ids):
+        """
+        Return sortkeys from the parent TestPlan, falling back to
+        the position of each case in the list!
+        """
+        # pylint: disable=import-outside-toplevel
+        from tcms.testcases.models import TestCasePlan
+
+        sortkeys = dict(
+            TestCasePlan.objects.filter(
+                plan=self.plan_id, case__in=case_ids
+            ).values_list("case_id", "sortkey")
+        )
+        for position, case_id in enumerate(case_ids, start=1):
+            sortkeys.setdefault(case_id, position * 10)
+
+        return sortkeys
+
+    def _properties_for(self, case_ids):
+        """
+        Return the properties of this TestRun combined with the properties
+        of each test case, keyed by case_id!
+        """
+        # pylint: disable=import-outside-toplevel
+        from tcms.testcases.models import Property as TestCaseProperty
+
+        run_properties = list(self.property_set.all())
+        result = {case_id: list(run_properties) for case_id in case_ids}
+        for prop in TestCaseProperty.objects.filter(case__in=case_ids):
+            result[prop.case_id].append(prop)
+
+        return result
+
     @staticmethod
     def property_matrix(properties, _type="full"):
         """
         Return a sequence of tuples representing the property matrix!
         """
+        if isinstance(properties, models.QuerySet):
+            properties = properties.order_by("name", "value")
+        else:
+            properties = sorted(properties, key=lambda prop: (prop.name, prop.value))
+
         property_groups = OrderedDict()
-        for prop in properties.order_by("name", "value"):
+        for prop in properties:
             if prop.name in property_groups:
                 # do not repeat non-distinct values
-                if prop not in property_groups[prop.name]:
+                if all(p.value != prop.value for p in property_groups[prop.name]):
                     property_groups[prop.name].append(prop)
             else:
                 property_groups[prop.name] = [prop]
@@ -197,6 +327,33 @@ class TestRun(models.Model, UrlMixin):
     def remove_cc(self, user):
         TestRunCC.objects.filter(run=self, user=user).delete()
 
+    def statistics(self):
+        """
+        Get the number of executions in each status. Reads the counters
+        maintained in :class:`TestRunStatusCount` instead of counting
+        all executions!
+
+        :return: status id, name, color, weight and the number of executions
+                 for every status which has at least one execution
+        :rtype: list(dict)
+        """
+        statistics = []
+        for row in (
+            self.status_counts.values(
+                "status",
+                "status__name",
+                "status__color",
+                "status__weight",
+            )
+            .annotate(executions=models.Sum("count"))
+            .filter(executions__gt=0)
+            .order_by("status")
+        ):
+            row["count"] = row.pop("executions")
+            statistics.append(row)
+
+        return statistics
+
     @override("en")
     def stats_executions_status(self):
         """
@@ -206,12 +363,27 @@ class TestRun(models.Model, UrlMixin):
                  total number of executions, complete percent, and failure percent.
         :rtype: namedtuple
         """
-        total_count = self.executions.count()
+        total_count = 0
+        complete_count = 0
+        failing_count = 0
+        for status in self.statistics():
+            total_count += status["count"]
+            if status["status__weight"] != 0:
+                complete_count += status["count"]
+            if status["status__weight"] < 0:
+                failing_count += status["count"]
+
+        return self.executions_subtotal(total_count, complete_count, failing_count)
+
+    @staticmethod
+    def executions_subtotal(total_count, complete_count, failing_count):
+        """
+        :return: complete, failure and success percentages for the specified
+                 number of executions
+        :rtype: namedtuple
+        """
         if total_count:
-            complete_count = self.executions.exclude(status__weight=0).count()
             complete_percent = complete_count * 100.0 / total_count
-
-            failing_count = self.executions.filter(status__weight__lt=0).count()
             failing_percent = failing_count * 100.0 / total_count
         else:
             complete_percent = 0.0
@@ -243,7 +415,9 @@ vinaigrette.register(TestExecutionStatus, ["name"])
 
 
 class TestExecution(models.Model, UrlMixin):
-    history = KiwiHistoricalRecords()
+    # status counters are updated from the previous version, see
+    # tcms.signals.handle_status_count_post_execution_save()
+    history = KiwiHistoricalRecords(lock_previous=True)
 
     assignee = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -280,6 +454,24 @@ class TestExecution(models.Model, UrlMixin):
     def __str__(self):
         return f"{self.pk}: {self.case_id}"
 
+    def save(
+        self,
+        *args,
+        force_insert=False,
+        force_update=False,
+        using=None,
+        update_fields=None,
+    ):
+        # the previous version is locked until the counters have been updated
+        with transaction.atomic(using=using):
+            super().save(
+                *args,
+                force_insert=force_insert,
+                force_update=force_update,
+                using=using,
+                update_fields=update_fields,
+            )
+
     def links(self):
         return LinkReference.objects.filter(execution=self.pk)
 
@@ -300,6 +492,367 @@ class TestExecution(models.Model, UrlMixin):
         return TestExecutionProperty.objects.filter(execution=self.pk)
 
 
+class TestRunStatusCount(models.Model):
+    """
+    Number of executions in each build and status for every test run.
+    Maintained when executions are created, deleted or their status changes
+    so that run summaries and telemetry do not need to count all executions!
+    """
+
+    run = models.ForeignKey(
+        TestRun, related_name="status_counts", on_delete=models.CASCADE
+    )
+    build = models.ForeignKey("management.Build", on_delete=models.CASCADE)
+    status = models.ForeignKey(TestExecutionStatus, on_delete=models.CASCADE)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("run", "build", "status")
+
+    @classmethod
+    def update_counts(cls, deltas):
+        """
+        :param deltas: mapping of (run_id, build_id, status_id) to the number of
+                       executions which were added (positive) or removed (negative)
+        :type deltas: dict
+        """
+        with transaction.atomic():
+            # note: always lock rows in the same order to avoid deadlocks
+            for (run_id, build_id, status_id), delta in sorted(deltas.items()):
+                if not delta:
+                    continue
+
+                counters = cls.objects.filter(
+                    run_id=run_id, build_id=build_id, status_id=status_id
+                )
+                # note: when a TestRun is deleted its counters may be deleted
+                # before its executions, nothing is left to decrement then
+                if (
+                    counters.update(  # pylint: disable=objects-update-used
+                        count=models.F("count") + delta
+                    )
+                    or delta < 0
+                ):
+                    continue
+
+                counter, created = cls.objects.get_or_create(
+                    run_id=run_id,
+                    build_id=build_id,
+                    status_id=status_id,
+                    defaults={"count": delta},
+                )
+                if not created:
+                    cls.objects.filter(  # pylint: disable=objects-update-used
+                        pk=counter.pk
+                    ).update(count=models.F("count") + delta)
+
+    @classmethod
+    def refresh(cls, runs=None):
+        """
+        Recalculate the counters from scratch by counting all executions.
+
+        :param runs: Only refresh counters for these test runs. Defaults to all
+        :type runs: iterable or QuerySet of TestRun objects or PKs
+        """
+        counters = cls.objects.all()
+        executions = TestExecution.objects.all()
+        if runs is not None:
+            counters = counters.filter(run__in=runs)
+            executions = executions.filter(run__in=runs)
+
+        with transaction.atomic():
+            counters.delete()
+            cls.objects.bulk_create(  # pylint: disable=bulk-create-used
+                (
+                    cls(
+                        run_id=run_id,
+                        build_id=build_id,
+                        status_id=status_id,
+                        count=count,
+                    )
+                    for run_id, build_id, status_id, count in executions.order_by()
+                    .values_list("run", "build", "status")
+                    .annotate(count=models.Count("pk"))
+                    .iterator()
+                ),
+                batch_size=1000,
+            )
+
+
+class PendingTrackerComment(models.Model):
+    """
+    Comment which links a TestExecution to an existing issue in an external
+    tracker. It is waiting to be posted by ``./manage.py post_tracker_comments``
+    so that RPC calls don't block on the network, see :meth:`deliver`!
+    """
+
+    bug_system = models.ForeignKey("testcases.BugSystem", on_delete=models.CASCADE)
+    issue_url = models.CharField(max_length=1024)
+    execution = models.ForeignKey(TestExecution, on_delete=models.CASCADE)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True)
+
+    @classmethod
+    def deliver(cls, last_posted):
+        """
+        Post all comments which are due, a single one for every issue.
+        Comments which fail are retried later with an exponential backoff.
+
+        :param last_posted: When was the last comment posted to each tracker,
+                            keyed by BugSystem PK. Used to limit the rate of
+                            requests and updated in place
+        :type last_posted: dict
+        :return: Number of issues which were commented, failed and postponed
+                 because of the rate limit
+        :rtype: tuple(int, int, int)
+        """
+        from tcms.rpc.api.utils import (  # pylint: disable=import-outside-toplevel
+            tracker_class,
+        )
+
+        issues = {}
+        for comment in (
+            cls.objects.filter(
+                next_attempt__lte=timezone.now(),
+                attempts__lt=settings.TRACKER_COMMENT_MAX_ATTEMPTS,
+            )
+            .select_related("bug_system", "execution__run", "execution__case")
+            .order_by("pk")
+        ):
+            issues.setdefault((comment.bug_system_id, comment.issue_url), []).append(
+                comment
+            )
+
+        delivered = failed = postponed = 0
+        for (bug_system_id, issue_url), comments in issues.items():
+            if (
+                bug_system_id in last_posted
+                and time.monotonic() - last_posted[bug_system_id]
+                < settings.TRACKER_COMMENT_INTERVAL
+            ):
+                postponed += 1
+                continue
+
+            executions = {}
+            pks = []
+            for comment in comments:
+                executions[comment.execution_id] = comment.execution
+                pks.append(comment.pk)
+
+            tracker = tracker_class(comments[0].bug_system.tracker_type)(
+                comments[0].bug_system, None
+            )
+            try:
+                tracker.add_testexecution_to_issue(executions.values(), issue_url)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                failed += 1
+                for comment in comments:
+                    comment.attempts += 1
+                    comment.next_attempt = timezone.now() + timedelta(
+                        seconds=settings.TRACKER_COMMENT_RETRY_DELAY
+                        * 2 ** (comment.attempts - 1)
+                    )
+                    comment.last_error = str(err)
+                    comment.save(
+                        update_fields=["attempts", "next_attempt", "last_error"]
+                    )
+            else:
+                delivered += 1
+                cls.objects.filter(pk__in=pks).delete()
+
+            last_posted[bug_system_id] = time.monotonic()
+
+        return delivered, failed, postponed
+
+
+class UserSummary(models.Model):
+    """
+    Number of test plans and not finished test runs for each user which
+    are shown on the dashboard. Maintained when plans, runs and execution
+    assignees change so that the dashboard doesn't need to count them!
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        related_name="summary",
+        on_delete=models.CASCADE,
+    )
+    plans = models.IntegerField(default=0)
+    disabled_plans = models.IntegerField(default=0)
+    open_runs = models.IntegerField(default=0)
+
+    @classmethod
+    def update_counts(cls, deltas):
+        """
+        :param deltas: mapping of (user_id, field name) to the number which
+                       is added (positive) or removed (negative)
+        :type deltas: dict
+        """
+        with transaction.atomic():
+            # note: always lock rows in the same order to avoid deadlocks
+            for (user_id, field), delta in sorted(
+                deltas.items(), key=lambda item: (item[0][0] or 0, item[0][1])
+            ):
+                if not delta or user_id is None:
+                    continue
+
+                # note: negative deltas for users without a summary are
+                # ignored, e.g. when plans are deleted together with users
+                if (
+                    cls.objects.filter(  # pylint: disable=objects-update-used
+                        pk=user_id
+                    ).update(**{field: models.F(field) + delta})
+                    or delta < 0
+                ):
+                    continue
+
+                summary, created = cls.objects.get_or_create(
+                    pk=user_id, defaults={field: delta}
+                )
+                if not created:
+                    cls.objects.filter(  # pylint: disable=objects-update-used
+                        pk=summary.pk
+                    ).update(**{field: models.F(field) + delta})
+
+    @classmethod
+    def refresh(cls, users=None):
+        """
+        Recalculate summaries and open test runs from scratch.
+
+        :param users: Only refresh summaries for these users. Defaults to all
+        :type users: iterable or QuerySet of User objects or PKs
+        """
+        from tcms.testplans.models import (  # pylint: disable=import-outside-toplevel
+            TestPlan,
+        )
+
+        summaries = cls.objects.all()
+        open_runs = OpenTestRun.objects.all()
+        plans = TestPlan.objects.all()
+        if users is not None:
+            users = {getattr(user, "pk", user) for user in users}
+            summaries = summaries.filter(user__in=users)
+            open_runs = open_runs.filter(user__in=users)
+            plans = plans.filter(author__in=users)
+
+        with transaction.atomic():
+            summaries.delete()
+            open_runs.delete()
+
+            OpenTestRun.sync(
+                TestRun.objects.filter(stop_date__isnull=True).values_list(
+                    "pk", flat=True
+                ),
+                users,
+            )
+
+            deltas = Counter()
+            for author_id, is_active, count in (
+                plans.order_by()
+                .values_list("author", "is_active")
+                .annotate(count=models.Count("pk"))
+            ):
+                deltas[(author_id, "plans")] += count
+                if not is_active:
+                    deltas[(author_id, "disabled_plans")] += count
+            cls.update_counts(deltas)
+
+
+class OpenTestRun(models.Model):
+    """
+    Not finished TestRun in which a user participates as manager, default
+    tester or assignee of executions. Used together with
+    :class:`UserSummary` to render the dashboard!
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    run = models.ForeignKey(TestRun, related_name="+", on_delete=models.CASCADE)
+
+    class Meta:
+        unique_together = ("user", "run")
+
+    @classmethod
+    def discard(cls, run_ids):
+        """
+        Remove all records for the specified test runs and update
+        :class:`UserSummary`. Used before test runs are deleted!
+
+        :param run_ids: PKs of TestRun objects
+        :type run_ids: iterable
+        """
+        with transaction.atomic():
+            records = cls.objects.filter(run__in=run_ids)
+            UserSummary.update_counts(
+                {
+                    (user_id, "open_runs"): -count
+                    for user_id, count in records.order_by()
+                    .values_list("user")
+                    .annotate(count=models.Count("pk"))
+                }
+            )
+            records.delete()
+
+    @classmethod
+    def sync(cls, run_ids, users=None, remove_only=False):
+        """
+        Add or remove records for the specified test runs so that they
+        match the current participants and update :class:`UserSummary`.
+
+        :param run_ids: PKs of TestRun objects which have been modified
+        :type run_ids: iterable
+        :param users: Only consider these users, e.g. the previous and
+                      the new assignee of an execution. Defaults to all
+        :type users: set of User PKs
+        :param remove_only: Don't add new records. Used when executions are
+                            deleted, which may happen while their TestRun is
+                            being deleted as well
+        :type remove_only: bool
+        """
+        deltas = Counter()
+        with transaction.atomic():
+            for run in (
+                TestRun.objects.filter(pk__in=run_ids)
+                .only("manager", "default_tester", "stop_date")
+                .order_by("pk")
+            ):
+                existing = cls.objects.filter(run=run)
+                assignees = TestExecution.objects.filter(
+                    run=run, assignee__isnull=False
+                )
+                if users is not None:
+                    existing = existing.filter(user__in=users)
+                    assignees = assignees.filter(assignee__in=users)
+
+                expected = set()
+                if run.stop_date is None:
+                    expected = set(
+                        assignees.order_by()
+                        .values_list("assignee", flat=True)
+                        .distinct()
+                    )
+                    for user_id in (run.manager_id, run.default_tester_id):
+                        if user_id and (users is None or user_id in users):
+                            expected.add(user_id)
+
+                existing = set(existing.values_list("user", flat=True))
+                added = set() if remove_only else expected - existing
+                removed = existing - expected
+
+                cls.objects.bulk_create(  # pylint: disable=bulk-create-used
+                    cls(user_id=user_id, run=run) for user_id in added
+                )
+                cls.objects.filter(run=run, user__in=removed).delete()
+
+                for user_id in added:
+                    deltas[(user_id, "open_runs")] += 1
+                for user_id in removed:
+                    deltas[(user_id, "open_runs")] -= 1
+
+            UserSummary.update_counts(deltas)
+
+
 class TestExecutionProperty(abstract.Property):
     execution = models.ForeignKey(TestExecution, on_delete=models.CASCADE)
 
@@ -24,17 +24,25 @@ const permissions = {
 }
 const autocompleteCache = {}
 
-function showLastBugForTe (testExecutionRow, bugUrl) {
+function showLastBugForTe (testExecutionRow, bugUrl, bugDetails) {
     const jsBugs = testExecutionRow.find('.js-bugs')
     jsBugs.removeClass('hidden')
 
     const lastBugAnchor = jsBugs.find('a')
     lastBugAnchor.attr('href', bugUrl)
 
-    jsonRPC('Bug.details', bugUrl, (details) => {
-        lastBugAnchor.text(`${details.id} - ${details.status}`)
-        lastBugAnchor.attr('title', details.title)
-    })
+    const showDetails = (details) => {
+        if (details.id !== undefined) {
+            lastBugAnchor.text(`${details.id} - ${details.status}`)
+            lastBugAnchor.attr('title', details.title)
+        }
+    }
+
+    if (bugDetails) {
+        showDetails(bugDetails)
+    } else {
+        jsonRPC('Bug.details', bugUrl, showDetails)
+    }
 }
 
 export function pageTestrunsGetReadyHandler () {
@@ -608,10 +616,18 @@ function renderAdditionalInformation (testRunId, execution) {
                 withDefects[link.execution] = link
             }
         })
-        for (const teId of Object.keys(withDefects)) {
-            const lastBug = withDefects[teId]
-            showLastBugForTe($(`.test-execution-${teId}`), lastBug.url)
+        const bugUrls = Object.values(withDefects).map(link => link.url)
+        if (!bugUrls.length) {
+            return
         }
+
+        // fetch details for all bugs with a single request
+        jsonRPC('Bug.details_many', [bugUrls], (details) => {
+            for (const teId of Object.keys(withDefects)) {
+                const lastBug = withDefects[teId]
+                showLastBugForTe($(`.test-execution-${teId}`), lastBug.url, details[lastBug.url])
+            }
+        })
     })
 
     // update properties display
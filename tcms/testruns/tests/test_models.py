@@ -2,16 +2,32 @@
 # pylint: disable=too-many-ancestors
 
 from django import test
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete
 from django.test import TestCase
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from mock import patch
+from mock import PropertyMock, patch
 from parameterized import parameterized
 
 from tcms.testcases.models import Property as TestCaseProperty
+from tcms.testruns.models import OpenTestRun
 from tcms.testruns.models import Property as TestRunProperty
+from tcms.testruns.models import (
+    TestExecution,
+    TestExecutionStatus,
+    TestRunStatusCount,
+    UserSummary,
+)
 from tcms.tests import BaseCaseRun
-from tcms.tests.factories import TestCaseFactory, TestExecutionFactory, TestRunFactory
+from tcms.tests.factories import (
+    TestCaseFactory,
+    TestExecutionFactory,
+    TestPlanFactory,
+    TestRunFactory,
+    UserFactory,
+)
 
 
 class Test_TestRun(BaseCaseRun):  # pylint: disable=invalid-name
@@ -25,7 +41,7 @@ class Test_TestRun(BaseCaseRun):  # pylint: disable=invalid-name
             default_tester=cls.tester,
         )
 
-    @patch("tcms.core.utils.mailto.send_mail")
+    @patch("tcms.core.utils.mailto.OutgoingEmail.enqueue")
     def test_send_mail_after_test_run_creation(self, send_mail):
         test_run = TestRunFactory(plan=self.plan)
 
@@ -67,6 +83,90 @@ class TestRunMethods(test.TestCase):
             self.assertEqual(execution.status.weight, 0)
             self.assertEqual(execution.status.name, _("IDLE"))
 
+    def test_create_execution_batch(self):
+        test_run = TestRunFactory()
+        case_with_sortkey = TestCaseFactory()
+        case_with_sortkey.save()  # we need 1 version in the history
+        test_run.plan.add_case(case_with_sortkey, sortkey=55)
+
+        case_with_properties = TestCaseFactory()
+        case_with_properties.save()
+        for value in ["Chrome", "Firefox"]:
+            TestCaseProperty.objects.create(
+                case=case_with_properties, name="Browser", value=value
+            )
+
+        executions = test_run.create_execution_batch(
+            [case_with_sortkey, case_with_properties]
+        )
+
+        self.assertEqual(len(executions), 3)
+        self.assertEqual(test_run.executions.count(), 3)
+
+        for execution in executions:
+            self.assertIsNotNone(execution.pk)
+            self.assertEqual(execution.status.weight, 0)
+            self.assertEqual(execution.build, test_run.build)
+            self.assertEqual(
+                execution.case_text_version,
+                execution.case.history.latest().history_id,
+            )
+            # history is recorded for bulk created objects as well
+            self.assertEqual(execution.history.count(), 1)
+
+        self.assertEqual(executions[0].case, case_with_sortkey)
+        self.assertEqual(executions[0].sortkey, 55)
+        self.assertEqual(executions[0].properties().count(), 0)
+
+        # position based sortkey b/c not part of the TestPlan
+        browsers = []
+        for execution in executions[1:]:
+            self.assertEqual(execution.case, case_with_properties)
+            self.assertEqual(execution.sortkey, 20)
+            browsers.extend(execution.properties().values_list("value", flat=True))
+        self.assertEqual(sorted(browsers), ["Chrome", "Firefox"])
+
+    @parameterized.expand(
+        [
+            ("bulk_insert_returns_rows", True),
+            ("bulk_insert_does_not_return_rows", False),
+        ]
+    )
+    def test_create_execution_batch_attaches_properties(self, _name, returns_rows):
+        test_run = TestRunFactory()
+        test_case = TestCaseFactory()
+        test_case.save()  # we need 1 version in the history
+        for value in ["Chrome", "Firefox"]:
+            TestCaseProperty.objects.create(case=test_case, name="Browser", value=value)
+
+        # the same test case is already part of this run
+        test_run.create_execution_batch([test_case])
+
+        with patch.object(
+            type(connection.features),
+            "can_return_rows_from_bulk_insert",
+            new_callable=PropertyMock,
+            return_value=returns_rows,
+        ):
+            executions = test_run.create_execution_batch([test_case])
+
+        self.assertEqual(test_run.executions.count(), 4)
+        browsers = []
+        for execution in executions:
+            self.assertEqual(execution.history.count(), 1)
+            self.assertEqual(execution.properties().count(), 1)
+            browsers.extend(execution.properties().values_list("value", flat=True))
+        self.assertEqual(sorted(browsers), ["Chrome", "Firefox"])
+
+        self.assertEqual(
+            list(
+                TestRunStatusCount.objects.filter(run=test_run).values_list(
+                    "status__weight", "count"
+                )
+            ),
+            [(0, 4)],
+        )
+
     def test_generate_full_matrix_with_2_dimensional_properties(self):
         test_run = TestRunFactory()
         test_case = TestCaseFactory()
@@ -159,6 +259,289 @@ class TestRunMethods(test.TestCase):
         self.assertEqual(len(matrix), 21)
 
 
+def _fail_to_delete(*_args, **_kwargs):
+    raise RuntimeError("Deleting failed")
+
+
+class TestRunStatusCounters(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_run = TestRunFactory()
+        cls.test_case = TestCaseFactory()
+        cls.test_case.save()  # we need 1 version in the history
+
+        cls.idle = TestExecutionStatus.objects.filter(weight=0).first()
+        cls.passed = TestExecutionStatus.objects.filter(weight__gt=0).first()
+        cls.failed = TestExecutionStatus.objects.filter(weight__lt=0).first()
+
+    def counts(self):
+        return {
+            status["status"]: status["count"] for status in self.test_run.statistics()
+        }
+
+    def test_counters_follow_execution_changes(self):
+        executions = self.test_run.create_execution_batch(
+            [self.test_case, self.test_case, self.test_case]
+        )
+        self.assertEqual(self.counts(), {self.idle.pk: 3})
+
+        executions[0].status = self.passed
+        executions[0].save()
+        executions[1].status = self.failed
+        executions[1].save()
+        self.assertEqual(
+            self.counts(), {self.idle.pk: 1, self.passed.pk: 1, self.failed.pk: 1}
+        )
+
+        executions[1].delete()
+        self.assertEqual(self.counts(), {self.idle.pk: 1, self.passed.pk: 1})
+
+        stats = self.test_run.stats_executions_status()
+        self.assertEqual(stats.CompletedPercentage, 50.0)
+        self.assertEqual(stats.FailurePercentage, 0.0)
+        self.assertEqual(stats.SuccessPercentage, 50.0)
+
+    def test_counters_follow_changes_made_from_stale_objects(self):
+        execution = self.test_run.create_execution_batch([self.test_case])[0]
+
+        # both have been loaded while the status was IDLE
+        first = TestExecution.objects.get(pk=execution.pk)
+        second = TestExecution.objects.get(pk=execution.pk)
+
+        first.status = self.passed
+        first.save()
+        second.status = self.failed
+        second.save()
+
+        self.assertEqual(self.counts(), {self.failed.pk: 1})
+
+    def test_previous_version_is_locked_while_saving(self):
+        execution = self.test_run.create_execution_batch([self.test_case])[0]
+
+        with patch.object(
+            QuerySet,
+            "select_for_update",
+            autospec=True,
+            side_effect=QuerySet.select_for_update,
+        ) as select_for_update:
+            execution.status = self.passed
+            execution.save()
+
+        select_for_update.assert_called_once()
+
+    def test_deleting_run_with_executions(self):
+        test_run = TestRunFactory()
+        test_run.create_execution_batch([self.test_case])
+
+        test_run.delete()
+        self.assertFalse(TestRunStatusCount.objects.filter(run=test_run.pk).exists())
+
+    def test_failed_run_delete_does_not_stop_counter_updates(self):
+        test_run = TestRunFactory()
+        executions = test_run.create_execution_batch([self.test_case, self.test_case])
+
+        post_delete.connect(_fail_to_delete, sender=TestExecution)
+        try:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                test_run.delete()
+        finally:
+            post_delete.disconnect(_fail_to_delete, sender=TestExecution)
+
+        TestExecution.objects.get(pk=executions[0].pk).delete()
+        self.assertEqual(
+            list(
+                TestRunStatusCount.objects.filter(run=test_run).values_list(
+                    "status", "count"
+                )
+            ),
+            [(self.idle.pk, 1)],
+        )
+
+    def test_deleting_plan_does_not_update_counters_for_every_execution(self):
+        test_run = TestRunFactory()
+        test_run.create_execution_batch([self.test_case, self.test_case])
+
+        with patch.object(
+            TestRunStatusCount, "update_counts"
+        ) as update_counts, patch.object(OpenTestRun, "sync") as sync:
+            test_run.plan.delete()
+
+        update_counts.assert_not_called()
+        sync.assert_not_called()
+        self.assertFalse(TestRunStatusCount.objects.filter(run=test_run.pk).exists())
+
+        # counters of the remaining test runs are still maintained
+        executions = self.test_run.create_execution_batch([self.test_case])
+        executions[0].delete()
+        self.assertEqual(self.counts(), {})
+
+
+class TestUserSummary(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other_user = UserFactory()
+        cls.test_case = TestCaseFactory()
+        cls.test_case.save()  # we need 1 version in the history
+
+    def summary(self, user=None):
+        summary = UserSummary.objects.filter(user=user or self.user).first()
+        if summary is None:
+            return (0, 0, 0)
+        return (summary.plans, summary.disabled_plans, summary.open_runs)
+
+    def open_runs(self, user=None):
+        return set(
+            OpenTestRun.objects.filter(user=user or self.user).values_list(
+                "run", flat=True
+            )
+        )
+
+    def test_summary_follows_test_plan_changes(self):
+        test_plan = TestPlanFactory(author=self.user)
+        self.assertEqual(self.summary(), (1, 0, 0))
+
+        test_plan.is_active = False
+        test_plan.save()
+        self.assertEqual(self.summary(), (1, 1, 0))
+
+        test_plan.author = self.other_user
+        test_plan.save()
+        self.assertEqual(self.summary(), (0, 0, 0))
+        self.assertEqual(self.summary(self.other_user), (1, 1, 0))
+
+        test_plan.delete()
+        self.assertEqual(self.summary(self.other_user), (0, 0, 0))
+
+    def test_summary_follows_test_run_changes(self):
+        test_run = TestRunFactory(manager=self.user, default_tester=self.user)
+        self.assertEqual(self.open_runs(), {test_run.pk})
+        self.assertEqual(self.summary()[2], 1)
+
+        test_run.default_tester = self.other_user
+        test_run.save()
+        self.assertEqual(self.open_runs(), {test_run.pk})
+        self.assertEqual(self.open_runs(self.other_user), {test_run.pk})
+
+        test_run.stop_date = timezone.now()
+        test_run.save()
+        self.assertEqual(self.open_runs(), set())
+        self.assertEqual(self.open_runs(self.other_user), set())
+        self.assertEqual(self.summary()[2], 0)
+        self.assertEqual(self.summary(self.other_user)[2], 0)
+
+    def test_summary_follows_execution_assignee(self):
+        test_run = TestRunFactory()
+        executions = test_run.create_execution_batch(
+            [self.test_case, self.test_case], assignee=self.user
+        )
+        self.assertEqual(self.open_runs(), {test_run.pk})
+        self.assertEqual(self.summary()[2], 1)
+
+        executions[0].assignee = self.other_user
+        executions[0].save()
+        self.assertEqual(self.open_runs(), {test_run.pk})
+        self.assertEqual(self.open_runs(self.other_user), {test_run.pk})
+
+        executions[1].delete()
+        self.assertEqual(self.open_runs(), set())
+        self.assertEqual(self.summary()[2], 0)
+        self.assertEqual(self.summary(self.other_user)[2], 1)
+
+    def test_deleting_run_with_executions(self):
+        test_run = TestRunFactory(manager=self.user)
+        test_run.create_execution_batch([self.test_case], assignee=self.other_user)
+
+        test_run.delete()
+        self.assertEqual(self.summary()[2], 0)
+        self.assertEqual(self.summary(self.other_user)[2], 0)
+        self.assertFalse(OpenTestRun.objects.filter(run=test_run.pk).exists())
+
+    def test_refresh_recalculates_summaries(self):
+        TestPlanFactory(author=self.user, is_active=False)
+        test_run = TestRunFactory(manager=self.user)
+        UserSummary.objects.filter(  # pylint: disable=objects-update-used
+            user=self.user
+        ).update(plans=42, open_runs=42)
+        OpenTestRun.objects.filter(user=self.user).delete()
+
+        UserSummary.refresh([self.user])
+        self.assertEqual(self.summary(), (1, 1, 1))
+        self.assertEqual(self.open_runs(), {test_run.pk})
+
+
+class TestRunNotifyAddrs(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = UserFactory()
+        cls.default_tester = UserFactory()
+        cls.cc = UserFactory()
+        cls.assignee = UserFactory()
+        cls.inactive = UserFactory(is_active=False)
+
+        cls.test_case = TestCaseFactory()
+        cls.test_case.save()  # we need 1 version in the history
+
+    def setUp(self):
+        super().setUp()
+
+        self.test_run = TestRunFactory(
+            manager=self.manager, default_tester=self.default_tester
+        )
+        self.test_run.add_cc(self.cc)
+        self.test_run.create_execution_batch(
+            [self.test_case, self.test_case], assignee=self.assignee
+        )
+        self.test_run.create_execution_batch([self.test_case], assignee=self.inactive)
+
+    def test_recipients_include_all_active_participants(self):
+        self.assertEqual(
+            sorted(self.test_run.get_notify_addrs()),
+            sorted(
+                [
+                    self.manager.email,
+                    self.default_tester.email,
+                    self.cc.email,
+                    self.assignee.email,
+                ]
+            ),
+        )
+
+    def test_recipients_are_resolved_without_loading_executions(self):
+        self.test_run.create_execution_batch(
+            [self.test_case] * 5, assignee=UserFactory()
+        )
+
+        # recipients and the author of the last change
+        with self.assertNumQueries(2):
+            self.test_run.get_notify_addrs()
+
+    def test_recipients_follow_assignee_changes(self):
+        new_assignee = UserFactory()
+        execution = self.test_run.executions.filter(assignee=self.assignee).first()
+        execution.assignee = new_assignee
+        execution.save()
+
+        self.assertIn(new_assignee.email, self.test_run.get_notify_addrs())
+
+    def test_recipients_follow_deactivated_users(self):
+        self.cc.is_active = False
+        self.cc.save()
+
+        self.assertNotIn(self.cc.email, self.test_run.get_notify_addrs())
+
+    def test_recipients_follow_cc_changes(self):
+        self.test_run.remove_cc(self.cc)
+        self.assertNotIn(self.cc.email, self.test_run.get_notify_addrs())
+
+    def test_author_of_last_change_is_not_notified(self):
+        self.test_run.summary = "Changed by the manager"
+        self.test_run._history_user = self.manager  # pylint: disable=protected-access
+        self.test_run.save()
+
+        self.assertNotIn(self.manager.email, self.test_run.get_notify_addrs())
+
+
 class TestExecutionActualDuration(TestCase):
     @parameterized.expand(
         [
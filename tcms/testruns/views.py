@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from django.contrib.auth.decorators import permission_required
-from django.core.exceptions import ObjectDoesNotExist
 from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
@@ -14,7 +13,7 @@ from guardian.decorators import permission_required as object_permission_require
 
 from tcms.core.contrib.linkreference.forms import LinkReferenceForm
 from tcms.core.forms import SimpleCommentForm
-from tcms.testcases.models import BugSystem, TestCase, TestCasePlan, TestCaseStatus
+from tcms.testcases.models import BugSystem, TestCase, TestCaseStatus
 from tcms.testplans.models import TestPlan
 from tcms.testruns.forms import NewRunForm, SearchRunForm
 from tcms.testruns.models import (
@@ -77,24 +76,11 @@ class NewTestRunView(View):
             ):
                 test_run.property_set.create(name=prop.name, value=prop.value)
 
-            loop = 1
-
-            for case in form.cleaned_data["case"]:
-                try:
-                    tcp = TestCasePlan.objects.get(
-                        plan=form.cleaned_data["plan"], case=case
-                    )
-                    sortkey = tcp.sortkey
-                except ObjectDoesNotExist:
-                    sortkey = loop * 10
-
-                test_run.create_execution(
-                    case=case,
-                    assignee=form.cleaned_data["default_tester"],
-                    sortkey=sortkey,
-                    matrix_type=form.cleaned_data["matrix_type"],
-                )
-                loop += 1
+            test_run.create_execution_batch(
+                form.cleaned_data["case"],
+                assignee=form.cleaned_data["default_tester"],
+                matrix_type=form.cleaned_data["matrix_type"],
+            )
 
             return HttpResponseRedirect(
                 reverse(
@@ -25,7 +25,10 @@ urlpatterns = [
     re_path(r"^captcha/", include(captcha_urls)),
     re_path(r"^xml-rpc/", xml_rpc_server.view),
     re_path(r"^json-rpc/$", json_rpc_server.view),
+    re_path(r"^async/xml-rpc/", xml_rpc_server.async_view),
+    re_path(r"^async/json-rpc/$", json_rpc_server.async_view),
     re_path(r"^init-db/$", core_views.InitDBView.as_view(), name="init-db"),
+    re_path(r"^healthz/$", core_views.HealthzView.as_view(), name="healthz"),
     re_path(
         r"^translation-mode/",
         core_views.TranslationMode.as_view(),
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Alexander Todorov <atodorov@otb.bg>
+#
+# Licensed under GNU Affero General Public License v3 or later (AGPLv3+)
+# https://www.gnu.org/licenses/agpl-3.0.html
+
+"""
+Micro-benchmark for the escaping of RPC results, see
+``tcms.rpc.handlers.KiwiTCMSHandlerMixin.escape()``. Payloads
+mimic the result of ``TestExecution.filter()``.
+
+Usage::
+
+    ./tests/performance/escape_benchmark.py [rows]
+"""
+
+import copy
+import html
+import os
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tcms.settings.test")
+
+import django  # noqa: E402 pylint: disable=wrong-import-position
+
+django.setup()
+
+# pylint: disable=wrong-import-position,unused-import
+from django.utils import timezone  # noqa: E402
+
+# registers the safe fields for TestExecution.filter
+from tcms.rpc.api import testexecution  # noqa: E402, F401
+from tcms.rpc.handlers import KiwiTCMSHandlerMixin, safe_fields  # noqa: E402
+
+ROUNDS = 5
+
+
+def recursive_escape(value):
+    """
+    The previous implementation, kept for comparison!
+    """
+    if isinstance(value, dict):
+        for key, val in value.items():
+            value[key] = recursive_escape(val)
+    elif isinstance(value, list):
+        for idx, item in enumerate(value):
+            value[idx] = recursive_escape(item)
+    elif isinstance(value, str):
+        return html.escape(value)
+    elif isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+def execution_rows(count):
+    now = timezone.now()
+    rows = []
+    for pk in range(1, count + 1):
+        rows.append(
+            {
+                "id": pk,
+                "assignee": pk % 10,
+                "assignee__username": f"tester-{pk % 10}",
+                "tested_by": None,
+                "tested_by__username": None,
+                "case_text_version": 3,
+                "start_date": now,
+                "stop_date": None,
+                "sortkey": pk * 10,
+                "run": 1,
+                "case": pk,
+                # every 10th summary needs escaping
+                "case__summary": (
+                    f"Verify <input> & output #{pk}"
+                    if pk % 10 == 0
+                    else f"Verify login form #{pk}"
+                ),
+                "build": 1,
+                "build__name": "unspecified",
+                "status": 1,
+                "status__name": "IDLE",
+                "status__icon": "fa fa-question-circle-o",
+                "status__color": "#72767b",
+                "expected_duration": timedelta(minutes=5),
+                "actual_duration": None,
+            }
+        )
+    return rows
+
+
+def measure(name, function, payload):
+    timings = []
+    for _ in range(ROUNDS):
+        data = copy.deepcopy(payload)
+        started_at = time.perf_counter()
+        function(data)
+        timings.append(time.perf_counter() - started_at)
+
+    print(f"{name:>24}: best {min(timings) * 1000:8.1f} ms out of {ROUNDS} rounds")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    payload = execution_rows(count)
+    safe = safe_fields["TestExecution.filter"]
+
+    print(f"TestExecution.filter payload with {count} rows")
+    measure("recursive", recursive_escape, payload)
+    measure("iterative", KiwiTCMSHandlerMixin.escape, payload)
+    measure(
+        "iterative + safe fields",
+        lambda data: KiwiTCMSHandlerMixin.escape(data, safe),
+        payload,
+    )
+
+
+if __name__ == "__main__":
+    main()
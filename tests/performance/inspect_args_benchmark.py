@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# Copyright (c) 2026 Alexander Todorov <atodorov@otb.bg>
+#
+# Licensed under GNU Affero General Public License v3 or later (AGPLv3+)
+# https://www.gnu.org/licenses/agpl-3.0.html
+
+"""
+Micro-benchmarks for the inspection of RPC arguments, see
+``tcms.rpc.handlers.KiwiTCMSHandlerMixin.inspect_rpc_args()``.
+
+Usage::
+
+    ./tests/performance/inspect_args_benchmark.py
+"""
+
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tcms.settings.test")
+
+import django  # noqa: E402 pylint: disable=wrong-import-position
+
+django.setup()
+
+# pylint: disable=wrong-import-position
+from tcms.rpc.handlers import KiwiTCMSHandlerMixin  # noqa: E402
+
+ROUNDS = 5
+
+
+def find_based_inspection(rpc_request):
+    """
+    The previous implementation, kept for comparison!
+    It only inspects the top-level keys.
+    """
+    restricted_fields = (
+        "password",
+        "token",
+        "secret",
+        "activation_key",
+        "api_key",
+        "apikey",
+    )
+
+    keys_to_check = []
+    for arg in rpc_request.args:
+        if isinstance(arg, dict):
+            keys_to_check.extend(arg.keys())
+
+    kwargs = getattr(rpc_request, "kwargs", None)
+    if isinstance(kwargs, dict):
+        keys_to_check.extend(kwargs.keys())
+
+    for key in keys_to_check:
+        key_str = str(key).lower()
+        if any(key_str.find(field) > -1 for field in restricted_fields):
+            raise ValueError("Unsupported field")
+
+
+def small_query():
+    return SimpleNamespace(
+        method_name="TestExecution.filter",
+        args=[{"run": 1, "status__weight__lt": 0, "case__author__username": "x"}],
+        kwargs={},
+    )
+
+
+def large_query():
+    query = {}
+    for index in range(200):
+        query[f"case__tag__name__icontains_{index}"] = f"value {index}"
+    return SimpleNamespace(method_name="TestCase.filter", args=[query], kwargs={})
+
+
+def batch():
+    requests = []
+    for index in range(1000):
+        requests.append(
+            SimpleNamespace(
+                method_name="TestExecution.filter",
+                args=[
+                    {
+                        "run": index,
+                        "build__name": "nightly",
+                        "assignee__username__in": ["alice", "bob"],
+                        "case__category__product__name": "Kiwi TCMS",
+                    },
+                    None,
+                    None,
+                    ["id", "status"],
+                ],
+                kwargs={},
+            )
+        )
+    return requests
+
+
+def inspect_all(function, requests):
+    for request in requests:
+        function(request)
+
+
+def measure(name, function, requests):
+    timings = timeit.repeat(
+        lambda: inspect_all(function, requests),
+        number=10,
+        repeat=ROUNDS,
+    )
+    best = min(timings) / 10 / len(requests)
+    print(f"{name:>32}: best {best * 1000000:8.2f} us per request")
+
+
+def main():
+    for payload_name, requests in (
+        ("3 lookups", [small_query()]),
+        ("200 lookups", [large_query()]),
+        ("batch of 1000 requests", batch()),
+    ):
+        print(f"Payload with {payload_name}")
+        measure("str.find() on top-level keys", find_based_inspection, requests)
+        measure(
+            "regex on all nested keys", KiwiTCMSHandlerMixin.inspect_rpc_args, requests
+        )
+
+
+if __name__ == "__main__":
+    main()